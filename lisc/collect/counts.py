@@ -1,23 +1,33 @@
 """Collect counts data from EUtils."""
 
+import os
+import pickle
+from functools import partial
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from bs4 import BeautifulSoup
 
-from lisc.requester import Requester
+from lisc.requester import Requester, KeyPool
 from lisc.data.term import Term
 from lisc.data.meta_data import MetaData
 from lisc.collect.info import get_db_info
 from lisc.collect.utils import make_term, join
-from lisc.collect.process import get_info
+from lisc.collect.process import extract_count
+from lisc.collect.uids import get_all_uids, compute_overlaps
 from lisc.urls.eutils import EUtils, get_wait_time
+from lisc.utils.db import check_directory
+from lisc.utils.io import check_ext
 
 ###################################################################################################
 ###################################################################################################
 
 def collect_counts(terms_a, inclusions_a=None, exclusions_a=None, labels_a=None,
                    terms_b=None, inclusions_b=None, exclusions_b=None, labels_b=None,
-                   db='pubmed', field='TIAB', api_key=None, collect_coocs=True,
-                   logging=None, directory=None, verbose=False, **eutils_kwargs):
+                   db='pubmed', field='TIAB', api_key=None, collect_coocs=True, method='search',
+                   uid_store=None, split_dates=False, n_workers=1, checkpoint=None, resume=False,
+                   prior_data=None, cache=None, logging=None, directory=None, verbose=False,
+                   **eutils_kwargs):
     """Collect count and term co-occurrence data from EUtils.
 
     Parameters
@@ -43,11 +53,45 @@ def collect_counts(terms_a, inclusions_a=None, exclusions_a=None, labels_a=None,
     field : str, optional, default: 'TIAB'
         Field to search for term within.
         Defaults to 'TIAB', which is Title/Abstract.
-    api_key : str, optional
+    api_key : str or list of str, optional
         An API key for a NCBI account.
+        If a list, requests are spread across the keys, each with its own rate limit.
     collect_coocs : bool, optional, default: True
         Whether to collect co-occurence data.
         If False, only collects the counts for first term list.
+    method : {'search', 'uids'}, optional, default: 'search'
+        Which method to use to collect the data:
+
+        * 'search': requests the count of articles for each term, and each combination of terms.
+        * 'uids': requests the UIDs of all articles for each term, and computes co-occurrences
+          locally, from the overlap of the sets of UIDs.
+    uid_store : UIDStore, optional
+        Store of sets of UIDs, only used if `method` is 'uids'.
+        UIDs of terms in the store are loaded from it, rather than being requested,
+        and the UIDs of any terms not already in the store are added to it.
+    split_dates : bool, optional, default: False
+        Whether to split the search for each term into date windows, such that all UIDs can
+        be collected for terms with more articles than can be collected for a single query.
+        Only used if `method` is 'uids'. Any `mindate` & `maxdate` settings set the range.
+    n_workers : int, optional, default: 1
+        Number of workers to use to launch requests concurrently.
+        Requests from all workers share the rate limit of the requester.
+    checkpoint : int, optional
+        If provided, a checkpoint of the collected data is saved every `checkpoint` requests,
+        and if the collection fails, to the 'counts' folder of `directory`.
+        Only used if `method` is 'search'.
+    resume : bool, optional, default: False
+        Whether to resume from a saved checkpoint, if available, skipping collected values.
+        Only used if `method` is 'search'.
+    prior_data : tuple of (2d array, 1d array or list of 1d array) or 1d array, optional
+        Previously collected data, in the same format as the outputs of this function,
+        as (co_occurences, counts), or as counts if not collecting co-occurrences.
+        Values set to -1 are collected, and all other values are kept as they are.
+        Only used if `method` is 'search'.
+    cache : CountsCache, optional
+        Cache of collected counts. If provided, counts for queries that are in the cache,
+        for the current database build, are taken from the cache rather than requested,
+        and newly collected counts are added to the cache. Only used if `method` is 'search'.
     logging : {None, 'print', 'store', 'file'}, optional
         What kind of logging, if any, to do for requested URLs.
     directory : str or SCDB, optional
@@ -74,6 +118,20 @@ def collect_counts(terms_a, inclusions_a=None, exclusions_a=None, labels_a=None,
     The HTML page returned by the EUtils search includes a 'count' field.
     This field contains the number of articles with both terms. This is extracted.
 
+    With the 'uids' method, the number of requests scales with the number of terms,
+    rather than with the number of combinations of terms. Counts are taken from the total
+    reported by each search. Note that EUtils can only return up to 10,000 UIDs per search
+    term, such that for terms with more articles than this, unless all UIDs are collected
+    with `split_dates`, co-occurrences are collected with the 'search' method.
+
+    If checkpointing, the checkpoint file is removed once the collection completes.
+    When resuming, the terms must match those of the checkpoint, and values that were
+    already collected, which are those not set to -1, are not requested again.
+
+    If `n_workers` is greater than 1, requests are launched from a pool of threads,
+    such that the latency of requests overlaps. Results are filled in by term index,
+    such that the outputs do not depend on the order in which requests complete.
+
     Examples
     --------
     Collect counts and co-occurrences for a single set of two search terms:
@@ -84,13 +142,45 @@ def collect_counts(terms_a, inclusions_a=None, exclusions_a=None, labels_a=None,
 
     >>> coocs, counts, meta_data = collect_counts(terms_a=[['frontal lobe'], ['temporal lobe']],
     ...                                           terms_b=[['attention'], ['perception']])
+
+    Collect counts and co-occurrences, computing co-occurrences from sets of article UIDs:
+
+    >>> coocs, counts, meta_data = collect_counts([['frontal lobe'], ['temporal lobe']],
+    ...                                           method='uids')
+
+    Collect counts and co-occurrences, saving a checkpoint every 100 requests,
+    and resuming from a previous checkpoint, if one is available:
+
+    >>> coocs, counts, meta_data = collect_counts([['frontal lobe'], ['temporal lobe']],
+    ...                                           checkpoint=100, resume=True)
+
+    Collect counts and co-occurrences, launching requests from four concurrent workers:
+
+    >>> coocs, counts, meta_data = collect_counts([['frontal lobe'], ['temporal lobe']],
+    ...                                           n_workers=4)
     """
 
-    # Get e-utils URLS object. Set retmax as 0, since not using UIDs for counts
-    urls = EUtils(db=db, retmax='0', field=field, retmode='xml', **eutils_kwargs, api_key=api_key)
+    if method not in ['search', 'uids']:
+        raise ValueError('Collection method not understood.')
+
+    # Get e-utils URLS object. Set retmax as 0 if searching, since not using UIDs for counts
+    #   If collecting UIDs, retmax is not set, as it is set per request, to page through UIDs
+    retmax = '0' if method == 'search' else None
+
+    # If splitting into date windows, the date range is set per request, per window
+    split_dates = split_dates and method == 'uids'
+    if split_dates:
+        date_range = {key : eutils_kwargs.pop(key, None) for key in ['mindate', 'maxdate']}
+        eutils_kwargs.setdefault('datetype', 'pdat')
+
+    # If given a list of API keys, URLs are built with the first key, which is rotated per request
+    key_pool = KeyPool(api_key) if isinstance(api_key, list) else None
+
+    urls = EUtils(db=db, retmax=retmax, field=field, retmode='xml',
+                  **eutils_kwargs, api_key=key_pool.keys[0] if key_pool else api_key)
 
     # Define the settings for the search utility, adding a default for datetype if not provided
-    search_settings = ['db', 'retmax', 'retmode', 'field']
+    search_settings = ['db', 'retmode', 'field'] + (['retmax'] if retmax else [])
     if 'date' in ''.join(eutils_kwargs.keys()) and 'datetype' not in eutils_kwargs.keys():
         search_settings.append('datetype')
 
@@ -102,100 +192,578 @@ def collect_counts(terms_a, inclusions_a=None, exclusions_a=None, labels_a=None,
     meta_data = MetaData()
 
     # Check for a Requester object to be passed in as logging, otherwise initialize
+    #   A requester initialized here is closed on exit, including if the collection fails
     req = logging if isinstance(logging, Requester) else \
-        Requester(wait_time=get_wait_time(urls.authenticated),
-                  logging=logging, directory=directory)
+        Requester(wait_time=get_wait_time(urls.authenticated), logging=logging,
+                  directory=directory, pool_size=max(n_workers, 10), key_pool=key_pool)
+
+    try:
+
+        # Sort out terms for list a
+        n_terms_a = len(terms_a)
+        labels_a = labels_a if labels_a else [term[0] for term in terms_a]
+        inclusions_a = [[]] * n_terms_a if not inclusions_a else inclusions_a
+        exclusions_a = [[]] * n_terms_a if not exclusions_a else exclusions_a
+        term_args_a = [make_term(Term(*term)) for term in \
+            zip(labels_a, terms_a, inclusions_a, exclusions_a)]
+
+        # If collecting co-occurences, sort out terms for list b
+        square = collect_coocs and not terms_b
+        if collect_coocs and not square:
+            n_terms_b = len(terms_b)
+            labels_b = labels_b if labels_b else [term[0] for term in terms_b]
+            inclusions_b = [[]] * n_terms_b if not inclusions_b else inclusions_b
+            exclusions_b = [[]] * n_terms_b if not exclusions_b else exclusions_b
+            term_args_b = [make_term(Term(*term)) for term in \
+                zip(labels_b, terms_b, inclusions_b, exclusions_b)]
+        else:
+            term_args_b = term_args_a if square else None
+
+        # Initialize stores for the count & co-occurrence data, and plan the requests to collect
+        n_terms_b = len(term_args_b) if collect_coocs and not square else None
+        counts_a, counts_b, co_occurences = init_counts(n_terms_a, n_terms_b, collect_coocs)
+        if prior_data is not None and method == 'search':
+            counts_a, counts_b, co_occurences = \
+                _check_prior_data(prior_data, counts_a, counts_b, co_occurences)
+
+        # Collect the data & state to checkpoint, and if resuming, fill in from a prior checkpoint
+        checkpoint_data = {'term_args_a' : term_args_a, 'term_args_b' : term_args_b,
+                           'counts_a' : counts_a, 'counts_b' : counts_b,
+                           'co_occurences' : co_occurences, 'requester' : {}}
+        if resume and method == 'search':
+            checkpoint_data = _resume_checkpoint(checkpoint_data, req, directory)
+            counts_a, counts_b, co_occurences = [checkpoint_data[label] for label \
+                in ['counts_a', 'counts_b', 'co_occurences']]
+        save_checkpoint = partial(save_counts_checkpoint, checkpoint_data, req, directory)
+
+        plan = RequestPlan(counts_a, counts_b, co_occurences)
+
+        if verbose and method == 'search':
+            plan.check()
+
+        # Get current information about database being used, and tag any cache with the build
+        meta_data.add_db_info(get_db_info(req, urls.get_url('info')))
+        if cache is not None:
+            cache.set_build(meta_data.db_info['dbbuild'])
+
+        # Collect counts from searches of each term, and each combination of terms
+        if method == 'search':
+
+            try:
+
+                # Collect the counts for each term in list A, and if not square, in list B
+                #   These are each collected once, as their own phase, separate from co-occurrences
+                if verbose:
+                    print('Collecting term counts.')
+                _collect_store(req, urls, counts_a, plan.inds_a,
+                               [term_args_a[ind] for ind in plan.inds_a], n_workers,
+                               cache, checkpoint, save_checkpoint)
+                _collect_store(req, urls, counts_b, plan.inds_b,
+                               [term_args_b[ind] for ind in plan.inds_b], n_workers,
+                               cache, checkpoint, save_checkpoint)
+
+                # Collect the co-occurrences for each combination of terms
+                if collect_coocs:
+                    if verbose:
+                        print('Collecting co-occurrences.')
+                    _collect_store(req, urls, co_occurences, plan.inds_coocs,
+                                   [join(term_args_a[a_ind], term_args_b[b_ind], 'AND') \
+                                       for a_ind, b_ind in plan.inds_coocs], n_workers,
+                                   cache, checkpoint, save_checkpoint)
+
+            # If the collection fails, save a checkpoint of what was collected, before exiting
+            except BaseException:
+                if checkpoint:
+                    save_checkpoint()
+                raise
+
+            # Write any pending changes to the cache, whether or not the collection completed
+            finally:
+                if cache is not None:
+                    cache.flush()
+
+            if checkpoint or resume:
+                _remove_checkpoint(directory)
+
+            # If square, fill in the lower triangle from the collected upper triangle
+            if collect_coocs and square:
+                lower_inds = np.tril_indices(n_terms_a, -1)
+                co_occurences[lower_inds] = co_occurences.T[lower_inds]
+
+        # Collect the set of UIDs for each term, and compute counts & co-occurrences from them
+        elif method == 'uids':
+
+            if verbose:
+                print('Collecting UIDs.')
+            split_kwargs = dict(split_dates=True, **date_range) if split_dates else {}
+            uids_a, counts_a[:] = get_all_uids(req, urls, term_args_a, n_workers, uid_store,
+                                               meta_data.db_info, **split_kwargs)
+
+            if collect_coocs:
+
+                uids_b, counts_b_uids = None, counts_a
+                if not square:
+                    uids_b, counts_b[:] = get_all_uids(req, urls, term_args_b, n_workers,
+                                                       uid_store, meta_data.db_info,
+                                                       **split_kwargs)
+                    counts_b_uids = counts_b
+
+                if verbose:
+                    print('Computing co-occurrences.')
+                co_occurences[:] = compute_overlaps(uids_a, uids_b)
+
+                # Sets of UIDs that were truncated at the maximum number per query undercount
+                #   co-occurrences, so any co-occurrences with these terms are searched for
+                trunc_a = [count > len(uids) for count, uids in zip(counts_a, uids_a)]
+                trunc_b = trunc_a if square else \
+                    [count > len(uids) for count, uids in zip(counts_b_uids, uids_b)]
+                inds_trunc = [(a_ind, b_ind) for a_ind, b_ind in np.ndindex(co_occurences.shape) \
+                    if (trunc_a[a_ind] or trunc_b[b_ind]) and not (square and b_ind <= a_ind)]
+
+                if inds_trunc:
+                    if verbose:
+                        print('Collecting co-occurrences for terms with truncated UIDs.')
+                    date_settings = {label : date for label, date in date_range.items() \
+                        if date} if split_dates else None
+                    _collect_store(req, urls, co_occurences, inds_trunc,
+                                   [join(term_args_a[a_ind], term_args_b[b_ind], 'AND') \
+                                       for a_ind, b_ind in inds_trunc], n_workers,
+                                   settings=date_settings)
+                    if square:
+                        lower_inds = np.tril_indices(n_terms_a, -1)
+                        co_occurences[lower_inds] = co_occurences.T[lower_inds]
+
+        if collect_coocs:
+            counts = counts_a if square else [counts_a, counts_b]
+        else:
+            counts = counts_a
+
+        meta_data.add_requester(req)
+
+        if not collect_coocs:
+            return counts, meta_data
+        else:
+            return co_occurences, counts, meta_data
+
+    finally:
+        if req is not logging and req.is_active:
+            req.close()
+
+
+def init_counts(n_terms_a, n_terms_b=None, collect_coocs=True):
+    """Initialize the stores for counts & co-occurrence data, as arrays of missing values.
+
+    Parameters
+    ----------
+    n_terms_a : int
+        Number of terms in list A.
+    n_terms_b : int, optional
+        Number of terms in list B. If None, co-occurrences are collected in square mode.
+    collect_coocs : bool, optional, default: True
+        Whether co-occurrence data is to be collected.
+
+    Returns
+    -------
+    counts_a : 1d array
+        Store for the counts of terms in list A.
+    counts_b : 1d array or None
+        Store for the counts of terms in list B. None if not collecting for list B.
+    co_occurences : 2d array or None
+        Store for the co-occurrence data. None if not collecting co-occurrences.
+
+    Notes
+    -----
+    Values to be collected are initialized to -1. In square mode, the diagonal,
+    which reflects the co-occurrence of a term with itself, is set to 0.
+    """
 
-    # Sort out terms for list a
-    n_terms_a = len(terms_a)
     counts_a = np.ones([n_terms_a], dtype=int) * -1
-    labels_a = labels_a if labels_a else [term[0] for term in terms_a]
-    inclusions_a = [[]] * n_terms_a if not inclusions_a else inclusions_a
-    exclusions_a = [[]] * n_terms_a if not exclusions_a else exclusions_a
+    counts_b, co_occurences = None, None
 
-    # If collecting co-occurences, sort out terms for list b and initialize co-occurence stores
     if collect_coocs:
 
-        if not terms_b:
-            square = True
-            terms_b, inclusions_b, exclusions_b = terms_a, inclusions_a, exclusions_a
+        if n_terms_b is not None:
+            counts_b = np.ones([n_terms_b], dtype=int) * -1
+            co_occurences = np.ones([n_terms_a, n_terms_b], dtype=int) * -1
         else:
-            square = False
-        n_terms_b = len(terms_b)
+            co_occurences = np.ones([n_terms_a, n_terms_a], dtype=int) * -1
+            np.fill_diagonal(co_occurences, 0)
 
-        counts_b = np.ones([n_terms_b], dtype=int) * -1
-        labels_b = labels_b if labels_b else [term[0] for term in terms_b]
-        inclusions_b = [[]] * n_terms_b if not inclusions_b else inclusions_b
-        exclusions_b = [[]] * n_terms_b if not exclusions_b else exclusions_b
+    return counts_a, counts_b, co_occurences
 
-        # Initialize matrices to store co-occurrence data
-        co_occurences = np.ones([n_terms_a, n_terms_b], dtype=int) * -1
 
-        # Set diagonal to zero if square (term co-occurrence with itself)
-        if square:
-            np.fill_diagonal(co_occurences, 0)
+def plan_counts(terms_a, terms_b=None, collect_coocs=True):
+    """Plan the requests that a collection of counts data will launch.
 
-    # Get current information about database being used
-    meta_data.add_db_info(get_db_info(req, urls.get_url('info')))
+    Parameters
+    ----------
+    terms_a : list of list of str
+        Search terms.
+    terms_b : list of list of str, optional
+        Secondary list of search terms.
+    collect_coocs : bool, optional, default: True
+        Whether to collect co-occurence data.
 
-    # Loop through each term (list-A)
-    for a_ind, (label_a, search_a, incl_a, excl_a) in \
-        enumerate(zip(labels_a, terms_a, inclusions_a, exclusions_a)):
+    Returns
+    -------
+    RequestPlan
+        Plan of the requests to launch.
 
-        # Make term arguments
-        term_a = Term(label_a, search_a, incl_a, excl_a)
-        term_a_arg = make_term(term_a)
+    Examples
+    --------
+    Check how many requests will be launched to collect counts for two lists of terms:
 
-        if verbose:
-            print('Running counts for: ', term_a.label)
+    >>> plan = plan_counts([['frontal lobe'], ['temporal lobe']],
+    ...                    [['attention'], ['perception'], ['cognition']])
+    >>> plan.n_requests
+    12
+    """
 
-        # Get number of results for current term search
-        url = urls.get_url('search', settings={'term' : term_a_arg})
-        counts_a[a_ind] = get_count(req, url)
+    n_terms_b = len(terms_b) if collect_coocs and terms_b else None
 
-        if collect_coocs:
+    return RequestPlan(*init_counts(len(terms_a), n_terms_b, collect_coocs))
 
-            # For each term in list a, loop through each term in list b
-            for b_ind, (label_b, search_b, incl_b, excl_b) in \
-                enumerate(zip(labels_b, terms_b, inclusions_b, exclusions_b)):
 
-                # Skip collections of equivalent term combinations - if single term list
-                #  This will skip the diagonal row, and any combinations already collected
-                if square and co_occurences[a_ind, b_ind] != -1:
-                    continue
+class RequestPlan():
+    """Plan of the requests to launch to collect counts data.
 
-                # Make term arguments
-                term_b = Term(label_b, search_b, incl_b, excl_b)
-                term_b_arg = make_term(term_b)
-                full_term_arg = join(term_a_arg, term_b_arg, 'AND')
+    Attributes
+    ----------
+    inds_a : list of int
+        Indices of the terms in list A to collect counts for.
+    inds_b : list of int
+        Indices of the terms in list B to collect counts for.
+    inds_coocs : list of tuple of (int, int)
+        Indices of the combinations of terms to collect co-occurrences for.
 
-                # Get number of results for current term search
-                if not square:
-                    url = urls.get_url('search', settings={'term' : term_b_arg})
-                    counts_b[b_ind] = get_count(req, url)
+    Notes
+    -----
+    The plan is defined from the stores for the data, in which values that
+    are still to be collected are set to -1. In square mode, in which there is
+    no store for list B, only the upper triangle of co-occurrences is collected.
+    """
 
-                # Get number of results for combination of terms
-                url = urls.get_url('search', settings={'term' : full_term_arg})
-                count = get_count(req, url)
+    def __init__(self, counts_a, counts_b=None, co_occurences=None):
+        """Initialize a RequestPlan object.
 
-                co_occurences[a_ind, b_ind] = count
-                if square:
-                    co_occurences[b_ind, a_ind] = count
+        Parameters
+        ----------
+        counts_a : 1d array
+            Store for the counts of terms in list A.
+        counts_b : 1d array, optional
+            Store for the counts of terms in list B.
+        co_occurences : 2d array, optional
+            Store for the co-occurrence data.
+        """
 
-    if collect_coocs:
-        counts = counts_a if square else [counts_a, counts_b]
-    else:
-        counts = counts_a
+        self.inds_a = [int(ind) for ind in np.where(counts_a == -1)[0]]
+        self.inds_b = [int(ind) for ind in np.where(counts_b == -1)[0]] \
+            if counts_b is not None else []
+
+        self.inds_coocs = []
+        if co_occurences is not None:
+            for a_ind, b_ind in zip(*np.where(co_occurences == -1)):
+                if counts_b is not None or a_ind < b_ind:
+                    self.inds_coocs.append((int(a_ind), int(b_ind)))
+
+
+    def __repr__(self):
+        return str(self.__dict__)
+
+
+    @property
+    def n_counts(self):
+        """The number of requests to launch to collect term counts."""
+
+        return len(self.inds_a) + len(self.inds_b)
+
+
+    @property
+    def n_coocs(self):
+        """The number of requests to launch to collect co-occurrences."""
+
+        return len(self.inds_coocs)
+
+
+    @property
+    def n_requests(self):
+        """The total number of requests to launch, including the request for database info."""
+
+        return 1 + self.n_counts + self.n_coocs
+
+
+    def check(self):
+        """Print out the number of requests in the plan."""
+
+        print('Number of term count requests: \t', str(self.n_counts))
+        print('Number of co-occurence requests: \t', str(self.n_coocs))
+        print('Total number of requests: \t\t', str(self.n_requests))
+
+
+def _check_prior_data(prior_data, counts_a, counts_b, co_occurences):
+    """Check and unpack previously collected data, to use as the data stores of a collection.
+
+    Parameters
+    ----------
+    prior_data : tuple of (2d array, 1d array or list of 1d array) or 1d array
+        Previously collected data, in the same format as the outputs of `collect_counts`.
+    counts_a, counts_b, co_occurences : 1d array, 1d array or None, 2d array or None
+        Initialized data stores for the collection, to check the prior data against.
+
+    Returns
+    -------
+    counts_a, counts_b, co_occurences : 1d array, 1d array or None, 2d array or None
+        Data stores for the collection, as copies of the prior data.
+    """
+
+    prior_coocs, prior_counts = prior_data if co_occurences is not None else (None, prior_data)
+    prior_a, prior_b = prior_counts if counts_b is not None else (prior_counts, None)
+
+    outputs = []
+    for store, prior in zip([counts_a, counts_b, co_occurences], [prior_a, prior_b, prior_coocs]):
+        if store is not None:
+            prior = np.array(prior, dtype=int)
+            if prior.shape != store.shape:
+                raise ValueError('Prior data does not match the requested terms.')
+        outputs.append(prior)
+
+    return outputs
+
+
+def save_counts_checkpoint(checkpoint_data, req, directory=None):
+    """Save a checkpoint of a counts data collection.
+
+    Parameters
+    ----------
+    checkpoint_data : dict
+        The terms, and the data stores for the collection, to save.
+    req : Requester
+        Object used to launch requests, for which the current state is saved.
+    directory : str or SCDB, optional
+        Folder or database object specifying the save location.
 
-    meta_data.add_requester(req)
+    Notes
+    -----
+    The checkpoint is written to a temporary file, which then replaces any
+    prior checkpoint, such that an interrupted save does not corrupt the checkpoint.
+    """
+
+    checkpoint_data['requester'] = {'n_requests' : req.n_requests,
+                                    'n_retries' : req.n_retries,
+                                    'n_hedges' : req.n_hedges,
+                                    'wait_time' : req.wait_time,
+                                    'start_time' : req.start_time}
+
+    file_path = _get_checkpoint_path(directory)
+    with open(file_path + '.tmp', 'wb') as checkpoint_file:
+        pickle.dump(checkpoint_data, checkpoint_file)
+    os.replace(file_path + '.tmp', file_path)
+
+
+def load_counts_checkpoint(directory=None):
+    """Load a checkpoint of a counts data collection.
+
+    Parameters
+    ----------
+    directory : str or SCDB, optional
+        Folder or database object specifying the location of the checkpoint.
+
+    Returns
+    -------
+    checkpoint_data : dict or None
+        The terms, data stores, and requester state of the checkpoint.
+        None if there is no available checkpoint.
+    """
+
+    file_path = _get_checkpoint_path(directory)
+    if not os.path.exists(file_path):
+        return None
+
+    with open(file_path, 'rb') as checkpoint_file:
+        checkpoint_data = pickle.load(checkpoint_file)
+
+    return checkpoint_data
+
+
+def _resume_checkpoint(checkpoint_data, req, directory=None):
+    """Resume a counts data collection from a saved checkpoint, if available.
+
+    Parameters
+    ----------
+    checkpoint_data : dict
+        The terms, and the initialized data stores, for the current collection.
+    req : Requester
+        Object used to launch requests, to update with the requester state of the checkpoint.
+    directory : str or SCDB, optional
+        Folder or database object specifying the location of the checkpoint.
+
+    Returns
+    -------
+    dict
+        The checkpoint data, loaded from the saved checkpoint, if available.
+    """
+
+    loaded = load_counts_checkpoint(directory)
+
+    if loaded:
+
+        if not (loaded['term_args_a'] == checkpoint_data['term_args_a'] and \
+                loaded['term_args_b'] == checkpoint_data['term_args_b']):
+            raise ValueError('Checkpoint terms do not match requested terms - can not resume.')
+
+        req.n_requests += loaded['requester']['n_requests']
+        req.n_retries += loaded['requester']['n_retries']
+        req.n_hedges += loaded['requester']['n_hedges']
+        checkpoint_data = loaded
+
+    return checkpoint_data
+
+
+def _remove_checkpoint(directory=None):
+    """Remove a saved checkpoint, if it exists.
+
+    Parameters
+    ----------
+    directory : str or SCDB, optional
+        Folder or database object specifying the location of the checkpoint.
+    """
+
+    file_path = _get_checkpoint_path(directory)
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+
+def _get_checkpoint_path(directory=None):
+    """Get the file path for a checkpoint of a counts data collection.
+
+    Parameters
+    ----------
+    directory : str or SCDB, optional
+        Folder or database object specifying the location of the checkpoint.
+
+    Returns
+    -------
+    str
+        File path for the checkpoint.
+    """
+
+    return os.path.join(check_directory(directory, 'counts'),
+                        check_ext('counts_checkpoint', '.p'))
+
+
+def get_counts(req, urls, n_workers=1, cache=None):
+    """Get the counts of how many articles are listed at each of a list of URLs.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    urls : list of str
+        URLs to request count data from.
+    n_workers : int, optional, default: 1
+        Number of workers to use to launch requests concurrently.
+    cache : CountsCache, optional
+        Cache of collected counts, to get counts from and add counts to.
+
+    Returns
+    -------
+    list of int
+        Count of the number of articles found, for each URL, in the same order as `urls`.
+    """
+
+    return list(iter_counts(req, urls, n_workers, cache))
+
+
+def iter_counts(req, urls, n_workers=1, cache=None):
+    """Iterate across the counts of how many articles are listed at each of a list of URLs.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    urls : list of str
+        URLs to request count data from.
+    n_workers : int, optional, default: 1
+        Number of workers to use to launch requests concurrently.
+    cache : CountsCache, optional
+        Cache of collected counts, to get counts from and add counts to.
+
+    Yields
+    ------
+    int
+        Count of the number of articles found, for each URL, in the same order as `urls`.
+
+    Notes
+    -----
+    If using workers, up to twice as many requests as workers are submitted at a time,
+    with more submitted as counts are consumed. If iteration stops early, such as if a
+    request fails, any requests that have not yet been launched by the workers are cancelled.
+    """
+
+    if n_workers > 1:
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+
+            in_flight = deque()
+            try:
+                for url in urls:
+                    in_flight.append(executor.submit(get_count, req, url, cache))
+                    if len(in_flight) >= 2 * n_workers:
+                        yield in_flight.popleft().result()
+
+                while in_flight:
+                    yield in_flight.popleft().result()
+
+            finally:
+                for future in in_flight:
+                    future.cancel()
 
-    if not collect_coocs:
-        return counts, meta_data
     else:
-        return co_occurences, counts, meta_data
+        for url in urls:
+            yield get_count(req, url, cache)
+
+
+def _collect_store(req, urls, store, inds, term_args, n_workers=1,
+                   cache=None, checkpoint=None, save_checkpoint=None, settings=None):
+    """Collect counts for a list of search term arguments, filling them into a store.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    urls : EUtils
+        URLs object, with the search utility built.
+    store : 1d or 2d array
+        Store to fill collected counts into.
+    inds : list of int or list of tuple of (int, int)
+        Index of where to put each count into the store.
+    term_args : list of str
+        Search term arguments to collect counts for.
+    n_workers : int, optional, default: 1
+        Number of workers to use to launch requests concurrently.
+    cache : CountsCache, optional
+        Cache of collected counts, to get counts from and add counts to.
+    checkpoint : int, optional
+        Number of collected counts after which to save a checkpoint.
+    save_checkpoint : callable, optional
+        Function to call to save a checkpoint.
+    settings : dict, optional
+        Additional settings for the searches, such as a date range.
+    """
+
+    search_urls = [urls.get_url('search', settings=dict(settings or {}, term=term_arg)) \
+        for term_arg in term_args]
+
+    for n_collected, (ind, count) in \
+        enumerate(zip(inds, iter_counts(req, search_urls, n_workers, cache)), 1):
 
+        store[ind] = count
 
-def get_count(req, url):
+        if checkpoint and n_collected % checkpoint == 0:
+            save_checkpoint()
+
+
+def get_count(req, url, cache=None):
     """Get the count of how many articles listed at the requested URL.
 
     Parameters
@@ -204,6 +772,9 @@ def get_count(req, url):
         Object to launch requests from.
     url : str
         URL to request count data from.
+    cache : CountsCache, optional
+        Cache of collected counts. If the URL is in the cache, the count is taken
+        from the cache, without launching a request. Otherwise, the count is added to it.
 
     Returns
     -------
@@ -211,14 +782,16 @@ def get_count(req, url):
         Count of the number of articles found.
     """
 
-    page = req.request_url(url)
-    page_soup = BeautifulSoup(page.content, 'lxml')
+    if cache is not None:
+        count = cache.get(url)
+        if count is not None:
+            return count
 
-    counts = get_info(page_soup, 'count', 'all')
+    page = req.request_url(url)
+    count = extract_count(page.content)
 
-    try:
-        count = int(counts[0].text)
-    except IndexError:
-        count = 0
+    if cache is not None:
+        cache.add(url, count)
 
     return count
+
@@ -0,0 +1,184 @@
+"""Functions to parse pages of articles collected from EUtils, with streaming XML parsing."""
+
+from io import BytesIO
+
+from lxml import etree
+
+from lisc.collect.process import process_medline_date
+
+###################################################################################################
+###################################################################################################
+
+# Precompiled paths to get the first, or all, tags with a given label from within an article
+FIRST_PATHS = {label : etree.XPath('(.//{})[1]'.format(label)) for label in \
+    ['ReferenceList', 'ArticleTitle', 'AuthorList', 'Title', 'ISOAbbreviation', 'PubDate',
+     'LastName', 'ForeName', 'Initials', 'Affiliation', 'Year', 'MedlineDate']}
+ALL_PATHS = {label : etree.XPath('.//{}'.format(label)) for label in \
+    ['ArticleId', 'Author', 'AbstractText', 'Keyword']}
+
+def parse_articles(content, arts):
+    """Parse a page of articles, adding information for each article to a data object.
+
+    Parameters
+    ----------
+    content : bytes
+        Content of a page of articles, as returned by EFetch.
+    arts : Articles
+        Object to add data to.
+
+    Returns
+    -------
+    arts : Articles
+        Object updated with data from each article on the page.
+
+    Notes
+    -----
+    This extracts the same information as `get_article_info`, but parses the page
+    incrementally, such that the full page is never held as a parsed tree.
+    """
+
+    for article in iter_articles(content):
+        arts = parse_article_info(arts, article)
+
+    return arts
+
+
+def iter_articles(content):
+    """Iterate across the articles in a page of articles.
+
+    Parameters
+    ----------
+    content : bytes
+        Content of a page of articles, as returned by EFetch.
+
+    Yields
+    ------
+    article : lxml.etree._Element
+        Element for each article on the page.
+
+    Notes
+    -----
+    Each article element is cleared once the next article is requested, and so
+    should be fully processed before continuing the iteration.
+
+    Examples
+    --------
+    Iterate across the articles on a page:
+
+    >>> page = b'<PubmedArticleSet><PubmedArticle/><PubmedArticle/></PubmedArticleSet>'
+    >>> [article.tag for article in iter_articles(page)]
+    ['PubmedArticle', 'PubmedArticle']
+    """
+
+    try:
+        for _, article in etree.iterparse(BytesIO(content), tag='PubmedArticle', recover=True):
+
+            yield article
+
+            # Free the processed article, and any preceding articles held by the root
+            article.clear()
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+
+    except etree.XMLSyntaxError:
+        return
+
+
+def parse_article_info(arts, article):
+    """Get information from an article element and add it to a data object.
+
+    Parameters
+    ----------
+    arts : Articles
+        Object to store information for the current article.
+    article : lxml.etree._Element
+        Element for the article.
+
+    Returns
+    -------
+    arts : Articles
+        Object updated with data from the current article.
+    """
+
+    # Remove reference list, if present
+    #   Otherwise, tags within this can interfere with collected data
+    refs = _find(article, 'ReferenceList')
+    if refs is not None:
+        refs.getparent().remove(refs)
+
+    ids = ALL_PATHS['ArticleId'](article)
+
+    arts.add_data('ids', _parse_ids(ids, 'pubmed'))
+    arts.add_data('titles', _find_text(article, 'ArticleTitle'))
+    arts.add_data('authors', _parse_authors(_find(article, 'AuthorList')))
+    arts.add_data('journals', (_find_text(article, 'Title'),
+                               _find_text(article, 'ISOAbbreviation')))
+    arts.add_data('words', ' '.join([_text(part) for part in ALL_PATHS['AbstractText'](article)]))
+    arts.add_data('keywords', [_text(part) for part in ALL_PATHS['Keyword'](article)])
+    arts.add_data('years', _parse_pub_date(_find(article, 'PubDate')))
+    arts.add_data('dois', _parse_ids(ids, 'doi'))
+
+    return arts
+
+
+def _find(element, label):
+    """Find the first tag with a given label within an element, or None if not present."""
+
+    found = FIRST_PATHS[label](element)
+
+    return found[0] if found else None
+
+
+def _find_text(element, label):
+    """Get the text of the first tag with a given label within an element, or None."""
+
+    found = _find(element, label)
+
+    return _text(found) if found is not None else None
+
+
+def _text(element):
+    """Get all the text within an element, including the text of any nested tags."""
+
+    return ''.join(element.itertext())
+
+
+def _parse_authors(authors):
+    """Get author information, as (LastName, FirstName, Initials, Affiliation), from an AuthorList.
+    """
+
+    if authors is None:
+        return None
+
+    return [(_find_text(author, 'LastName'), _find_text(author, 'ForeName'),
+             _find_text(author, 'Initials'), _find_text(author, 'Affiliation'))
+            for author in ALL_PATHS['Author'](authors)]
+
+
+def _parse_pub_date(pub_date):
+    """Get the publication year from a PubDate element."""
+
+    if pub_date is None:
+        return None
+
+    year = _find_text(pub_date, 'Year')
+
+    if not year:
+        year = process_medline_date(_find_text(pub_date, 'MedlineDate') or '')
+
+    return int(year) if year else year
+
+
+def _parse_ids(ids, id_type):
+    """Get the IDs of a given type, as a str or list of str, or None, from ArticleId elements."""
+
+    lst = [cur_id.text for cur_id in ids if dict(cur_id.attrib) == {'IdType' : id_type}]
+
+    if not lst:
+        out = None
+    elif len(lst) == 1:
+        out = lst[0]
+    else:
+        out = lst
+
+    return out
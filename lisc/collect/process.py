@@ -1,10 +1,15 @@
 """Functions to process tags from collected data."""
 
+import re
+
 from lisc.core.decorators import catch_none
 
 ###################################################################################################
 ###################################################################################################
 
+# Pattern to match the count field of an ESearch result page
+COUNT_PATTERN = re.compile(rb'<count>\s*(\d+)\s*</count>', re.IGNORECASE)
+
 def get_info(tag, label, how):
     """Get information from a tag.
 
@@ -146,22 +151,48 @@ def process_pub_date(pub_date):
     if not year:
 
         # Check for and get date from medline date tag if available
-        year = get_info(pub_date, 'MedlineDate', 'str')
+        year = process_medline_date(get_info(pub_date, 'MedlineDate', 'str'))
 
-        # Sometimes date is year followed by months - so get first part
-        if year[:4].isnumeric():
-            year = year[:4]
+    # If a year was extracted, typecast to int
+    year = int(year) if year else year
 
-        # Sometimes date is season followed by year - so get last part
-        elif year[-4:].isnumeric():
-            year = year[-4:]
+    return year
 
-        # Otherwise, date info is not clear: drop so as to not cause an error
-        else:
-            year = None
 
-    # If a year was extracted, typecast to int
-    year = int(year) if year else year
+def process_medline_date(medline_date):
+    """Get the year from a medline date.
+
+    Parameters
+    ----------
+    medline_date : str
+        Text of a MedlineDate tag, which can contain the year along with months or seasons.
+
+    Returns
+    -------
+    year : str or None
+        Year the article was published, if it can be extracted.
+
+    Examples
+    --------
+    Get the year from medline dates:
+
+    >>> process_medline_date('2017 Jan-Feb')
+    '2017'
+    >>> process_medline_date('Winter 2017')
+    '2017'
+    """
+
+    # Sometimes date is year followed by months - so get first part
+    if medline_date[:4].isnumeric():
+        year = medline_date[:4]
+
+    # Sometimes date is season followed by year - so get last part
+    elif medline_date[-4:].isnumeric():
+        year = medline_date[-4:]
+
+    # Otherwise, date info is not clear: drop so as to not cause an error
+    else:
+        year = None
 
     return year
 
@@ -193,3 +224,34 @@ def process_ids(ids, id_type):
         out = lst
 
     return out
+
+
+def extract_count(content):
+    """Extract the count of articles from the content of an ESearch result page.
+
+    Parameters
+    ----------
+    content : bytes
+        Content of the requested page.
+
+    Returns
+    -------
+    int
+        Count of the number of articles found, or 0 if the page has no count field.
+
+    Notes
+    -----
+    The count is the first count field on the page, which is the total for the search.
+    This is extracted directly from the page content, without parsing the full page.
+
+    Examples
+    --------
+    Extract the count from an ESearch result page:
+
+    >>> extract_count(b'<eSearchResult><Count>42</Count><RetMax>0</RetMax></eSearchResult>')
+    42
+    """
+
+    match = COUNT_PATTERN.search(content)
+
+    return int(match.group(1)) if match else 0
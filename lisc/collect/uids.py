@@ -0,0 +1,295 @@
+"""Collect sets of article UIDs from EUtils, and compute co-occurrences from them."""
+
+import warnings
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from bs4 import BeautifulSoup
+
+from lisc.requester.cache import make_cache_key
+from lisc.collect.windows import get_date_windows
+
+###################################################################################################
+###################################################################################################
+
+# Maximum number of UIDs that can be returned per request, and per query, from ESearch
+UID_PAGE_SIZE = 10000
+UID_MAX = 10000
+
+def get_uids(req, urls, term_arg, page_size=UID_PAGE_SIZE, settings=None):
+    """Get the sorted set of UIDs of all articles found for a search term.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    urls : EUtils
+        URLs object, with the search utility built, without a `retmax` setting.
+    term_arg : str
+        Search term argument to collect UIDs for.
+    page_size : int, optional, default: 10000
+        Number of UIDs to request per page of results.
+    settings : dict, optional
+        Additional settings for the search, such as a date window.
+
+    Returns
+    -------
+    uids : 1d array of uint32
+        Sorted UIDs of all articles found for the search term.
+    count : int
+        Total number of articles found for the search term, as reported by ESearch.
+
+    Notes
+    -----
+    ESearch results are requested in pages, with `retstart` & `retmax`, until all
+    UIDs are collected. Since ESearch can only return up to 10,000 UIDs for a query,
+    a warning is raised if the search term has more articles than can be collected,
+    in which case `count` is greater than the number of UIDs.
+    """
+
+    uids = []
+
+    retstart = 0
+    count = None
+    while count is None or retstart < min(count, UID_MAX):
+
+        url = urls.get_url('search', settings=dict(settings or {}, term=term_arg,
+                                                   retstart=str(retstart), retmax=str(page_size)))
+        page_uids, page_count = get_uids_page(req, url)
+
+        uids.extend(page_uids)
+        count = page_count if count is None else count
+        retstart += page_size
+
+        if not page_uids:
+            break
+
+    if count > UID_MAX:
+        msg = 'Search term {} has {} articles, of which only the first {} were collected.'
+        warnings.warn(msg.format(term_arg, count, len(uids)))
+
+    return np.unique(np.array(uids, dtype=np.uint32)), count
+
+
+def get_uids_page(req, url):
+    """Get the UIDs, and the total count, from a page of ESearch results.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    url : str
+        URL to request UIDs from.
+
+    Returns
+    -------
+    uids : list of int
+        UIDs listed on the requested page.
+    count : int
+        Total number of articles found for the search.
+    """
+
+    page = req.request_url(url)
+    page_soup = BeautifulSoup(page.content, 'lxml')
+
+    uids = [int(uid.text) for uid in page_soup.find('idlist').find_all('id')] \
+        if page_soup.find('idlist') else []
+
+    try:
+        count = int(page_soup.find('count').text)
+    except AttributeError:
+        count = 0
+
+    return uids, count
+
+
+def get_all_uids(req, urls, term_args, n_workers=1, store=None, db_info=None,
+                 split_dates=False, mindate=None, maxdate=None):
+    """Get the sets of UIDs for each of a list of search terms.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    urls : EUtils
+        URLs object, with the search utility built, without a `retmax` setting.
+    term_args : list of str
+        Search term arguments to collect UIDs for.
+    n_workers : int, optional, default: 1
+        Number of workers to use to collect UIDs for different terms concurrently.
+    store : UIDStore, optional
+        Store of sets of UIDs. If provided, UIDs for terms that are in the store
+        are loaded from it, and newly collected UIDs are added to it.
+    db_info : dict, optional
+        Information about the database being used, to add to the store with new UIDs.
+    split_dates : bool, optional, default: False
+        Whether to split the search for each term into date windows, each with no more UIDs
+        than can be collected per query, such that all UIDs can be collected for any term.
+        If so, the workers are used to collect UIDs for different date windows concurrently.
+    mindate, maxdate : str, optional
+        Range of dates to split across, if splitting into date windows.
+
+    Returns
+    -------
+    uids : list of 1d array of uint32
+        Sorted UIDs of all articles found for each search term.
+    counts : list of int
+        Total number of articles found for each search term, as reported by ESearch.
+        For any term with more articles than can be collected, this is greater than
+        the number of UIDs.
+    """
+
+    # If splitting into date windows, workers collect windows concurrently, otherwise terms
+    if n_workers > 1 and not split_dates:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            outputs = list(executor.map(partial(_get_term_uids, req, urls, store=store,
+                                                db_info=db_info), term_args))
+    else:
+        outputs = [_get_term_uids(req, urls, term_arg, store, db_info,
+                                  split_dates, mindate, maxdate, n_workers)
+                   for term_arg in term_args]
+
+    return [output[0] for output in outputs], [output[1] for output in outputs]
+
+
+def get_split_uids(req, urls, term_arg, mindate=None, maxdate=None, n_workers=1):
+    """Get the sorted set of UIDs of all articles for a search term, across date windows.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    urls : EUtils
+        URLs object, with the search utility built, without `retmax`, `mindate` & `maxdate`.
+    term_arg : str
+        Search term argument to collect UIDs for.
+    mindate, maxdate : str, optional
+        Range of dates to split across, as YYYY, YYYY/MM or YYYY/MM/DD.
+    n_workers : int, optional, default: 1
+        Number of workers to use to collect UIDs for different date windows concurrently.
+
+    Returns
+    -------
+    uids : 1d array of uint32
+        Sorted UIDs of all articles found for the search term.
+    count : int
+        Total number of articles found for the search term, across date windows.
+
+    Notes
+    -----
+    The search is split into date windows that each have fewer articles than can be collected
+    per query. The UIDs collected across windows are merged, dropping any duplicates.
+    """
+
+    windows = get_date_windows(req, urls, term_arg, mindate, maxdate, UID_MAX)
+    get_window_uids = partial(get_uids, req, urls, term_arg, UID_PAGE_SIZE)
+
+    if n_workers > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            window_uids = list(executor.map(get_window_uids, windows))
+    else:
+        window_uids = [get_window_uids(window) for window in windows]
+
+    if not window_uids:
+        return np.array([], dtype=np.uint32), 0
+
+    return np.unique(np.concatenate([uids for uids, _ in window_uids])), \
+        sum(count for _, count in window_uids)
+
+
+def _get_term_uids(req, urls, term_arg, store=None, db_info=None,
+                   split_dates=False, mindate=None, maxdate=None, n_workers=1):
+    """Get the set of UIDs for a search term, from a store if available, otherwise from EUtils.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    urls : EUtils
+        URLs object, with the search utility built, without a `retmax` setting.
+    term_arg : str
+        Search term argument to get UIDs for.
+    store : UIDStore, optional
+        Store of sets of UIDs to load from and add to, keyed by the search URL.
+        Stored UIDs are not used if collected from a different database build, or if
+        truncated at the maximum number of UIDs per query when splitting into date windows.
+    db_info : dict, optional
+        Information about the database being used, to check and add to the store.
+    split_dates : bool, optional, default: False
+        Whether to split the search into date windows.
+    mindate, maxdate : str, optional
+        Range of dates to split across, if splitting into date windows.
+    n_workers : int, optional, default: 1
+        Number of workers to use to collect UIDs for different date windows concurrently.
+
+    Returns
+    -------
+    uids : 1d array of uint32
+        Sorted UIDs of all articles found for the search term.
+    count : int
+        Total number of articles found for the search term.
+    """
+
+    if store is None:
+        return get_split_uids(req, urls, term_arg, mindate, maxdate, n_workers) \
+            if split_dates else get_uids(req, urls, term_arg)
+
+    # Sets of UIDs are stored keyed by the full search, including the date range to split across
+    date_range = {'mindate' : mindate, 'maxdate' : maxdate} if split_dates else {}
+    key = make_cache_key(urls.get_url('search', settings=dict(
+        term=term_arg, **{label : date for label, date in date_range.items() if date})))
+
+    if store.check(key, db_info, split_dates):
+        uids, count = store.get(key), store.index[key]['n_articles']
+    else:
+        uids, count = get_split_uids(req, urls, term_arg, mindate, maxdate, n_workers) \
+            if split_dates else get_uids(req, urls, term_arg)
+        store.add(key, uids, db_info, split=split_dates, n_articles=count)
+
+    return uids, count
+
+
+def compute_overlaps(uids_a, uids_b=None):
+    """Compute the number of shared UIDs between each combination of sets of UIDs.
+
+    Parameters
+    ----------
+    uids_a : list of 1d array
+        Sorted, unique UIDs for each term in list A.
+    uids_b : list of 1d array, optional
+        Sorted, unique UIDs for each term in list B.
+        If not provided, overlaps are computed across `uids_a` in square mode.
+
+    Returns
+    -------
+    overlaps : 2d array
+        The number of shared UIDs for each combination of terms.
+        In square mode, the diagonal is set to 0.
+
+    Examples
+    --------
+    Compute the overlaps between two sets of UIDs:
+
+    >>> uids = [np.array([1, 2, 3]), np.array([2, 3, 4])]
+    >>> compute_overlaps(uids)
+    array([[0, 2],
+           [2, 0]])
+    """
+
+    square = uids_b is None
+    uids_b = uids_a if square else uids_b
+
+    overlaps = np.zeros([len(uids_a), len(uids_b)], dtype=int)
+    for a_ind, a_uids in enumerate(uids_a):
+        for b_ind, b_uids in enumerate(uids_b):
+
+            if square and b_ind <= a_ind:
+                continue
+
+            overlaps[a_ind, b_ind] = np.intersect1d(a_uids, b_uids, assume_unique=True).size
+
+    if square:
+        overlaps = overlaps + overlaps.T
+
+    return overlaps
@@ -0,0 +1,184 @@
+"""Split searches into date windows, to collect all the articles for high volume terms."""
+
+import warnings
+from datetime import date, timedelta
+from calendar import monthrange
+
+from lisc.collect.process import extract_count
+
+###################################################################################################
+###################################################################################################
+
+# Default range of dates to split searches across, if no range is specified
+MIN_DATE = '1800/01/01'
+MAX_DATE = '{}/12/31'.format(date.today().year + 1)
+
+def get_date_windows(req, urls, term_arg, mindate=None, maxdate=None, max_count=10000):
+    """Split the search for a term into date windows, each with no more than a maximum count.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    urls : EUtils
+        URLs object, with the search utility built, without `mindate` & `maxdate` settings.
+    term_arg : str
+        Search term argument.
+    mindate, maxdate : str, optional
+        Range of dates to split, as YYYY, YYYY/MM or YYYY/MM/DD.
+        If not provided, defaults to a range that includes all articles.
+    max_count : int, optional, default: 10000
+        Maximum number of articles per date window.
+
+    Returns
+    -------
+    windows : list of dict
+        Settings for each date window, with `mindate` & `maxdate` as YYYY/MM/DD, in date order.
+
+    Notes
+    -----
+    Date windows are split in half, recursively, until each window has no more than
+    `max_count` articles. A single day that has more than `max_count` articles can not be
+    split further, in which case a warning is raised. Windows with no articles are dropped.
+    """
+
+    return list(iter_date_windows(req, urls, term_arg, mindate, maxdate, max_count))
+
+
+def iter_date_windows(req, urls, term_arg, mindate=None, maxdate=None, max_count=10000):
+    """Iterate across the date windows for the search for a term, as they are split.
+
+    Parameters
+    ----------
+    req : Requester
+        Object to launch requests from.
+    urls : EUtils
+        URLs object, with the search utility built, without `mindate` & `maxdate` settings.
+    term_arg : str
+        Search term argument.
+    mindate, maxdate : str, optional
+        Range of dates to split, as YYYY, YYYY/MM or YYYY/MM/DD.
+        If not provided, defaults to a range that includes all articles.
+    max_count : int, optional, default: 10000
+        Maximum number of articles per date window.
+
+    Yields
+    ------
+    window : dict
+        Settings for a date window, with `mindate` & `maxdate` as YYYY/MM/DD, in date order.
+
+    Notes
+    -----
+    Windows are split lazily, such that later date ranges are only requested,
+    and split, once the preceding windows have been used.
+    """
+
+    yield from _split_window(req, urls, term_arg, parse_date(mindate or MIN_DATE),
+                             parse_date(maxdate or MAX_DATE, end=True), max_count)
+
+
+def get_date_range(mindate=None, maxdate=None):
+    """Get the settings for a full date range, as a single window.
+
+    Parameters
+    ----------
+    mindate, maxdate : str, optional
+        Range of dates, as YYYY, YYYY/MM or YYYY/MM/DD.
+        If not provided, defaults to a range that includes all articles.
+
+    Returns
+    -------
+    dict
+        Settings for the date range, with `mindate` & `maxdate` as YYYY/MM/DD.
+
+    Examples
+    --------
+    Get the settings for a date range, specified as years:
+
+    >>> get_date_range('2018', '2019')
+    {'mindate': '2018/01/01', 'maxdate': '2019/12/31'}
+    """
+
+    return {'mindate' : format_date(parse_date(mindate or MIN_DATE)),
+            'maxdate' : format_date(parse_date(maxdate or MAX_DATE, end=True))}
+
+
+def _split_window(req, urls, term_arg, start, end, max_count):
+    """Recursively split a date window, yielding the windows that fit, in date order."""
+
+    window = {'mindate' : format_date(start), 'maxdate' : format_date(end)}
+    page = req.request_url(urls.get_url('search', settings=dict(term=term_arg, **window)))
+    count = extract_count(page.content)
+
+    if not count:
+        return
+
+    if count <= max_count or start == end:
+
+        if count > max_count:
+            msg = 'Search term {} has {} articles on {}, which can not be split further.'
+            warnings.warn(msg.format(term_arg, count, window['mindate']))
+
+        yield window
+
+    else:
+
+        middle = start + (end - start) // 2
+        yield from _split_window(req, urls, term_arg, start, middle, max_count)
+        yield from _split_window(req, urls, term_arg, middle + timedelta(days=1), end, max_count)
+
+
+def parse_date(date_str, end=False):
+    """Parse a date setting, as used by EUtils, into a date.
+
+    Parameters
+    ----------
+    date_str : str
+        Date, as YYYY, YYYY/MM or YYYY/MM/DD.
+    end : bool, optional, default: False
+        Whether to get the last day, rather than the first, of a partially specified date.
+
+    Returns
+    -------
+    datetime.date
+        Parsed date.
+
+    Examples
+    --------
+    Parse the end of a date range, specified as a month:
+
+    >>> parse_date('2020/02', end=True)
+    datetime.date(2020, 2, 29)
+    """
+
+    parts = [int(part) for part in str(date_str).split('/')]
+
+    year = parts[0]
+    month = parts[1] if len(parts) > 1 else (12 if end else 1)
+    day = parts[2] if len(parts) > 2 else (monthrange(year, month)[1] if end else 1)
+
+    return date(year, month, day)
+
+
+def format_date(date_obj):
+    """Format a date as a date setting for EUtils.
+
+    Parameters
+    ----------
+    date_obj : datetime.date
+        Date to format.
+
+    Returns
+    -------
+    str
+        Date, as YYYY/MM/DD.
+
+    Examples
+    --------
+    Format a date:
+
+    >>> format_date(date(2020, 2, 29))
+    '2020/02/29'
+    """
+
+    return date_obj.strftime('%Y/%m/%d')
@@ -1,24 +1,45 @@
 """Collect words data from EUtils."""
 
+import os
+import json
+from copy import deepcopy
+from queue import Queue, Full
+from collections import deque
+from threading import Thread, Event
+from concurrent.futures import ThreadPoolExecutor
+
 from bs4 import BeautifulSoup
 
 from lisc.data.term import Term
-from lisc.requester import Requester
-from lisc.data.articles import Articles
+from lisc.utils.io import check_ext
+from lisc.requester import Requester, KeyPool
+from lisc.utils.db import check_directory
+from lisc.data.articles import Articles, ARTICLE_FIELDS
 from lisc.data.meta_data import MetaData
+from lisc.data.article_store import ArticleRefs
+from lisc.data.lazy_articles import LazyArticles
 from lisc.collect.utils import make_term
 from lisc.collect.info import get_db_info
 from lisc.collect.process import get_info, extract_tag
 from lisc.collect.process import process_ids, process_authors, process_pub_date
+from lisc.collect.parse import parse_articles
+from lisc.collect.windows import iter_date_windows, get_date_range
 from lisc.urls.eutils import EUtils, get_wait_time
 
 ###################################################################################################
 ###################################################################################################
 
+# Maximum number of articles that can be fetched per request from EFetch
+FETCH_MAX = 10000
+
+# Number of IDs above which IDs are uploaded with EPost, rather than listed in a URL
+EPOST_MIN = 200
+
 def collect_words(terms, inclusions=None, exclusions=None, labels=None,
-                  db='pubmed', retmax=100, field='TIAB', usehistory=False,
-                  api_key=None, save_and_clear=False, logging=None, directory=None,
-                  verbose=False, **eutils_kwargs):
+                  db='pubmed', retmax=100, field='TIAB', usehistory=False, page_size=100,
+                  n_fetchers=1, split_dates=False, api_key=None, save_and_clear=False,
+                  n_workers=1, queue_size=10, store=None, resume=False, logging=None,
+                  directory=None, verbose=False, **eutils_kwargs):
     """Collect text data and metadata from EUtils using specified search term(s).
 
     Parameters
@@ -40,10 +61,33 @@ def collect_words(terms, inclusions=None, exclusions=None, labels=None,
         Defaults to 'TIAB', which is Title/Abstract.
     usehistory : bool, optional, default: False
         Whether to use EUtils history, storing results on their server.
-    api_key : str, optional
+    page_size : int, optional, default: 100
+        Number of articles to fetch per request, when fetching from the history server.
+        Can be up to 10,000.
+    n_fetchers : int, optional, default: 1
+        Number of pages of articles to fetch concurrently.
+        Requests from all fetchers share the rate limit of the requester.
+    split_dates : bool, optional, default: False
+        Whether to split the search for each term into date windows, such that articles can
+        be collected for terms with more articles than can be collected for a single query.
+        Any `mindate` & `maxdate` settings set the range of dates to split.
+        Searches are only split if `retmax` is more than can be collected for a single query.
+    api_key : str or list of str, optional
         An API key for a NCBI account.
+        If a list, requests are spread across the keys, each with its own rate limit.
     save_and_clear : bool, optional, default: False
-        Whether to save words data to disk per term as it goes, instead of holding in memory.
+        Whether to save words data to disk as it goes, instead of holding in memory.
+        If so, the articles are written to file per page, as they are collected.
+    n_workers : int, optional, default: 1
+        Number of workers to use to parse pages of articles concurrently.
+    queue_size : int, optional, default: 10
+        Maximum number of fetched pages of articles to hold while waiting to be processed.
+    store : ArticleStore, optional
+        Store to hold article data, shared across terms. If provided, each article is only
+        fetched and stored once, and the results for each term only hold article IDs.
+    resume : bool, optional, default: False
+        Whether to resume a collection that stopped partway, from a saved manifest, if available.
+        Only used if `save_and_clear` is True, and not using a store.
     logging : {None, 'print', 'store', 'file'}
         What kind of logging, if any, to do for requested URLs.
     directory : str or SCDB, optional
@@ -55,8 +99,9 @@ def collect_words(terms, inclusions=None, exclusions=None, labels=None,
 
     Returns
     -------
-    results : list of Articles
+    results : list of Articles or list of ArticleRefs
         Results from collecting data for each term.
+        If using a store, the results are references to the articles in the store.
     meta_data : MetaData
         Meta data from the data collection.
 
@@ -68,6 +113,33 @@ def collect_words(terms, inclusions=None, exclusions=None, labels=None,
     For each article, it pulls and saves out data (including title, abstract, authors, etc),
     using the hierarchical tag structure that organizes the articles.
 
+    If using history, the articles for each term are fetched in pages of `page_size` articles,
+    with up to `n_fetchers` pages requested at a time. Without history, if a term has more
+    than 200 articles, the found IDs are uploaded to the history server with EPost,
+    and the articles are then fetched in pages in the same way. Pages are processed in order of
+    their position in the search results, such that the order of articles is preserved.
+
+    If splitting into date windows, the search for each term is recursively split by
+    publication date until each window has no more than 10,000 articles, the most that can be
+    retrieved per query. Windows are collected in date order, and articles found in more
+    than one window are only kept once.
+
+    Pages of articles are fetched from a separate thread, while previously fetched pages are
+    parsed by a pool of `n_workers` workers, such that requests overlap with parsing.
+    Fetching pauses when `queue_size` pages are waiting to be processed.
+
+    If using a store, the IDs of the articles for each term are searched for first, and only
+    articles that are not already in the store, or already fetched for a previous term, are
+    fetched. If saving and clearing, the references for each term are saved to file.
+
+    If saving and clearing, without a store, the progress of the collection is recorded in a
+    manifest in the 'raw' folder of `directory`, with the pages to fetch for the current term,
+    including the WebEnv, query_key and retstart of each page if using history, the number of
+    pages written, and the terms that are finished. When resuming, finished terms are skipped,
+    and the current term continues from the page after the last written page, reusing the
+    recorded pages. The manifest is removed once the collection is complete. Note that queries
+    on the history server expire after some time, after which they can not be resumed.
+
     Examples
     --------
     Collect words data for two terms, limiting the results to 5 articles per term:
@@ -80,12 +152,29 @@ def collect_words(terms, inclusions=None, exclusions=None, labels=None,
         msg = 'Only the `pubmed` database is currently supported for words collection.'
         raise NotImplementedError(msg)
 
+    if not 0 < page_size <= FETCH_MAX:
+        raise ValueError('The page size must be between 1 and {}.'.format(FETCH_MAX))
+
+    if resume and not (save_and_clear and store is None):
+        msg = 'Resuming is only available when saving and clearing, without a store.'
+        raise ValueError(msg)
+
+    # If splitting into date windows, the date range is set per request, per window
+    date_range = {}
+    if split_dates:
+        date_range = {key : eutils_kwargs.pop(key, None) for key in ['mindate', 'maxdate']}
+        eutils_kwargs.setdefault('datetype', 'pdat')
+
+    # If given a list of API keys, URLs are built with the first key, which is rotated per request
+    key_pool = KeyPool(api_key) if isinstance(api_key, list) else None
+
     # Get EUtils URLS object, with desired settings, and build required utility URLs
     urls = EUtils(db=db, retmax=retmax, usehistory='y' if usehistory else 'n',
-                  field=field, retmode='xml', **eutils_kwargs, api_key=api_key)
+                  field=field, retmode='xml', **eutils_kwargs,
+                  api_key=key_pool.keys[0] if key_pool else api_key)
 
     # Define the settings for the search utility, adding a default for datetype if not provided
-    search_settings = ['db', 'usehistory', 'retmax', 'retmode', 'field']
+    search_settings = ['db', 'usehistory', 'retmode', 'field'] + (['retmax'] if retmax else [])
     if 'date' in ''.join(eutils_kwargs.keys()) and 'datetype' not in eutils_kwargs.keys():
         search_settings.append('datetype')
 
@@ -93,88 +182,683 @@ def collect_words(terms, inclusions=None, exclusions=None, labels=None,
     urls.build_url('info', settings=['db'])
     urls.build_url('search', settings=search_settings + list(eutils_kwargs.keys()))
     urls.build_url('fetch', settings=['db', 'retmode'])
+    urls.build_url('post', settings=['db'])
 
     # Initialize results & meta data
     results = []
     meta_data = MetaData()
 
     # Check for a Requester object to be passed in as logging, otherwise initialize
+    #   A requester initialized here is closed on exit, including if the collection fails
     req = logging if isinstance(logging, Requester) else \
-        Requester(wait_time=get_wait_time(urls.authenticated),
-                  logging=logging, directory=directory)
+        Requester(wait_time=get_wait_time(urls.authenticated), logging=logging,
+                  directory=directory, pool_size=max(n_fetchers, 10), key_pool=key_pool)
+
+    try:
+
+        # Get current information about database being used
+        meta_data.add_db_info(get_db_info(req, urls.get_url('info')))
+
+        # Check labels, inclusions & exclusions, and collect term information
+        labels = labels if labels else [term[0] for term in terms]
+        inclusions = inclusions if inclusions else [[]] * len(terms)
+        exclusions = exclusions if exclusions else [[]] * len(terms)
+        terms = [Term(label, search, incl, excl) for label, search, incl, excl \
+            in zip(labels, terms, inclusions, exclusions)]
+
+        # Record the date of collection for each term, to be able to update the collection
+        meta_data.set_last_collected([term.label for term in terms])
+
+        # If saving and clearing, track progress in a manifest, and if resuming, load progress
+        manifest = None
+        if save_and_clear and store is None:
+            manifest = {'term_args' : [make_term(term) for term in terms],
+                        'finished' : [], 'current' : None}
+            if resume:
+                manifest = _resume_manifest(manifest, directory)
+
+        # Fetch pages of articles from a separate thread, and parse them in a pool of workers
+        #   Pages are passed through a bounded queue, such that fetching can't run ahead of parsing
+        pages = Queue(maxsize=queue_size)
+        stop = Event()
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+
+            fetcher = Thread(target=_fetch_pages, daemon=True,
+                             args=(req, urls, terms, usehistory, retmax, page_size, n_fetchers,
+                                   split_dates, date_range, store, deepcopy(manifest),
+                                   executor, pages, stop))
+            fetcher.start()
+
+            try:
+
+                # Loop through all the terms, combining the parsed pages of articles, in order
+                for term in terms:
+
+                    if verbose:
+                        print('Collecting data for: ', term.label)
+
+                    # If using a store, add new articles to the store, and keep references
+                    if store is not None:
+                        refs = _collect_refs(term, pages, store)
+                        if save_and_clear:
+                            refs.save(directory)
+                        results.append(refs)
+                        continue
+
+                    # If resuming, skip any terms that are already finished
+                    if manifest is not None and term.label in manifest['finished']:
+                        results.append(Articles(term))
+                        continue
+
+                    # Initialize object to store data for current term articles
+                    #   If saving and clearing, articles are streamed to file per page
+                    arts = Articles(term)
+                    seen = _open_sink(arts, manifest, directory) if save_and_clear else set()
+
+                    try:
+                        term_pages = _iter_term_pages(pages)
+                        if manifest is not None:
+                            _start_manifest_term(manifest, term, next(term_pages), directory)
+
+                        for page_arts in term_pages:
+
+                            if split_dates:
+                                page_arts.drop_duplicates(seen)
+                            _add_articles(arts, page_arts)
+
+                            if save_and_clear:
+                                arts._check_results()
+                                n_bytes = arts.write_sink()
+                                if manifest is not None:
+                                    _update_manifest(manifest, n_bytes, directory)
+
+                    finally:
+                        arts.close_sink()
+
+                    if manifest is not None:
+                        _finish_manifest_term(manifest, term, directory)
+
+                    arts._check_results()
+                    results.append(arts)
+
+            finally:
+                stop.set()
+                fetcher.join()
 
-    # Get current information about database being used
-    meta_data.add_db_info(get_db_info(req, urls.get_url('info')))
+        if manifest is not None:
+            _remove_manifest(directory)
 
-    # Check labels, inclusions & exclusions
-    labels = labels if labels else [term[0] for term in terms]
-    inclusions = inclusions if inclusions else [[]] * len(terms)
-    exclusions = exclusions if exclusions else [[]] * len(terms)
+        meta_data.add_requester(req)
 
-    # Loop through all the terms
-    for label, search, incl, excl in zip(labels, terms, inclusions, exclusions):
+        return results, meta_data
 
-        # Collect term information and make search term argument
-        term = Term(label, search, incl, excl)
-        term_arg = make_term(term)
+    finally:
+        if req is not logging and req.is_active:
+            req.close()
 
-        if verbose:
-            print('Collecting data for: ', term.label)
 
-        # Initialize object to store data for current term articles
-        arts = Articles(term)
+def get_fetch_urls(req, urls, term_arg, usehistory=False, retmax=100, page_size=100,
+                   split_dates=False, mindate=None, maxdate=None):
+    """Search for a term, and get the URLs to fetch the pages of articles found for it.
 
-        # Request web page
-        url = urls.get_url('search', settings={'term' : term_arg})
-        page = req.request_url(url)
-        page_soup = BeautifulSoup(page.content, 'lxml')
+    Parameters
+    ----------
+    req : Requester
+        Requester object to launch requests from.
+    urls : EUtils
+        URLs object, with the search and fetch utilities built.
+    term_arg : str
+        Search term argument.
+    usehistory : bool, optional, default: False
+        Whether to use EUtils history, storing results on their server.
+    retmax : int, optional, default: 100
+        Maximum number of articles to return.
+    page_size : int, optional, default: 100
+        Number of articles to fetch per page, if fetching from the history server.
+    split_dates : bool, optional, default: False
+        Whether to split the search into date windows, searching each window separately.
+    mindate, maxdate : str, optional
+        Range of dates to split across, if splitting into date windows.
+
+    Yields
+    ------
+    art_url : str
+        URL to fetch a page of articles.
+
+    Notes
+    -----
+    The URLs are built from the settings for each page given by `get_fetch_pages`.
+    """
+
+    for page in get_fetch_pages(req, urls, term_arg, usehistory, retmax, page_size,
+                                split_dates, mindate, maxdate):
+        yield urls.get_url('fetch', settings=page)
+
+
+def get_fetch_pages(req, urls, term_arg, usehistory=False, retmax=100, page_size=100,
+                    split_dates=False, mindate=None, maxdate=None):
+    """Search for a term, and get the settings to fetch the pages of articles found for it.
+
+    Parameters
+    ----------
+    req : Requester
+        Requester object to launch requests from.
+    urls : EUtils
+        URLs object, with the search and fetch utilities built.
+    term_arg : str
+        Search term argument.
+    usehistory : bool, optional, default: False
+        Whether to use EUtils history, storing results on their server.
+    retmax : int, optional, default: 100
+        Maximum number of articles to return.
+    page_size : int, optional, default: 100
+        Number of articles to fetch per page, if fetching from the history server.
+    split_dates : bool, optional, default: False
+        Whether to split the search into date windows, searching each window separately.
+    mindate, maxdate : str, optional
+        Range of dates to split across, if splitting into date windows.
+
+    Yields
+    ------
+    page : dict
+        Settings for the fetch utility to fetch a page of articles, as either the IDs of the
+        articles, or the WebEnv, query_key, retstart & retmax of a query on the history server.
+
+    Notes
+    -----
+    Without history, if more than `EPOST_MIN` articles are found, the IDs are uploaded
+    to the history server with EPost, and pages are then fetched from the history server,
+    rather than listing all the IDs in the URL of a single request.
+
+    If splitting into date windows, the pages are given for each window in date order,
+    until `retmax` articles are reached. If `retmax` is no more than can be returned for a
+    single search, the search is not split, and is run across the whole date range.
+    """
 
-        # Get number of articles
-        count = int(page_soup.find('count').text)
+    windows = _get_windows(req, urls, term_arg, retmax, split_dates, mindate, maxdate)
 
-        # Collect articles, using history
-        if usehistory:
+    # Without history or a set retmax, request all the IDs of each date window
+    settings = {'term' : term_arg}
+    if split_dates and not usehistory and not retmax:
+        settings['retmax'] = str(FETCH_MAX)
 
-            # Get the information from the page for using history
-            web_env = page_soup.find('webenv').text
-            query_key = page_soup.find('querykey').text
+    n_remaining = int(retmax) if retmax else None
+    for window in windows:
 
-            # Loop through, collecting 100 articles at a time, using history
-            retmax_it = 100
-            retstart_it = 0
-            while retstart_it < count:
+        n_articles, pages = _search_fetch_pages(req, urls, dict(window, **settings),
+                                                usehistory, n_remaining, page_size)
+        yield from pages
 
-                # Get article page, collect data
-                url_settings = {'WebEnv' : web_env, 'query_key' : query_key,
-                                'retstart' : str(retstart_it), 'retmax' : str(retmax_it)}
-                art_url = urls.get_url('fetch', settings=url_settings)
-                arts = get_articles(req, art_url, arts)
+        # Stop once the global retmax is reached
+        if n_remaining is not None:
+            n_remaining -= n_articles
+            if n_remaining <= 0:
+                break
+
+
+def get_term_ids(req, urls, term_arg, usehistory=False, retmax=100, split_dates=False,
+                 mindate=None, maxdate=None):
+    """Search for a term, and get the IDs of the articles found for it.
+
+    Parameters
+    ----------
+    req : Requester
+        Requester object to launch requests from.
+    urls : EUtils
+        URLs object, with the search utility built.
+    term_arg : str
+        Search term argument.
+    usehistory : bool, optional, default: False
+        Whether the search is set to use EUtils history.
+    retmax : int, optional, default: 100
+        Maximum number of articles to return.
+    split_dates : bool, optional, default: False
+        Whether to split the search into date windows, searching each window separately.
+    mindate, maxdate : str, optional
+        Range of dates to split across, if splitting into date windows.
+
+    Returns
+    -------
+    ids : list of str
+        IDs of the articles found for the term, without duplicates.
+
+    Notes
+    -----
+    This finds the same articles as are fetched from the URLs given by `get_fetch_urls`.
+    If using history or splitting into date windows, without a set `retmax`,
+    up to 10,000 IDs are requested per search.
+    """
+
+    windows = _get_windows(req, urls, term_arg, retmax, split_dates, mindate, maxdate)
+
+    settings = {'term' : term_arg}
+    if (usehistory or split_dates) and not retmax:
+        settings['retmax'] = str(FETCH_MAX)
+
+    ids = []
+    seen = set()
+    for window in windows:
+
+        page = req.request_url(urls.get_url('search', settings=dict(window, **settings)))
+        for el in BeautifulSoup(page.content, 'lxml').find_all('id'):
+            if el.text not in seen:
+                ids.append(el.text)
+                seen.add(el.text)
+
+        # Stop once the global retmax is reached
+        if retmax and len(ids) >= int(retmax):
+            return ids[:int(retmax)]
+
+    return ids
+
+
+def _get_windows(req, urls, term_arg, retmax, split_dates, mindate, maxdate):
+    """Get the date windows to search across, splitting only if more articles are needed
+    than can be returned for a single search. Split windows are given lazily, in date order.
+    """
+
+    if not split_dates:
+        return [{}]
+
+    if retmax and int(retmax) <= FETCH_MAX:
+        return [get_date_range(mindate, maxdate)]
+
+    return iter_date_windows(req, urls, term_arg, mindate, maxdate)
+
+
+def get_id_fetch_urls(req, urls, ids, page_size=100):
+    """Get the URLs to fetch the pages of articles for a list of IDs.
+
+    Parameters
+    ----------
+    req : Requester
+        Requester object to launch requests from.
+    urls : EUtils
+        URLs object, with the fetch and post utilities built.
+    ids : list of str
+        IDs of the articles to fetch.
+    page_size : int, optional, default: 100
+        Number of articles to fetch per page, if fetching from the history server.
+
+    Returns
+    -------
+    art_urls : list of str
+        URLs to fetch the pages of articles.
+
+    Notes
+    -----
+    If there are more than `EPOST_MIN` IDs, the IDs are uploaded to the history server
+    with EPost, and pages are then fetched from the history server. IDs are uploaded in
+    sets of up to 10,000, the most that can be fetched from a single query.
+    """
+
+    return [urls.get_url('fetch', settings=page) \
+        for page in _get_id_pages(req, urls, ids, page_size)]
+
+
+def _get_id_pages(req, urls, ids, page_size):
+    """Get the settings to fetch the pages of articles for a list of IDs."""
+
+    if len(ids) <= EPOST_MIN:
+        return [{'id' : ','.join(ids)}] if ids else []
+
+    pages = []
+    for start in range(0, len(ids), FETCH_MAX):
+        post = ids[start:start + FETCH_MAX]
+        web_env, query_key = post_ids(req, urls, post)
+        pages.extend(_get_history_pages(web_env, query_key, len(post), page_size))
+
+    return pages
+
+
+def _search_fetch_pages(req, urls, settings, usehistory, retmax, page_size):
+    """Run a search, and get the number of articles and settings to fetch the articles found.
+
+    Returns
+    -------
+    n_articles : int
+        Number of articles to be fetched.
+    pages : list of dict
+        Settings to fetch the pages of articles.
+    """
+
+    # Request web page
+    url = urls.get_url('search', settings=settings)
+    page = req.request_url(url)
+    page_soup = BeautifulSoup(page.content, 'lxml')
 
-                # Update position for counting, and break out if more than global retmax
-                retstart_it += retmax_it
-                if retstart_it >= int(retmax):
-                    break
+    # Get number of articles
+    count = int(page_soup.find('count').text)
 
-        # Without using history
-        else:
+    # Collect articles, using history
+    if usehistory:
 
-            ids = page_soup.find_all('id')
-            ids_str = ','.join([el.text for el in ids])
-            art_url = urls.get_url('fetch', settings={'id' : ids_str})
-            arts = get_articles(req, art_url, arts)
+        # Get the information from the page for using history
+        web_env = page_soup.find('webenv').text
+        query_key = page_soup.find('querykey').text
 
-        arts._check_results()
+        # Loop through, collecting a page of articles at a time, up to the global retmax
+        n_articles = min(count, retmax) if retmax is not None else count
+        pages = list(_get_history_pages(web_env, query_key, n_articles, page_size))
 
-        if save_and_clear:
-            arts.save_and_clear(directory=directory)
-        results.append(arts)
+    # Without using history
+    else:
 
-    meta_data.add_requester(req)
+        ids = [el.text for el in page_soup.find_all('id')][:retmax]
+        n_articles = len(ids)
 
-    return results, meta_data
+        # Get the pages to fetch the articles, uploading large sets of IDs to the history server
+        pages = _get_id_pages(req, urls, ids, page_size)
 
+    return n_articles, pages
 
-def get_articles(req, url, arts):
+
+def post_ids(req, urls, ids):
+    """Upload a list of IDs to the EUtils history server.
+
+    Parameters
+    ----------
+    req : Requester
+        Requester object to launch requests from.
+    urls : EUtils
+        URLs object, with the post utility built.
+    ids : list of str
+        IDs to upload.
+
+    Returns
+    -------
+    web_env : str
+        Web environment of the uploaded IDs on the history server.
+    query_key : str
+        Query key of the uploaded IDs on the history server.
+
+    Notes
+    -----
+    The IDs are sent in the body of a POST request, such that the request
+    is not limited by the maximum length of a URL.
+    """
+
+    page = req.request_url(urls.get_url('post'), data={'id' : ','.join(ids)})
+    page_soup = BeautifulSoup(page.content, 'lxml')
+
+    return page_soup.find('webenv').text, page_soup.find('querykey').text
+
+
+def _get_history_pages(web_env, query_key, n_articles, page_size):
+    """Get the settings to fetch pages of articles, from a query on the history server."""
+
+    for retstart_it in range(0, n_articles, page_size):
+
+        # Get article page settings
+        retmax_it = min(page_size, n_articles - retstart_it)
+        yield {'WebEnv' : web_env, 'query_key' : query_key,
+               'retstart' : str(retstart_it), 'retmax' : str(retmax_it)}
+
+
+def _fetch_pages(req, urls, terms, usehistory, retmax, page_size, n_fetchers,
+                 split_dates, date_range, store, manifest, executor, pages, stop):
+    """Fetch the pages of articles for each term, submitting each page to be parsed.
+
+    Notes
+    -----
+    For each page, the future of the parsed articles is added to `pages`, and after the pages
+    of each term, None is added. If an error occurs, the error is added to `pages`.
+    Fetching stops if `stop` is set.
+
+    If using a store, the list of IDs found for each term is added before its pages,
+    and only the articles that are not in the store, or already requested, are fetched.
+
+    If using a manifest, the list of settings for the pages of each term is added before its
+    pages. Finished terms are skipped, and the current term continues from the recorded pages.
+    """
+
+    requested = set()
+
+    try:
+        with ThreadPoolExecutor(max_workers=n_fetchers) as fetch_executor:
+            for term in terms:
+
+                if store is None and manifest is None:
+                    art_urls = get_fetch_urls(req, urls, make_term(term), usehistory, retmax,
+                                              page_size, split_dates, **date_range)
+
+                elif store is None:
+                    if term.label in manifest['finished']:
+                        continue
+                    current = manifest['current']
+                    if current and current['label'] == term.label:
+                        term_pages, n_written = current['pages'], current['n_written']
+                    else:
+                        term_pages = list(get_fetch_pages(req, urls, make_term(term), usehistory,
+                                                          retmax, page_size, split_dates,
+                                                          **date_range))
+                        n_written = 0
+                    if not _put_page(pages, term_pages, stop):
+                        return
+                    art_urls = [urls.get_url('fetch', settings=page) \
+                        for page in term_pages[n_written:]]
+
+                else:
+                    ids = get_term_ids(req, urls, make_term(term), usehistory, retmax,
+                                       split_dates, **date_range)
+                    if not _put_page(pages, ids, stop):
+                        return
+                    new_ids = [art_id for art_id in ids \
+                        if art_id not in requested and art_id not in store]
+                    requested.update(new_ids)
+                    art_urls = get_id_fetch_urls(req, urls, new_ids, page_size)
+
+                for page in _iter_fetched(req, art_urls, fetch_executor, n_fetchers):
+                    if not _put_page(pages, executor.submit(parse_articles, page.content,
+                                                            Articles(term)), stop):
+                        return
+                if not _put_page(pages, None, stop):
+                    return
+
+    except Exception as error:
+        _put_page(pages, error, stop)
+
+
+def _iter_fetched(req, art_urls, executor, n_fetchers):
+    """Iterate across fetched pages, in order, with up to `n_fetchers` requests in flight."""
+
+    in_flight = deque()
+    for art_url in art_urls:
+        in_flight.append(executor.submit(req.request_url, art_url))
+        if len(in_flight) >= n_fetchers:
+            yield in_flight.popleft().result()
+
+    while in_flight:
+        yield in_flight.popleft().result()
+
+
+def _put_page(pages, item, stop):
+    """Add an item to the queue of pages, waiting for space, unless `stop` is set.
+
+    Returns
+    -------
+    bool
+        Whether the item was added to the queue.
+    """
+
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=0.1)
+            return True
+        except Full:
+            pass
+
+    return False
+
+
+def _iter_term_pages(pages):
+    """Iterate across the parsed pages of articles for a term, from the queue of pages.
+
+    Notes
+    -----
+    If using a store, the first item for each term is the list of IDs found for the term.
+    If using a manifest, the first item for each term is the list of pages for the term.
+    """
+
+    while True:
+
+        item = pages.get()
+
+        if item is None:
+            return
+        if isinstance(item, Exception):
+            raise item
+
+        yield item if isinstance(item, list) else item.result()
+
+
+def _collect_refs(term, pages, store):
+    """Add the parsed pages of articles for a term to a store, returning references to them."""
+
+    term_pages = _iter_term_pages(pages)
+    ids = next(term_pages)
+
+    for page_arts in term_pages:
+        page_arts._check_results()
+        store.add(page_arts)
+    store.update_index()
+
+    # Keep references to the articles found for the term that are available in the store
+    return ArticleRefs(term, [art_id for art_id in ids if art_id in store], store)
+
+
+def _add_articles(arts, new_arts):
+    """Add the data from one object of articles to another."""
+
+    for field in ARTICLE_FIELDS:
+        getattr(arts, field).extend(getattr(new_arts, field))
+
+
+def save_words_manifest(manifest, directory=None):
+    """Save a manifest of the progress of a words data collection.
+
+    Parameters
+    ----------
+    manifest : dict
+        The terms of the collection, the finished terms, and the pages of the current term.
+    directory : str or SCDB, optional
+        Folder or database object specifying the save location.
+
+    Notes
+    -----
+    The manifest is written to a temporary file, which then replaces any
+    prior manifest, such that an interrupted save does not corrupt the manifest.
+    """
+
+    file_path = _get_manifest_path(directory)
+    with open(file_path + '.tmp', 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(file_path + '.tmp', file_path)
+
+
+def load_words_manifest(directory=None):
+    """Load a manifest of the progress of a words data collection.
+
+    Parameters
+    ----------
+    directory : str or SCDB, optional
+        Folder or database object specifying the location of the manifest.
+
+    Returns
+    -------
+    manifest : dict or None
+        The terms of the collection, the finished terms, and the pages of the current term.
+        None if there is no available manifest.
+    """
+
+    file_path = _get_manifest_path(directory)
+    if not os.path.exists(file_path):
+        return None
+
+    with open(file_path, 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+
+    return manifest
+
+
+def _resume_manifest(manifest, directory=None):
+    """Resume the progress of a words data collection from a saved manifest, if available."""
+
+    loaded = load_words_manifest(directory)
+
+    if loaded:
+
+        if loaded['term_args'] != manifest['term_args']:
+            raise ValueError('Manifest terms do not match requested terms - can not resume.')
+
+        manifest = loaded
+
+    return manifest
+
+
+def _start_manifest_term(manifest, term, term_pages, directory=None):
+    """Record the pages of a term as the current term in the manifest, unless resuming it."""
+
+    current = manifest['current']
+    if not (current and current['label'] == term.label):
+        manifest['current'] = {'label' : term.label, 'pages' : term_pages,
+                               'n_written' : 0, 'n_bytes' : None}
+        save_words_manifest(manifest, directory)
+
+
+def _update_manifest(manifest, n_bytes, directory=None):
+    """Record that a page of the current term is written, with the resulting file size."""
+
+    manifest['current']['n_written'] += 1
+    manifest['current']['n_bytes'] = n_bytes
+    save_words_manifest(manifest, directory)
+
+
+def _finish_manifest_term(manifest, term, directory=None):
+    """Record that a term is finished in the manifest."""
+
+    manifest['finished'].append(term.label)
+    manifest['current'] = None
+    save_words_manifest(manifest, directory)
+
+
+def _remove_manifest(directory=None):
+    """Remove a saved manifest, if it exists."""
+
+    file_path = _get_manifest_path(directory)
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+
+def _get_manifest_path(directory=None):
+    """Get the file path for the manifest of a words data collection."""
+
+    return os.path.join(check_directory(directory, 'raw'), check_ext('words_manifest', '.json'))
+
+
+def _open_sink(arts, manifest, directory=None):
+    """Open the sink for the articles of a term, continuing from any progress in the manifest.
+
+    Returns
+    -------
+    seen : set of str
+        IDs of the articles that are already written for the term.
+    """
+
+    current = manifest['current'] if manifest else None
+    if not (current and current['label'] == arts.label and current['n_written']):
+        arts.open_sink(directory)
+        return set()
+
+    # Drop anything written after the last recorded page, and append from there
+    with open(arts._get_file_path(directory), 'r+') as f_obj:
+        f_obj.truncate(current['n_bytes'])
+    arts.open_sink(directory, append=True)
+
+    return set(str(art_id) for art_id in LazyArticles(arts.term, directory).ids)
+
+
+def get_articles(req, url, arts, parser='lxml'):
     """Collect information for each article found for a given term.
 
     Parameters
@@ -185,6 +869,11 @@ def get_articles(req, url, arts):
         URL for the article to be collected.
     arts : Articles
         Object to add data to.
+    parser : {'lxml', 'bs4'}, optional, default: 'lxml'
+        Which parser to use to extract article information from the page:
+
+        * 'lxml': parses the page incrementally, freeing each article once processed.
+        * 'bs4': parses the full page with BeautifulSoup.
 
     Returns
     -------
@@ -192,8 +881,15 @@ def get_articles(req, url, arts):
         Object to store information for the current term.
     """
 
+    if parser not in ['lxml', 'bs4']:
+        raise ValueError('Parser not understood.')
+
     # Get page of all articles
     page = req.request_url(url)
+
+    if parser == 'lxml':
+        return parse_articles(page.content, arts)
+
     page_soup = BeautifulSoup(page.content, 'xml')
 
     # Get a list of all articles on the page
@@ -1,6 +1,9 @@
 """Data objects."""
 
 from .term import Term
+from .uids import UIDStore
 from .articles import Articles
 from .meta_data import MetaData
 from .articles_all import ArticlesAll
+from .lazy_articles import LazyArticles
+from .article_store import ArticleStore, ArticleRefs
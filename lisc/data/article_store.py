@@ -0,0 +1,347 @@
+"""Classes to store article data shared across terms, keyed by article ID."""
+
+import os
+import json
+from threading import Lock
+
+from lisc.data.term import Term
+from lisc.utils.io import check_ext
+from lisc.data.articles import Articles
+from lisc.utils.db import check_directory
+from lisc.data.index import make_index, add_to_index, save_index, load_index, get_index_id
+
+###################################################################################################
+###################################################################################################
+
+class ArticleStore():
+    """Disk-backed store of article data, with each article stored once, keyed by its ID.
+
+    Attributes
+    ----------
+    file_path : str
+        Path to the file that stores the articles.
+
+    Notes
+    -----
+    Articles are stored as one json line per article, in the same format as saved
+    :class:`~.Articles` data, and are read from file when accessed. Only the index,
+    with the position of each article in the file, is held in memory.
+
+    Articles without an integer ID can not be stored, and are dropped when added.
+    """
+
+    def __init__(self, directory=None):
+        """Initialize an ArticleStore object, opening or creating the store file.
+
+        Parameters
+        ----------
+        directory : str or SCDB, optional
+            Folder or database object specifying the location of the store.
+
+        Examples
+        --------
+        Initialize an ``ArticleStore`` object, using a temporary directory:
+
+        >>> from tempfile import TemporaryDirectory
+        >>> with TemporaryDirectory() as dirpath:
+        ...     store = ArticleStore(dirpath)
+        """
+
+        self.file_path = os.path.join(check_directory(directory, 'raw'),
+                                      check_ext('article_store', '.json'))
+
+        self._lock = Lock()
+
+        if os.path.exists(self.file_path):
+            offsets, ids = load_index(self.file_path)
+            self._index = {'offsets' : offsets.tolist(), 'ids' : ids.tolist()}
+            self._lookup = {art_id : ind for ind, art_id in enumerate(self._index['ids'])}
+        else:
+            self._create()
+
+
+    def __len__(self):
+
+        return len(self._lookup)
+
+
+    def __getstate__(self):
+        """Get the state of the object for pickling, without the lock, which can not be pickled."""
+
+        state = self.__dict__.copy()
+        del state['_lock']
+
+        return state
+
+
+    def __setstate__(self, state):
+        """Set the state of the object when unpickling, creating a new lock."""
+
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+
+    def __contains__(self, art_id):
+
+        return get_index_id(art_id) in self._lookup
+
+
+    def add(self, arts):
+        """Add articles to the store, skipping any that are already stored.
+
+        Parameters
+        ----------
+        arts : Articles
+            Articles to add.
+
+        Returns
+        -------
+        n_added : int
+            Number of articles that were added.
+        """
+
+        n_added = 0
+
+        with self._lock, open(self.file_path, 'a', newline='\n') as outfile:
+            for art in arts:
+
+                art_id = get_index_id(art['id'])
+                if art_id is None or art_id in self._lookup:
+                    continue
+
+                line = json.dumps(art) + '\n'
+                outfile.write(line)
+                add_to_index(self._index, len(line.encode('utf-8')), art_id)
+                self._lookup[art_id] = len(self._index['ids']) - 1
+                n_added += 1
+
+        return n_added
+
+
+    def clear(self):
+        """Clear all articles from the store."""
+
+        with self._lock:
+            self._create()
+
+
+    def update_index(self):
+        """Save the index of the store, to be loaded when the store is next opened.
+
+        Notes
+        -----
+        If the index is not updated after articles are added, it is rebuilt, by scanning
+        the store file, when the store is next opened.
+        """
+
+        with self._lock:
+            save_index(self.file_path, self._index)
+
+
+    def get_article(self, art_id):
+        """Get an article by its ID.
+
+        Parameters
+        ----------
+        art_id : str or int
+            ID of the article.
+
+        Returns
+        -------
+        dict
+            Data for the article.
+
+        Raises
+        ------
+        KeyError
+            If there is no article with the given ID in the store.
+        """
+
+        with open(self.file_path, 'rb') as f_obj:
+            return self._read_article(f_obj, art_id)
+
+
+    def get_articles(self, term, ids):
+        """Get a set of articles, loaded into an Articles object.
+
+        Parameters
+        ----------
+        term : Term or str
+            Search term definition for the articles.
+        ids : list of str or int
+            IDs of the articles to get, in order.
+
+        Returns
+        -------
+        arts : Articles
+            Object with the data of the selected articles.
+        """
+
+        arts = Articles(term)
+
+        with open(self.file_path, 'rb') as f_obj:
+            for art_id in ids:
+                art = self._read_article(f_obj, art_id)
+                arts.add_data('ids', art['id'])
+                arts.add_data('titles', art['title'])
+                arts.add_data('journals', art['journal'])
+                arts.add_data('authors', art['authors'])
+                arts.add_data('words', art['words'])
+                arts.add_data('keywords', art['keywords'])
+                arts.add_data('years', art['year'])
+                arts.add_data('dois', art['doi'])
+
+        return arts
+
+
+    def _create(self):
+        """Create an empty store file, and its index."""
+
+        with open(self.file_path, 'w', newline='\n') as outfile:
+            line = json.dumps({'store' : 'articles'}) + '\n'
+            outfile.write(line)
+
+        self._index = make_index(len(line.encode('utf-8')))
+        self._lookup = {}
+        save_index(self.file_path, self._index)
+
+
+    def _read_article(self, f_obj, art_id):
+        """Read an article from the open store file."""
+
+        ind = self._lookup[get_index_id(art_id)]
+        start, end = self._index['offsets'][ind:ind + 2]
+
+        f_obj.seek(start)
+
+        return json.loads(f_obj.read(end - start).decode('utf-8'))
+
+
+class ArticleRefs():
+    """An object to hold references to the articles collected for a term, in an ArticleStore.
+
+    Attributes
+    ----------
+    term : Term
+        Definition of the search term, with inclusion and exclusion words.
+    ids : list of str
+        Article ids for all articles.
+    store : ArticleStore
+        Store that holds the data for the articles.
+    """
+
+    def __init__(self, term, ids=None, store=None):
+        """Initialize an ArticleRefs object.
+
+        Parameters
+        ----------
+        term : Term or str
+            Search term definition. If input is a string, it is used as the label for the term.
+        ids : list of str, optional
+            Article ids for all articles.
+        store : ArticleStore, optional
+            Store that holds the data for the articles.
+
+        Examples
+        --------
+        Initialize an ``ArticleRefs`` object, for a term with two articles:
+
+        >>> refs = ArticleRefs('frontal lobe', ['28000963', '28000964'])
+        """
+
+        if isinstance(term, str):
+            term = Term(term, [], [], [])
+
+        self.term = term
+        self.ids = ids if ids else []
+        self.store = store
+
+
+    def __iter__(self):
+        """Iterate through the referenced articles, reading them from the store."""
+
+        for art_id in self.ids:
+            yield self.store.get_article(art_id)
+
+
+    @property
+    def label(self):
+        """The label for the current term."""
+
+        return self.term.label
+
+
+    @property
+    def n_articles(self):
+        """The number of articles included in the object."""
+
+        return len(self.ids)
+
+
+    def to_articles(self):
+        """Load the referenced articles into an Articles object.
+
+        Returns
+        -------
+        Articles
+            Object with the data of all the referenced articles.
+        """
+
+        return self.store.get_articles(self.term, self.ids)
+
+
+    def save(self, directory=None):
+        """Save out a json file with the term definition and article references.
+
+        Parameters
+        ----------
+        directory : str or SCDB, optional
+            Folder or database object specifying the save location.
+
+        Examples
+        --------
+        Save an ``ArticleRefs`` object, using a temporary directory:
+
+        >>> from tempfile import TemporaryDirectory
+        >>> refs = ArticleRefs('frontal lobe', ['28000963', '28000964'])
+        >>> with TemporaryDirectory() as dirpath:
+        ...     refs.save(directory=dirpath)
+        """
+
+        with open(self._get_file_path(directory), 'w') as outfile:
+            json.dump({'term' : self.term, 'ids' : self.ids}, outfile)
+
+
+    def load(self, directory=None, store=None):
+        """Load article references from a json file.
+
+        Parameters
+        ----------
+        directory : str or SCDB, optional
+            Folder or database object specifying the save location.
+        store : ArticleStore, optional
+            Store that holds the data for the articles.
+            If not provided, the store is opened from the same location.
+
+        Examples
+        --------
+        Load an ``ArticleRefs`` object, assuming an :class:`~.SCDB` organization named 'lisc_db':
+
+        >>> from lisc.utils import SCDB
+        >>> refs = ArticleRefs('frontal lobe')
+        >>> refs.load(SCDB('lisc_db')) # doctest:+SKIP
+        """
+
+        with open(self._get_file_path(directory), 'r') as infile:
+            data = json.load(infile)
+
+        self.term = Term(*data['term'])
+        self.ids = data['ids']
+        self.store = store if store else ArticleStore(directory)
+
+
+    def _get_file_path(self, directory=None):
+        """Get the file path for saving and loading references, as a json file in 'raw'."""
+
+        return os.path.join(check_directory(directory, 'raw'),
+                            check_ext(self.label + '_refs', '.json'))
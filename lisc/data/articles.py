@@ -5,6 +5,8 @@ import json
 
 from lisc.data.term import Term
 from lisc.utils.db import check_directory
+from lisc.data.columns import save_columns, load_columns
+from lisc.data.index import make_index, add_to_index, save_index, load_index
 from lisc.data.base_articles import BaseArticles
 from lisc.core.errors import InconsistentDataError
 from lisc.utils.io import parse_json_data, check_ext
@@ -12,6 +14,9 @@ from lisc.utils.io import parse_json_data, check_ext
 ###################################################################################################
 ###################################################################################################
 
+# Data fields that are collected for each article
+ARTICLE_FIELDS = ['ids', 'titles', 'journals', 'authors', 'words', 'keywords', 'years', 'dois']
+
 class Articles(BaseArticles):
     """An object to hold collected 'words' data for a specified term.
 
@@ -59,6 +64,10 @@ class Articles(BaseArticles):
         # Inherit from the BaseArticles object
         BaseArticles.__init__(self, term)
 
+        # Initialize file to stream data to, and its index, which are only set while streaming
+        self._sink = None
+        self._sink_index = None
+
 
     def __iter__(self):
         """Iterate through collected articles."""
@@ -97,6 +106,47 @@ class Articles(BaseArticles):
         getattr(self, field).append(new_data)
 
 
+    def drop_duplicates(self, seen=None):
+        """Drop any articles with IDs that have already been seen, or that are repeated.
+
+        Parameters
+        ----------
+        seen : set of str, optional
+            IDs of articles that have already been seen, as strings.
+            If provided, the IDs of the kept articles are added to it.
+
+        Notes
+        -----
+        Articles without an ID are always kept.
+
+        Examples
+        --------
+        Drop an article that has already been collected:
+
+        >>> articles = Articles('frontal lobe')
+        >>> for art_id in ['28000963', '28000964']:
+        ...     for field in ARTICLE_FIELDS:
+        ...         articles.add_data(field, art_id if field == 'ids' else None)
+        >>> articles.drop_duplicates({'28000963'})
+        >>> articles.ids
+        ['28000964']
+        """
+
+        seen = set() if seen is None else seen
+
+        keep = []
+        for ind, art_id in enumerate(self.ids):
+            if art_id is None:
+                keep.append(ind)
+            elif str(art_id) not in seen:
+                keep.append(ind)
+                seen.add(str(art_id))
+
+        if len(keep) < len(self.ids):
+            for field in ARTICLE_FIELDS:
+                setattr(self, field, [getattr(self, field)[ind] for ind in keep])
+
+
     def save(self, directory=None):
         """Save out a json file with all attached data.
 
@@ -105,6 +155,11 @@ class Articles(BaseArticles):
         directory : str or SCDB, optional
             Folder or database object specifying the save location.
 
+        Notes
+        -----
+        An index file, with the byte offset of each article, is also saved next to the json file,
+        which allows for loading articles lazily, with :class:`~.LazyArticles`.
+
         Examples
         --------
         Save an ``Articles`` object, using a temporary directory:
@@ -115,14 +170,13 @@ class Articles(BaseArticles):
         ...     articles.save(directory=dirpath)
         """
 
-        directory = check_directory(directory, 'raw')
+        f_path = self._get_file_path(directory)
 
-        with open(os.path.join(directory, check_ext(self.label, '.json')), 'w') as outfile:
-            json.dump({'term' : self.term}, outfile)
-            outfile.write('\n')
-            for art in self:
-                json.dump(art, outfile)
-                outfile.write('\n')
+        with open(f_path, 'w', newline='\n') as outfile:
+            index = self._write_header(outfile)
+            self._write_articles(outfile, index)
+
+        save_index(f_path, index)
 
 
     def load(self, directory=None):
@@ -142,9 +196,7 @@ class Articles(BaseArticles):
         >>> articles.load(SCDB('lisc_db')) # doctest:+SKIP
         """
 
-        directory = check_directory(directory, 'raw')
-
-        data = parse_json_data(os.path.join(directory, check_ext(self.label, '.json')))
+        data = parse_json_data(self._get_file_path(directory))
 
         self.term = Term(*next(data)['term'])
 
@@ -183,6 +235,177 @@ class Articles(BaseArticles):
         self.clear()
 
 
+    def save_columns(self, directory=None):
+        """Save out the attached data in a binary, columnar format.
+
+        Parameters
+        ----------
+        directory : str or SCDB, optional
+            Folder or database object specifying the save location.
+
+        Notes
+        -----
+        Data is saved to a folder, named by the term label, in the 'raw' folder.
+        Integer fields, such as IDs and years, are stored as arrays, and other fields are
+        stored as the concatenated bytes of all values, with an array of offsets to each value.
+
+        Examples
+        --------
+        Save an ``Articles`` object in a columnar format, using a temporary directory:
+
+        >>> from tempfile import TemporaryDirectory
+        >>> articles = Articles('frontal lobe')
+        >>> with TemporaryDirectory() as dirpath:
+        ...     articles.save_columns(directory=dirpath)
+        """
+
+        folder = self._get_columns_path(directory)
+        info = save_columns({field : getattr(self, field) for field in ARTICLE_FIELDS}, folder)
+
+        with open(os.path.join(folder, check_ext('columns', '.json')), 'w') as outfile:
+            json.dump({'term' : self.term, 'columns' : info}, outfile)
+
+
+    def load_columns(self, directory=None, mmap=True):
+        """Load data saved in a binary, columnar format.
+
+        Parameters
+        ----------
+        directory : str or SCDB, optional
+            Folder or database object specifying the save location.
+        mmap : bool, optional, default: True
+            Whether to memory-map the data, rather than loading it into memory.
+
+        Notes
+        -----
+        Each data field is loaded as a column, which can be indexed and iterated across like
+        a list, with the same values as the collected data, but which can not be added to.
+        With memory-mapping, data is only read from disk when values are accessed.
+
+        Examples
+        --------
+        Load an ``Articles`` object, assuming an :class:`~.SCDB` organization named 'lisc_db':
+
+        >>> from lisc.utils import SCDB
+        >>> articles = Articles('frontal lobe')
+        >>> articles.load_columns(SCDB('lisc_db')) # doctest:+SKIP
+        """
+
+        folder = self._get_columns_path(directory)
+
+        with open(os.path.join(folder, check_ext('columns', '.json')), 'r') as infile:
+            data = json.load(infile)
+
+        self.term = Term(*data['term'])
+        for field, column in load_columns(data['columns'], folder, mmap).items():
+            setattr(self, field, column)
+
+        self._check_results()
+
+
+    def open_sink(self, directory=None, append=False):
+        """Open a file to stream data to, as articles are collected.
+
+        Parameters
+        ----------
+        directory : str or SCDB, optional
+            Folder or database object specifying the save location.
+        append : bool, optional, default: False
+            Whether to append to an existing file, if there is one, rather than overwrite it.
+
+        Notes
+        -----
+        Data is written to the same file, and in the same format, as with `save`.
+        Once opened, data written with `write_sink` is added to the file,
+        until the sink is closed with `close_sink`, at which point the index file is saved.
+
+        Examples
+        --------
+        Stream data from an ``Articles`` object to a file, using a temporary directory:
+
+        >>> from tempfile import TemporaryDirectory
+        >>> articles = Articles('frontal lobe')
+        >>> with TemporaryDirectory() as dirpath:
+        ...     articles.open_sink(directory=dirpath)
+        ...     articles.write_sink()
+        ...     articles.close_sink()
+        """
+
+        f_path = self._get_file_path(directory)
+
+        if append and os.path.exists(f_path):
+            offsets, ids = load_index(f_path)
+            self._sink_index = {'offsets' : offsets.tolist(), 'ids' : ids.tolist()}
+            self._sink = open(f_path, 'a', newline='\n')
+        else:
+            self._sink = open(f_path, 'w', newline='\n')
+            self._sink_index = self._write_header(self._sink)
+
+
+    def write_sink(self):
+        """Write the attached data to the open sink, and clear it from the object.
+
+        Returns
+        -------
+        n_bytes : int
+            Size of the file, in bytes, after writing.
+        """
+
+        if self._sink is None:
+            raise ValueError('No sink is open - can not write data.')
+
+        self._write_articles(self._sink, self._sink_index)
+        self._sink.flush()
+        self.clear()
+
+        return self._sink_index['offsets'][-1]
+
+
+    def close_sink(self):
+        """Close the sink, if one is open."""
+
+        if self._sink is not None:
+            self._sink.close()
+            save_index(self._sink.name, self._sink_index)
+            self._sink = None
+            self._sink_index = None
+
+
+    def _get_file_path(self, directory=None):
+        """Get the file path for saving and loading data, as a json file in the 'raw' folder."""
+
+        return os.path.join(check_directory(directory, 'raw'), check_ext(self.label, '.json'))
+
+
+    def _get_columns_path(self, directory=None):
+        """Get the folder path for saving and loading data in a columnar format."""
+
+        return os.path.join(check_directory(directory, 'raw'), self.label)
+
+
+    def _write_header(self, outfile):
+        """Write the term definition, as the first line of an open file, returning a new index."""
+
+        line = json.dumps({'term' : self.term}) + '\n'
+        outfile.write(line)
+
+        return make_index(len(line.encode('utf-8')))
+
+
+    def _write_articles(self, outfile, index):
+        """Write the data for each article to an open file, as one json line per article.
+
+        Notes
+        -----
+        The byte offset and ID of each written article are added to `index`.
+        """
+
+        for art in self:
+            line = json.dumps(art) + '\n'
+            outfile.write(line)
+            add_to_index(index, len(line.encode('utf-8')), art['id'])
+
+
     def _check_results(self):
         """Check for consistency in extracted results.
 
@@ -7,6 +7,7 @@ from lisc.utils.io import check_ext
 from lisc.utils.db import check_directory
 from lisc.data.utils import combine_lists, convert_string, count_elements, drop_none
 from lisc.data.base_articles import BaseArticles
+from lisc.data.article_store import ArticleRefs
 
 ###################################################################################################
 ###################################################################################################
@@ -49,8 +50,9 @@ class ArticlesAll(BaseArticles):
 
         Parameters
         ----------
-        term_data : Articles
+        term_data : Articles or ArticleRefs
             Data for all articles from a given search term.
+            If references to articles in a store, the articles are loaded from the store.
         exclusions : list of str, optional
             Words to exclude from the word collections.
 
@@ -66,6 +68,9 @@ class ArticlesAll(BaseArticles):
         # Inherit from the BaseArticles object
         BaseArticles.__init__(self, term_data.term)
 
+        if isinstance(term_data, ArticleRefs):
+            term_data = term_data.to_articles()
+
         # Collect together search terms to add to exclusions or use as exclusions
         term = term_data.term
         searches = list(set(list([term.label] + term.search + term.inclusions)))
@@ -0,0 +1,324 @@
+"""Columnar, memory-mapped storage for collected article data."""
+
+import os
+import json
+
+import numpy as np
+
+###################################################################################################
+###################################################################################################
+
+# Value used to mark missing values in integer columns
+MISSING = -1
+
+class ArrayColumn():
+    """A column of integer values, stored as an array.
+
+    Attributes
+    ----------
+    array : 1d array of int
+        Values of the column, with missing values set as -1.
+    dtype : {int, str}
+        Type that values are converted to when accessed.
+
+    Notes
+    -----
+    Indexing the column returns values converted to `dtype`, with missing values as None,
+    matching the values of the data as collected. The underlying array can be used directly
+    for computations across the column.
+    """
+
+    def __init__(self, array, dtype=int):
+        """Initialize an ArrayColumn object.
+
+        Parameters
+        ----------
+        array : 1d array of int
+            Values of the column, with missing values set as -1.
+        dtype : {int, str}, optional, default: int
+            Type that values are converted to when accessed.
+
+        Examples
+        --------
+        Create a column of years, with a missing value:
+
+        >>> years = ArrayColumn(np.array([2010, -1, 2012]))
+        >>> list(years)
+        [2010, None, 2012]
+        """
+
+        self.array = array
+        self.dtype = dtype
+
+
+    def __len__(self):
+        return len(self.array)
+
+
+    def __getitem__(self, ind):
+
+        if isinstance(ind, slice):
+            return [self[cind] for cind in range(*ind.indices(len(self)))]
+
+        value = int(self.array[ind])
+
+        return None if value == MISSING else self.dtype(value)
+
+
+    def __iter__(self):
+
+        for ind in range(len(self)):
+            yield self[ind]
+
+
+class BlobColumn():
+    """A column of values, stored as concatenated encoded bytes, with offsets to each value.
+
+    Attributes
+    ----------
+    offsets : 1d array of int
+        Start position of each value in the blob, with a final entry for the end of the blob.
+    blob : 1d array of uint8
+        Encoded bytes of all values.
+    kind : {'str', 'json'}
+        How values are encoded, as UTF-8 strings, or as json.
+    nulls : 1d array of bool, optional
+        Which values are missing, for columns of strings.
+    """
+
+    def __init__(self, offsets, blob, kind='str', nulls=None):
+        """Initialize a BlobColumn object.
+
+        Parameters
+        ----------
+        offsets : 1d array of int
+            Start position of each value in the blob, with a final entry for the end of the blob.
+        blob : 1d array of uint8
+            Encoded bytes of all values.
+        kind : {'str', 'json'}, optional, default: 'str'
+            How values are encoded, as UTF-8 strings, or as json.
+        nulls : 1d array of bool, optional
+            Which values are missing, for columns of strings.
+
+        Examples
+        --------
+        Create a column of titles, from encoded values:
+
+        >>> titles = BlobColumn(*encode_blob(['Title', 'Another title']))
+        >>> titles[1]
+        'Another title'
+        """
+
+        self.offsets = offsets
+        self.blob = blob
+        self.kind = kind
+        self.nulls = nulls
+
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+    def __getitem__(self, ind):
+
+        if isinstance(ind, slice):
+            return [self[cind] for cind in range(*ind.indices(len(self)))]
+
+        ind = range(len(self))[ind]
+
+        if self.nulls is not None and self.nulls[ind]:
+            return None
+
+        value = self.blob[self.offsets[ind]:self.offsets[ind + 1]].tobytes().decode('utf-8')
+
+        return value if self.kind == 'str' else json.loads(value)
+
+
+    def __iter__(self):
+
+        for ind in range(len(self)):
+            yield self[ind]
+
+
+def encode_array(values):
+    """Encode a list of integer values, which may be missing, or integers stored as strings.
+
+    Parameters
+    ----------
+    values : list of int or str or None
+        Values to encode.
+
+    Returns
+    -------
+    array : 1d array of int64
+        Encoded values, with missing values set as -1.
+
+    Examples
+    --------
+    Encode a list of IDs:
+
+    >>> encode_array(['28000963', None])
+    array([28000963,       -1])
+    """
+
+    return np.array([MISSING if value is None else int(value) for value in values],
+                    dtype=np.int64)
+
+
+def encode_blob(values, kind='str'):
+    """Encode a list of values as concatenated bytes, with offsets to each value.
+
+    Parameters
+    ----------
+    values : list
+        Values to encode. For 'str', each value should be a str or None.
+    kind : {'str', 'json'}, optional, default: 'str'
+        How to encode values, as UTF-8 strings, or as json.
+
+    Returns
+    -------
+    offsets : 1d array of int64
+        Start position of each value in the blob, with a final entry for the end of the blob.
+    blob : 1d array of uint8
+        Encoded bytes of all values.
+    kind : {'str', 'json'}
+        How the values were encoded.
+    nulls : 1d array of bool or None
+        Which values are missing, for columns of strings.
+    """
+
+    if kind == 'str':
+        nulls = np.array([value is None for value in values], dtype=bool)
+        encoded = [(value or '').encode('utf-8') for value in values]
+    else:
+        nulls = None
+        encoded = [json.dumps(value).encode('utf-8') for value in values]
+
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(value) for value in encoded])
+
+    return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8), kind, nulls
+
+
+def check_column_kind(values):
+    """Check which kind of column to use to store a list of values.
+
+    Parameters
+    ----------
+    values : list
+        Values to store.
+
+    Returns
+    -------
+    {'array', 'str', 'json'}
+        Kind of column to use.
+
+    Examples
+    --------
+    Check the kind of column to use for lists of values:
+
+    >>> check_column_kind(['28000963', None])
+    'array'
+    >>> check_column_kind(['A title', None])
+    'str'
+    >>> check_column_kind([['keyword', 'another'], None])
+    'json'
+    """
+
+    if all(value is None or _is_int(value) for value in values):
+        return 'array'
+    elif all(value is None or isinstance(value, str) for value in values):
+        return 'str'
+    else:
+        return 'json'
+
+
+def save_columns(columns, directory):
+    """Save a set of columns of data to a folder, with one file per array.
+
+    Parameters
+    ----------
+    columns : dict of list
+        Values for each column, keyed by column name.
+    directory : str
+        Folder to save the columns to.
+
+    Returns
+    -------
+    info : dict
+        Information about each saved column, including its kind and value type.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+
+    info = {}
+    for name, values in columns.items():
+
+        kind = check_column_kind(values)
+        info[name] = {'kind' : kind}
+
+        if kind == 'array':
+            info[name]['dtype'] = 'int' if all(value is None or isinstance(value, int) \
+                for value in values) else 'str'
+            np.save(os.path.join(directory, name + '.npy'), encode_array(values))
+
+        else:
+            offsets, blob, _, nulls = encode_blob(values, kind)
+            np.save(os.path.join(directory, name + '_offsets.npy'), offsets)
+            np.save(os.path.join(directory, name + '_blob.npy'), blob)
+            if nulls is not None:
+                np.save(os.path.join(directory, name + '_nulls.npy'), nulls)
+
+    return info
+
+
+def load_columns(info, directory, mmap=True):
+    """Load a set of columns of data from a folder.
+
+    Parameters
+    ----------
+    info : dict
+        Information about each saved column, as returned by `save_columns`.
+    directory : str
+        Folder to load the columns from.
+    mmap : bool, optional, default: True
+        Whether to memory-map the arrays, rather than loading them into memory.
+
+    Returns
+    -------
+    columns : dict of ArrayColumn or BlobColumn
+        Loaded columns, keyed by column name.
+    """
+
+    def load(f_name):
+        return np.load(os.path.join(directory, f_name), mmap_mode='r' if mmap else None)
+
+    columns = {}
+    for name, col_info in info.items():
+
+        if col_info['kind'] == 'array':
+            columns[name] = ArrayColumn(load(name + '.npy'),
+                                        int if col_info['dtype'] == 'int' else str)
+
+        else:
+            nulls = load(name + '_nulls.npy') if col_info['kind'] == 'str' else None
+            columns[name] = BlobColumn(load(name + '_offsets.npy'), load(name + '_blob.npy'),
+                                       col_info['kind'], nulls)
+
+    return columns
+
+
+def _is_int(value):
+    """Check if a value is an integer, or a string that exactly represents an integer."""
+
+    if isinstance(value, bool):
+        return False
+    elif isinstance(value, int):
+        return True
+    elif isinstance(value, str):
+        try:
+            return str(int(value)) == value and int(value) >= 0
+        except ValueError:
+            return False
+    else:
+        return False
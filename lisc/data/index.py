@@ -0,0 +1,172 @@
+"""Functions for indexing the articles in raw data files, by byte offset."""
+
+import os
+import json
+
+import numpy as np
+
+from lisc.data.columns import encode_array
+
+###################################################################################################
+###################################################################################################
+
+def get_index_path(f_path):
+    """Get the path of the index file for a raw data file.
+
+    Parameters
+    ----------
+    f_path : str
+        Path to the raw data file.
+
+    Returns
+    -------
+    str
+        Path to the index file, which is saved next to the raw data file.
+
+    Examples
+    --------
+    Get the index path for a raw data file:
+
+    >>> get_index_path('lisc_db/data/raw/frontal_lobe.json')
+    'lisc_db/data/raw/frontal_lobe_index.npz'
+    """
+
+    return os.path.splitext(f_path)[0] + '_index.npz'
+
+
+def make_index(start):
+    """Make an empty index, for a file with articles starting at a given position.
+
+    Parameters
+    ----------
+    start : int
+        Byte offset of the first article in the file.
+
+    Returns
+    -------
+    index : dict
+        Index, with 'offsets', the start of each article and the end of the last article,
+        and 'ids', the ID of each article, each as a list.
+    """
+
+    return {'offsets' : [start], 'ids' : []}
+
+
+def add_to_index(index, n_bytes, art_id):
+    """Add an article to an index.
+
+    Parameters
+    ----------
+    index : dict
+        Index to add to.
+    n_bytes : int
+        Length of the article line, in bytes.
+    art_id : str or list of str or None
+        ID of the article.
+    """
+
+    index['offsets'].append(index['offsets'][-1] + n_bytes)
+    index['ids'].append(get_index_id(art_id))
+
+
+def save_index(f_path, index):
+    """Save the index for a raw data file.
+
+    Parameters
+    ----------
+    f_path : str
+        Path to the raw data file.
+    index : dict
+        Index of the articles in the file.
+    """
+
+    np.savez(get_index_path(f_path), offsets=np.array(index['offsets'], dtype=np.int64),
+             ids=encode_array(index['ids']))
+
+
+def build_index(f_path):
+    """Build the index for a raw data file, by scanning the file.
+
+    Parameters
+    ----------
+    f_path : str
+        Path to the raw data file.
+
+    Returns
+    -------
+    index : dict
+        Index of the articles in the file.
+    """
+
+    with open(f_path, 'rb') as f_obj:
+
+        index = make_index(len(f_obj.readline()))
+        for line in f_obj:
+            add_to_index(index, len(line), json.loads(line.decode('utf-8'))['id'])
+
+    return index
+
+
+def load_index(f_path):
+    """Load the index for a raw data file, building and saving it if it is missing or out of date.
+
+    Parameters
+    ----------
+    f_path : str
+        Path to the raw data file.
+
+    Returns
+    -------
+    offsets : 1d array of int
+        Byte offset of the start of each article, with a final entry for the end of the file.
+    ids : 1d array of int
+        ID of each article, with missing IDs set as -1.
+
+    Notes
+    -----
+    An index is out of date if it does not end at the end of the raw data file, for example
+    if data was added to the file without updating the index.
+    """
+
+    index_path = get_index_path(f_path)
+
+    if os.path.exists(index_path):
+        with np.load(index_path) as loaded:
+            offsets, ids = loaded['offsets'], loaded['ids']
+        if offsets[-1] == os.path.getsize(f_path):
+            return offsets, ids
+
+    index = build_index(f_path)
+    save_index(f_path, index)
+
+    return np.array(index['offsets'], dtype=np.int64), encode_array(index['ids'])
+
+
+def get_index_id(art_id):
+    """Get the ID of an article as an integer, as used in an index.
+
+    Parameters
+    ----------
+    art_id : str or list of str or None
+        ID of the article. If there are multiple IDs, the first is used.
+
+    Returns
+    -------
+    int or None
+        ID of the article, or None if the article does not have an integer ID.
+
+    Examples
+    --------
+    Get the index ID for an article with multiple IDs:
+
+    >>> get_index_id(['28000963', '28000964'])
+    28000963
+    """
+
+    if isinstance(art_id, list):
+        art_id = art_id[0] if art_id else None
+
+    try:
+        return int(art_id)
+    except (TypeError, ValueError):
+        return None
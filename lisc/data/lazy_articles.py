@@ -0,0 +1,191 @@
+"""Classes to lazily load and access saved article data."""
+
+import os
+import json
+
+from lisc.data.term import Term
+from lisc.utils.io import check_ext
+from lisc.data.index import load_index
+from lisc.data.articles import Articles
+from lisc.data.columns import ArrayColumn
+from lisc.utils.db import check_directory
+
+###################################################################################################
+###################################################################################################
+
+class LazyArticles():
+    """An object to access saved 'words' data for a specified term, loading articles on demand.
+
+    Attributes
+    ----------
+    term : Term
+        Definition of the search term, with inclusion and exclusion words.
+    file_path : str
+        Path to the raw data file.
+    offsets : 1d array of int
+        Byte offset of the start of each article, with a final entry for the end of the file.
+    ids : ArrayColumn
+        Article ids for all articles.
+
+    Notes
+    -----
+    Only the index of the raw data file is loaded when the object is initialized.
+    Each article is read from the file, and parsed, only when it is accessed.
+
+    Indexing returns each article as a dictionary, in the same format as iterating
+    across an :class:`~.Articles` object.
+    """
+
+    def __init__(self, term, directory=None):
+        """Initialize LazyArticles object.
+
+        Parameters
+        ----------
+        term : Term or str
+            Search term definition. If input is a string, it is used as the label for the term.
+        directory : str or SCDB, optional
+            Folder or database object specifying the save location.
+
+        Notes
+        -----
+        If the raw data file has no index, or the index is out of date, the index is
+        built by scanning the file, and is saved for future use.
+
+        Examples
+        --------
+        Load a ``LazyArticles`` object, assuming an :class:`~.SCDB` organization named 'lisc_db':
+
+        >>> from lisc.utils import SCDB
+        >>> articles = LazyArticles('frontal lobe', SCDB('lisc_db')) # doctest:+SKIP
+        """
+
+        label = term if isinstance(term, str) else term.label
+        self.file_path = os.path.join(check_directory(directory, 'raw'), check_ext(label, '.json'))
+
+        with open(self.file_path, 'rb') as f_obj:
+            self.term = Term(*json.loads(f_obj.readline().decode('utf-8'))['term'])
+
+        self.offsets, ids = load_index(self.file_path)
+        self.ids = ArrayColumn(ids, str)
+
+        self._lookup = None
+
+
+    def __len__(self):
+
+        return self.n_articles
+
+
+    def __getitem__(self, ind):
+        """Get an article, or list of articles for a slice, by index."""
+
+        if isinstance(ind, slice):
+            return [self[cind] for cind in range(*ind.indices(len(self)))]
+
+        ind = range(len(self))[ind]
+
+        with open(self.file_path, 'rb') as f_obj:
+            f_obj.seek(self.offsets[ind])
+            line = f_obj.read(self.offsets[ind + 1] - self.offsets[ind])
+
+        return json.loads(line.decode('utf-8'))
+
+
+    def __iter__(self):
+        """Iterate through articles, reading them from file in order."""
+
+        with open(self.file_path, 'rb') as f_obj:
+            f_obj.seek(self.offsets[0])
+            for _ in range(len(self)):
+                yield json.loads(f_obj.readline().decode('utf-8'))
+
+
+    @property
+    def label(self):
+        """The label for the current term."""
+
+        return self.term.label
+
+
+    @property
+    def n_articles(self):
+        """The number of articles included in the object."""
+
+        return len(self.offsets) - 1
+
+
+    def get_article(self, pmid):
+        """Get an article by its ID.
+
+        Parameters
+        ----------
+        pmid : str or int
+            PubMed ID of the article.
+
+        Returns
+        -------
+        dict
+            Data for the article.
+
+        Raises
+        ------
+        KeyError
+            If there is no article with the given ID.
+
+        Examples
+        --------
+        Get an article by its ID, assuming an :class:`~.SCDB` organization named 'lisc_db':
+
+        >>> from lisc.utils import SCDB
+        >>> articles = LazyArticles('frontal lobe', SCDB('lisc_db')) # doctest:+SKIP
+        >>> article = articles.get_article('28000963') # doctest:+SKIP
+        """
+
+        # The lookup from ID to index is only built the first time an ID is requested
+        if self._lookup is None:
+            self._lookup = {art_id : ind for ind, art_id in enumerate(self.ids.array.tolist())}
+
+        return self[self._lookup[int(pmid)]]
+
+
+    def to_articles(self, inds=None):
+        """Load a selection of articles into an Articles object.
+
+        Parameters
+        ----------
+        inds : slice or list of int, optional
+            Indices of the articles to load. If not provided, all articles are loaded.
+
+        Returns
+        -------
+        arts : Articles
+            Object with the data of the selected articles.
+
+        Examples
+        --------
+        Load a sample of articles, assuming an :class:`~.SCDB` organization named 'lisc_db':
+
+        >>> from lisc.utils import SCDB
+        >>> articles = LazyArticles('frontal lobe', SCDB('lisc_db')) # doctest:+SKIP
+        >>> sample = articles.to_articles(slice(0, 100)) # doctest:+SKIP
+        """
+
+        if inds is None:
+            selected = iter(self)
+        elif isinstance(inds, slice):
+            selected = self[inds]
+        else:
+            selected = [self[ind] for ind in inds]
+
+        arts = Articles(self.term)
+        for art in selected:
+            arts.add_data('ids', art['id'])
+            arts.add_data('titles', art['title'])
+            arts.add_data('journals', art['journal'])
+            arts.add_data('authors', art['authors'])
+            arts.add_data('words', art['words'])
+            arts.add_data('keywords', art['keywords'])
+            arts.add_data('years', art['year'])
+            arts.add_data('dois', art['doi'])
+
+        return arts
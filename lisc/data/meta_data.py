@@ -1,7 +1,7 @@
 """Class to store meta data."""
 
 from copy import deepcopy
-from datetime import datetime
+from datetime import date, datetime
 
 ###################################################################################################
 ###################################################################################################
@@ -19,6 +19,8 @@ class MetaData():
         Details of the database from which the data was accessed.
     log : list or None
         A log of requested URLs, if requests were logged.
+    last_collected : dict or None
+        The date that data was last collected for each term, as YYYY/MM/DD, keyed by label.
     """
 
     def __init__(self):
@@ -28,6 +30,7 @@ class MetaData():
         self.requester = None
         self.db_info = None
         self.log = None
+        self.last_collected = None
 
         self.get_date()
 
@@ -82,6 +85,85 @@ class MetaData():
         self.requester = req_dict
 
 
+    def set_last_collected(self, labels, collected=None):
+        """Set the date that data was last collected for a set of terms.
+
+        Parameters
+        ----------
+        labels : list of str
+            Labels of the terms that data was collected for.
+        collected : str, optional
+            Date of the collection, as YYYY/MM/DD. If not provided, uses the current date.
+
+        Examples
+        --------
+        Set the date of collection for a term:
+
+        >>> meta_data = MetaData()
+        >>> meta_data.set_last_collected(['frontal lobe'], '2020/01/31')
+        >>> meta_data.last_collected
+        {'frontal lobe': '2020/01/31'}
+        """
+
+        collected = collected if collected else date.today().strftime('%Y/%m/%d')
+
+        if self.last_collected is None:
+            self.last_collected = {}
+
+        for label in labels:
+            self.last_collected[label] = collected
+
+
+    def merge(self, meta_data):
+        """Merge in the meta data of another collection, such as a collection for other terms.
+
+        Parameters
+        ----------
+        meta_data : MetaData
+            Meta data of the other collection, which is assumed to have been run after this one.
+
+        Notes
+        -----
+        Counts of requests from the requesters are summed, with the start time of this
+        collection and the end time of the other. The database information is taken from
+        the other collection, logs are combined, and dates of last collection are updated.
+
+        Examples
+        --------
+        Merge the meta data of two collections:
+
+        >>> meta_data = MetaData()
+        >>> meta_data.requester = {'n_requests' : 10}
+        >>> other = MetaData()
+        >>> other.requester = {'n_requests' : 5}
+        >>> meta_data.merge(other)
+        >>> meta_data.requester['n_requests']
+        15
+        """
+
+        if self.requester is None or meta_data.requester is None:
+            self.requester = deepcopy(self.requester or meta_data.requester)
+        else:
+            for key, val in meta_data.requester.items():
+                if key[0:2] == 'n_':
+                    self.requester[key] = self.requester.get(key, 0) + val
+                elif key not in self.requester or key == 'end_time':
+                    self.requester[key] = deepcopy(val)
+
+        if meta_data.db_info is not None:
+            self.db_info = deepcopy(meta_data.db_info)
+
+        if isinstance(self.log, list) and isinstance(meta_data.log, list):
+            self.log = self.log + meta_data.log
+        elif self.log is None:
+            self.log = deepcopy(meta_data.log)
+
+        if meta_data.last_collected:
+            if self.last_collected is None:
+                self.last_collected = {}
+            self.last_collected.update(meta_data.last_collected)
+
+
     def add_db_info(self, db_info):
         """Add database information to the MetaData object.
 
@@ -0,0 +1,354 @@
+"""Class to store sets of article UIDs for search terms on disk."""
+
+import os
+import json
+from hashlib import md5
+from threading import Lock
+
+import numpy as np
+
+from lisc.utils.db import check_directory
+from lisc.utils.io import check_ext
+
+###################################################################################################
+###################################################################################################
+
+class UIDStore():
+    """A persistent store of the sets of article UIDs for search terms.
+
+    Attributes
+    ----------
+    directory : str
+        Folder in which the store is saved.
+    index : dict
+        Information on each stored set of UIDs, keyed by the search the UIDs were collected for.
+
+    Notes
+    -----
+    Sets of UIDs are keyed by the search they were collected from, such as the search URL,
+    which should include all settings that define the search, such as the database, the field
+    and any date range. Each set also records the database build it was collected from, and
+    whether it was collected across date windows, or was truncated at the maximum number of
+    UIDs that can be collected per query, which can be checked with `check`.
+
+    Each set of UIDs is stored as its own file, as a sorted, delta-encoded array, with the
+    first UID, as the base that the deltas are relative to, kept in the index.
+    Delta values are stored with the smallest unsigned integer type that can hold them,
+    such that sets of UIDs that are dense are stored more compactly.
+    Sets of UIDs are compact on disk, but are decoded to a full array of uint32 when loaded.
+    The number of UIDs per search is kept in the index, such that cardinality queries for
+    a single search do not require loading the UIDs.
+    """
+
+    def __init__(self, directory=None):
+        """Initialize a UIDStore object, loading the index of any stored sets of UIDs.
+
+        Parameters
+        ----------
+        directory : str or SCDB, optional
+            Folder or database object specifying the location of the store.
+
+        Examples
+        --------
+        Initialize a ``UIDStore`` object, using a temporary directory:
+
+        >>> from tempfile import TemporaryDirectory
+        >>> with TemporaryDirectory() as dirpath:
+        ...     store = UIDStore(dirpath)
+        """
+
+        self.directory = check_directory(directory, 'uids')
+        self.index = {}
+
+        self._lock = Lock()
+
+        if os.path.exists(self._index_path):
+            with open(self._index_path, 'r') as index_file:
+                self.index = json.load(index_file)
+
+
+    def __contains__(self, key):
+        return key in self.index
+
+
+    def __len__(self):
+        return len(self.index)
+
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+
+    @property
+    def _index_path(self):
+        """The file path of the index of the store."""
+
+        return os.path.join(self.directory, check_ext('uids_index', '.json'))
+
+
+    def add(self, key, uids, db_info=None, split=False, n_articles=None):
+        """Add the set of UIDs for a search to the store.
+
+        Parameters
+        ----------
+        key : str
+            Key for the search that the UIDs were collected for, such as the search URL.
+        uids : 1d array or list of int
+            UIDs of the articles found for the search.
+        db_info : dict, optional
+            Information about the database from which the UIDs were collected.
+        split : bool, optional, default: False
+            Whether the UIDs were collected across date windows.
+        n_articles : int, optional
+            Total number of articles found for the search, as reported by the database.
+            If greater than the number of UIDs, the set of UIDs is marked as truncated.
+            If not provided, it is taken as the number of UIDs.
+
+        Examples
+        --------
+        Add a set of UIDs to the store, using a temporary directory:
+
+        >>> from tempfile import TemporaryDirectory
+        >>> with TemporaryDirectory() as dirpath:
+        ...     store = UIDStore(dirpath)
+        ...     store.add('("frontal+lobe")', [30001234, 30001240, 30005000])
+        """
+
+        uids = np.unique(np.asarray(uids, dtype=np.uint32))
+        f_name = check_ext(md5(key.encode()).hexdigest(), '.npy')
+
+        n_articles = int(uids.size) if n_articles is None else int(n_articles)
+
+        base, deltas = encode_uids(uids)
+        np.save(os.path.join(self.directory, f_name), deltas)
+
+        with self._lock:
+            self.index[key] = {'file' : f_name, 'n_uids' : int(uids.size), 'base' : base,
+                               'n_articles' : n_articles,
+                               'dbbuild' : db_info['dbbuild'] if db_info else None,
+                               'split' : split, 'truncated' : n_articles > uids.size}
+            with open(self._index_path, 'w') as index_file:
+                json.dump(self.index, index_file)
+
+
+    def check(self, key, db_info=None, split=False):
+        """Check whether a stored set of UIDs is available and valid to use for a search.
+
+        Parameters
+        ----------
+        key : str
+            Key for the search to check for.
+        db_info : dict, optional
+            Information about the database being used.
+            If provided, sets of UIDs collected from a different database build are not valid.
+        split : bool, optional, default: False
+            Whether the search is to be split into date windows, to collect all UIDs.
+            If so, sets of UIDs that were truncated at the maximum number per query are not valid.
+
+        Returns
+        -------
+        bool
+            Whether a valid set of UIDs is available for the search.
+
+        Examples
+        --------
+        Check for a set of UIDs, collected from a different database build:
+
+        >>> from tempfile import TemporaryDirectory
+        >>> with TemporaryDirectory() as dirpath:
+        ...     store = UIDStore(dirpath)
+        ...     store.add('("frontal+lobe")', [30001234, 30001240], {'dbbuild' : 'Build-1'})
+        ...     store.check('("frontal+lobe")', {'dbbuild' : 'Build-2'})
+        False
+        """
+
+        if key not in self.index:
+            return False
+
+        info = self.index[key]
+
+        # Sets of UIDs stored without a base UID or count are from an older format, and not used
+        if 'base' not in info or 'n_articles' not in info:
+            return False
+
+        if db_info and info['dbbuild'] and db_info.get('dbbuild') != info['dbbuild']:
+            return False
+
+        if split and info.get('truncated', True):
+            return False
+
+        return True
+
+
+    def get(self, key):
+        """Get the set of UIDs for a search from the store.
+
+        Parameters
+        ----------
+        key : str
+            Key for the search to get the UIDs for.
+
+        Returns
+        -------
+        1d array of uint32
+            Sorted UIDs of the articles found for the search.
+        """
+
+        if key not in self.index:
+            raise IndexError('Requested search not available in the store.')
+
+        deltas = np.load(os.path.join(self.directory, self.index[key]['file']))
+
+        return decode_uids(self.index[key]['base'], deltas)
+
+
+    def count(self, key):
+        """Get the number of UIDs stored for a search.
+
+        Parameters
+        ----------
+        key : str
+            Key for the search to get the number of UIDs for.
+
+        Returns
+        -------
+        int
+            Number of UIDs stored for the search.
+        """
+
+        return self.index[key]['n_uids']
+
+
+    def intersection(self, key_a, key_b):
+        """Get the UIDs that are shared between two searches.
+
+        Parameters
+        ----------
+        key_a, key_b : str
+            Keys for the searches to intersect the UIDs of.
+
+        Returns
+        -------
+        1d array of uint32
+            Sorted UIDs of the articles found for both searches.
+        """
+
+        return np.intersect1d(self.get(key_a), self.get(key_b), assume_unique=True)
+
+
+    def union(self, key_a, key_b):
+        """Get the UIDs that are found for either of two searches.
+
+        Parameters
+        ----------
+        key_a, key_b : str
+            Keys for the searches to combine the UIDs of.
+
+        Returns
+        -------
+        1d array of uint32
+            Sorted UIDs of the articles found for either search.
+        """
+
+        return np.union1d(self.get(key_a), self.get(key_b))
+
+
+    def count_intersection(self, key_a, key_b):
+        """Get the number of UIDs that are shared between two searches.
+
+        Parameters
+        ----------
+        key_a, key_b : str
+            Keys for the searches to intersect the UIDs of.
+
+        Returns
+        -------
+        int
+            Number of articles found for both searches.
+        """
+
+        return int(self.intersection(key_a, key_b).size)
+
+
+    def count_union(self, key_a, key_b):
+        """Get the number of UIDs that are found for either of two searches.
+
+        Parameters
+        ----------
+        key_a, key_b : str
+            Keys for the searches to combine the UIDs of.
+
+        Returns
+        -------
+        int
+            Number of articles found for either search.
+        """
+
+        return self.count(key_a) + self.count(key_b) - self.count_intersection(key_a, key_b)
+
+
+def encode_uids(uids):
+    """Encode a sorted array of UIDs as a base UID and deltas, using the smallest type that fits.
+
+    Parameters
+    ----------
+    uids : 1d array of uint32
+        Sorted, unique UIDs.
+
+    Returns
+    -------
+    base : int or None
+        The first UID, or None if there are no UIDs.
+    deltas : 1d array of {uint8, uint16, uint32}
+        Difference between each UID after the first and the previous UID.
+
+    Examples
+    --------
+    Encode a set of UIDs:
+
+    >>> base, deltas = encode_uids(np.array([30001234, 30001240, 30001243], dtype=np.uint32))
+    >>> base, deltas
+    (30001234, array([6, 3], dtype=uint8))
+    """
+
+    base = int(uids[0]) if uids.size else None
+    deltas = np.diff(uids).astype(np.uint32)
+
+    max_delta = deltas.max() if deltas.size else 0
+    for dtype in [np.uint8, np.uint16, np.uint32]:
+        if max_delta <= np.iinfo(dtype).max:
+            return base, deltas.astype(dtype)
+
+
+def decode_uids(base, deltas):
+    """Decode a set of UIDs, from a base UID and deltas.
+
+    Parameters
+    ----------
+    base : int or None
+        The first UID, or None if there are no UIDs.
+    deltas : 1d array of {uint8, uint16, uint32}
+        Difference between each UID after the first and the previous UID.
+
+    Returns
+    -------
+    uids : 1d array of uint32
+        Sorted UIDs.
+
+    Examples
+    --------
+    Decode a set of UIDs:
+
+    >>> decode_uids(30001234, np.array([6, 3], dtype=np.uint8))
+    array([30001234, 30001240, 30001243], dtype=uint32)
+    """
+
+    if base is None:
+        return np.array([], dtype=np.uint32)
+
+    uids = np.empty(len(deltas) + 1, dtype=np.uint32)
+    uids[0] = base
+    np.cumsum(deltas, dtype=np.uint32, out=uids[1:])
+    uids[1:] += np.uint32(base)
+
+    return uids
@@ -79,7 +79,7 @@ class Counts():
         return np.any(self.counts)
 
 
-    def add_terms(self, terms, term_type='terms', directory=None, dim='A'):
+    def add_terms(self, terms, term_type='terms', directory=None, dim='A', append=False):
         """Add search terms to the object.
 
         Parameters
@@ -94,6 +94,10 @@ class Counts():
             A string or object containing a file path.
         dim : {'A', 'B'}, optional
             Which set of terms to add.
+        append : bool, optional, default: False
+            Whether to append the new term(s) to any existing terms.
+            If True, any collected data is kept, and extended with missing values
+            for the new terms, which can be collected with `update_collection`.
 
         Examples
         --------
@@ -109,11 +113,24 @@ class Counts():
         Add some exclusion words, for the second set of terms, from a list:
 
         >>> counts.add_terms(['', 'extrasensory'], term_type='exclusions', dim='B')
+
+        Append an additional term to the first set of terms:
+
+        >>> counts.add_terms([['insula']], append=True)
         """
 
-        self.terms[dim].add_terms(terms, term_type, directory)
+        # Check before adding terms, such that the terms & data are not left out of sync
+        if term_type == 'terms' and append and self.has_data and self.square and dim == 'B':
+            raise ValueError('Can not append terms to list B for square data.')
+
+        n_prior = self.terms[dim].n_terms
+        self.terms[dim].add_terms(terms, term_type, directory, append=append)
+
         if term_type == 'terms':
-            self.terms[dim].counts = np.zeros(self.terms[dim].n_terms, dtype=int)
+            if append and self.has_data:
+                self._extend_data(dim, self.terms[dim].n_terms - n_prior)
+            else:
+                self.terms[dim].counts = np.zeros(self.terms[dim].n_terms, dtype=int)
 
     def add_labels(self, terms, directory=None, dim='A'):
         """Add labels for terms to the object.
@@ -133,8 +150,10 @@ class Counts():
         self.terms[dim].add_labels(terms, directory)
 
 
-    def run_collection(self, db='pubmed', field='TIAB', api_key=None, logging=None,
-                       directory=None, verbose=False, **eutils_kwargs):
+    def run_collection(self, db='pubmed', field='TIAB', api_key=None, method='search',
+                       uid_store=None, split_dates=False, n_workers=1, checkpoint=None,
+                       resume=False, cache=None, logging=None, directory=None, verbose=False,
+                       **eutils_kwargs):
         """Collect co-occurrence data.
 
         Parameters
@@ -144,8 +163,31 @@ class Counts():
         field : str, optional, default: 'TIAB'
             Field to search for term in.
             Defaults to 'TIAB', which is Title/Abstract.
-        api_key : str, optional
-            An API key for a NCBI account.
+        api_key : str or list of str, optional
+            An API key for a NCBI account. If a list, requests are spread across the keys.
+        method : {'search', 'uids'}, optional, default: 'search'
+            Which method to use to collect the data:
+
+            * 'search': requests the count of articles for each combination of terms.
+            * 'uids': requests the UIDs of all articles for each term, and computes
+              co-occurrences locally, from the overlap of the sets of UIDs.
+        uid_store : UIDStore, optional
+            Store of sets of UIDs to load from and add to, only used if `method` is 'uids'.
+        split_dates : bool, optional, default: False
+            Whether to split the search for each term into date windows, to be able to collect
+            all UIDs for high volume terms. Only used if `method` is 'uids'.
+        n_workers : int, optional, default: 1
+            Number of workers to use to launch requests concurrently.
+        checkpoint : int, optional
+            If provided, a checkpoint of the collected data is saved every `checkpoint` requests,
+            and if the collection fails, to the 'counts' folder of `directory`.
+            Only used if `method` is 'search'.
+        resume : bool, optional, default: False
+            Whether to resume from a saved checkpoint, if available, skipping collected values.
+            Only used if `method` is 'search'.
+        cache : CountsCache, optional
+            Cache of collected counts to get counts from and add to.
+            Only used if `method` is 'search'.
         logging : {None, 'print', 'store', 'file'}, optional
             What kind of logging, if any, to do for requested URLs.
         directory : str or SCDB, optional
@@ -180,6 +222,8 @@ class Counts():
                 exclusions_a=self.terms['A'].exclusions,
                 labels_a=self.terms['A'].labels,
                 db=db, field=field, api_key=api_key,
+                method=method, uid_store=uid_store, split_dates=split_dates,
+                n_workers=n_workers, checkpoint=checkpoint, resume=resume, cache=cache,
                 logging=logging, directory=directory,
                 verbose=verbose, **eutils_kwargs)
 
@@ -196,11 +240,81 @@ class Counts():
                 exclusions_b=self.terms['B'].exclusions,
                 labels_b=self.terms['B'].labels,
                 db=db, field=field, api_key=api_key,
+                method=method, uid_store=uid_store, split_dates=split_dates,
+                n_workers=n_workers, checkpoint=checkpoint, resume=resume, cache=cache,
                 logging=logging, directory=directory,
                 verbose=verbose, **eutils_kwargs)
             self.terms['A'].counts, self.terms['B'].counts = term_counts
 
 
+    def update_collection(self, db='pubmed', field='TIAB', api_key=None, n_workers=1,
+                          logging=None, directory=None, verbose=False, **eutils_kwargs):
+        """Collect co-occurrence data for terms appended since the last collection.
+
+        Parameters
+        ----------
+        db : str, optional, default: 'pubmed'
+            Which database to access from EUtils.
+        field : str, optional, default: 'TIAB'
+            Field to search for term in.
+            Defaults to 'TIAB', which is Title/Abstract.
+        api_key : str or list of str, optional
+            An API key for a NCBI account. If a list, requests are spread across the keys.
+        n_workers : int, optional, default: 1
+            Number of workers to use to launch requests concurrently.
+        logging : {None, 'print', 'store', 'file'}, optional
+            What kind of logging, if any, to do for requested URLs.
+        directory : str or SCDB, optional
+            Folder or database object specifying the save location.
+        verbose : bool, optional, default: False
+            Whether to print out updates.
+        **eutils_kwargs
+            Additional settings for the EUtils API.
+
+        Notes
+        -----
+        Only the counts and co-occurrences of new terms, which are missing values, are
+        collected. For square data, this is the upper triangle of co-occurrences for new terms.
+        Settings should match those used for the prior collection, so that the data is consistent.
+        If there is no prior data, this runs a full collection.
+
+        Examples
+        --------
+        Append a term to a set of terms with collected data, and collect data for it:
+
+        >>> counts = Counts()
+        >>> counts.add_terms(['frontal lobe', 'temporal lobe', 'parietal lobe'])
+        >>> counts.run_collection() # doctest: +SKIP
+        >>> counts.add_terms([['occipital lobe']], append=True) # doctest: +SKIP
+        >>> counts.update_collection() # doctest: +SKIP
+        """
+
+        if not self.has_data:
+            self.run_collection(db=db, field=field, api_key=api_key, n_workers=n_workers,
+                                logging=logging, directory=directory, verbose=verbose,
+                                **eutils_kwargs)
+            return
+
+        dims = ['A'] if self.square else ['A', 'B']
+        term_counts = self.terms['A'].counts if self.square else \
+            [self.terms['A'].counts, self.terms['B'].counts]
+
+        term_kwargs = {}
+        for dim in dims:
+            for attr in ['terms', 'inclusions', 'exclusions', 'labels']:
+                term_kwargs[attr + '_' + dim.lower()] = getattr(self.terms[dim], attr)
+
+        self.counts, term_counts, self.meta_data = collect_counts(
+            **term_kwargs, db=db, field=field, api_key=api_key, n_workers=n_workers,
+            prior_data=(self.counts, term_counts), logging=logging, directory=directory,
+            verbose=verbose, **eutils_kwargs)
+
+        if self.square:
+            self.terms['A'].counts = term_counts
+        else:
+            self.terms['A'].counts, self.terms['B'].counts = term_counts
+
+
     def compute_score(self, score_type='association', dim='A', return_result=False):
         """Compute a score, such as an index or normalization, of the co-occurrence data.
 
@@ -424,3 +538,34 @@ class Counts():
 
             # Drop score data for terms without enough data
             self.score = self.score[inds['A'], inds['B']]
+
+
+    def _extend_data(self, dim, n_new):
+        """Extend collected data with missing values, for terms appended to the object.
+
+        Parameters
+        ----------
+        dim : {'A', 'B'}
+            Which set of terms was appended to.
+        n_new : int
+            The number of appended terms.
+        """
+
+        self.terms[dim].counts = np.concatenate(\
+            [self.terms[dim].counts, np.ones(n_new, dtype=int) * -1])
+
+        n_terms_a, n_terms_b = self.counts.shape
+        if self.square:
+            pad = [(0, n_new), (0, n_new)]
+        else:
+            pad = [(0, n_new), (0, 0)] if dim == 'A' else [(0, 0), (0, n_new)]
+        self.counts = np.pad(self.counts, pad, mode='constant', constant_values=-1)
+
+        # If square, set the diagonal for new terms to zero (term co-occurrence with itself)
+        if self.square:
+            new_inds = np.arange(n_terms_a, n_terms_a + n_new)
+            self.counts[new_inds, new_inds] = 0
+
+        # Any computed score is no longer valid for the extended data
+        self.score = np.zeros(0)
+        self.score_info = {}
@@ -1,7 +1,12 @@
 """Class for LISC word analysis: analyses of text data."""
 
+from datetime import date
+
 from lisc.collect import collect_words
 from lisc.objects.base import Base
+from lisc.data.articles import ARTICLE_FIELDS
+from lisc.data.lazy_articles import LazyArticles
+from lisc.data.article_store import ArticleRefs
 from lisc.objects.utils import get_max_length
 
 ###################################################################################################
@@ -12,7 +17,7 @@ class Words(Base):
 
     Attributes
     ----------
-    results : list of Articles
+    results : list of Articles or list of ArticleRefs
         Results of 'Words' data for each search term.
     labels : list of str
         Labels for each data object attached to the object.
@@ -82,8 +87,10 @@ class Words(Base):
 
 
     def run_collection(self, db='pubmed', retmax=None, field='TIAB', usehistory=False,
-                       api_key=None, save_and_clear=False, logging=None,
-                       directory=None, verbose=False, **eutils_kwargs):
+                       page_size=100, n_fetchers=1, split_dates=False, api_key=None,
+                       save_and_clear=False, n_workers=1, queue_size=10, store=None,
+                       resume=False, logging=None, directory=None, verbose=False,
+                       **eutils_kwargs):
         """Collect words data.
 
         Parameters
@@ -97,10 +104,27 @@ class Words(Base):
             Defaults to 'TIAB', which is Title/Abstract.
         usehistory : bool, optional, default: False
             Whether to use EUtils history, storing results on the EUtils server.
-        api_key : str, optional
-            An API key for a NCBI account.
+        page_size : int, optional, default: 100
+            Number of articles to fetch per request, when fetching from the history server.
+        n_fetchers : int, optional, default: 1
+            Number of pages of articles to fetch concurrently.
+        split_dates : bool, optional, default: False
+            Whether to split the search for each term into date windows, to be able to collect
+            more articles than can be collected for a single query.
+        api_key : str or list of str, optional
+            An API key for a NCBI account. If a list, requests are spread across the keys.
         save_and_clear : bool, optional, default: False
             Whether to save words data to disk per term, instead of holding in memory.
+        n_workers : int, optional, default: 1
+            Number of workers to use to parse pages of articles concurrently.
+        queue_size : int, optional, default: 10
+            Maximum number of fetched pages of articles to hold while waiting to be processed.
+        store : ArticleStore, optional
+            Store to hold article data, shared across terms, such that each article is only
+            collected once. If provided, the results for each term are references to the store.
+        resume : bool, optional, default: False
+            Whether to resume a collection that stopped partway, from a saved manifest.
+            Only used if `save_and_clear` is True, and not using a store.
         logging : {None, 'print', 'store', 'file'}, optional
             What kind of logging, if any, to do for requested URLs.
         directory : str or SCDB, optional
@@ -122,10 +146,140 @@ class Words(Base):
         self.results, self.meta_data = collect_words(self.terms, self.inclusions,
                                                      self.exclusions, self.labels,
                                                      db=db, retmax=retmax, field=field,
-                                                     usehistory=usehistory, api_key=api_key,
+                                                     usehistory=usehistory,
+                                                     page_size=page_size,
+                                                     n_fetchers=n_fetchers,
+                                                     split_dates=split_dates, api_key=api_key,
                                                      save_and_clear=save_and_clear,
-                                                     logging=logging, directory=directory,
-                                                     verbose=verbose, **eutils_kwargs)
+                                                     n_workers=n_workers,
+                                                     queue_size=queue_size, store=store,
+                                                     resume=resume, logging=logging,
+                                                     directory=directory, verbose=verbose,
+                                                     **eutils_kwargs)
+
+
+    def update_collection(self, db='pubmed', field='TIAB', api_key=None, save_and_clear=False,
+                          n_workers=1, logging=None, directory=None, verbose=False,
+                          **eutils_kwargs):
+        """Update collected words data, collecting only articles added since the last collection.
+
+        Parameters
+        ----------
+        db : str, optional, default: 'pubmed'
+            Which database to access from EUtils.
+        field : str, optional, default: 'TIAB'
+            Field(s) to search for term.
+            Defaults to 'TIAB', which is Title/Abstract.
+        api_key : str or list of str, optional
+            An API key for a NCBI account. If a list, requests are spread across the keys.
+        save_and_clear : bool, optional, default: False
+            Whether the words data was saved to disk per term, with `save_and_clear`.
+            If so, new articles are appended to the saved data, rather than to the results.
+        n_workers : int, optional, default: 1
+            Number of workers to use to parse pages of articles concurrently.
+        logging : {None, 'print', 'store', 'file'}, optional
+            What kind of logging, if any, to do for requested URLs.
+        directory : str or SCDB, optional
+            Folder or database object specifying the save location for any outputs.
+        verbose : bool, optional, default: False
+            Whether to print out updates.
+        **eutils_kwargs
+            Additional settings for the EUtils API.
+            Settings that are set by the update, which are the date settings, `retmax`
+            and `usehistory`, can not be provided.
+
+        Raises
+        ------
+        ValueError
+            If there is no previous collection, with a recorded date, for all of the terms,
+            if the results are references to articles in an article store,
+            or if any settings that are set by the update are provided.
+
+        Notes
+        -----
+        For each term, articles are searched for by the date they were added to the database
+        (`datetype='edat'`), from the date of the last collection, as recorded in the meta data,
+        to the current date. All articles found are collected, and any that were already
+        collected are dropped, such that each article is only included once.
+
+        After updating, the meta data is for the update, merged across any groups of terms
+        collected separately, with the date of the last collection set to the current date
+        for all terms.
+
+        Examples
+        --------
+        Update words data, collected with `run_collection`, with articles added since then:
+
+        >>> words.update_collection() # doctest: +SKIP
+        """
+
+        update_settings = [key for key in eutils_kwargs \
+            if key in ['datetype', 'mindate', 'maxdate', 'retmax', 'usehistory']]
+        if update_settings:
+            raise ValueError('Settings {} are set by the update - can not be provided.'.format(\
+                ', '.join(update_settings)))
+
+        last_collected = getattr(self.meta_data, 'last_collected', None) or {}
+
+        if not self.has_data or any(label not in last_collected for label in self.labels):
+            raise ValueError('No previous collection available for all terms - cannot update.')
+
+        if any(isinstance(result, ArticleRefs) for result in self.results):
+            raise ValueError('Results collected with an article store can not be updated - '
+                             'convert the results with `to_articles` first.')
+
+        # Collect new articles for groups of terms that were last collected on the same date
+        #   The meta data of each group is merged, such that it reflects the whole update
+        update_meta_data = None
+        maxdate = date.today().strftime('%Y/%m/%d')
+        for mindate in sorted(set(last_collected[label] for label in self.labels)):
+
+            inds = [ind for ind, label in enumerate(self.labels) \
+                if last_collected[label] == mindate]
+
+            results, meta_data = collect_words(_select(self.terms, inds),
+                                               _select(self.inclusions, inds),
+                                               _select(self.exclusions, inds),
+                                               _select(self.labels, inds),
+                                               db=db, retmax=None, field=field,
+                                               usehistory=True, api_key=api_key,
+                                               n_workers=n_workers, logging=logging,
+                                               directory=directory, verbose=verbose,
+                                               datetype='edat', mindate=mindate,
+                                               maxdate=maxdate, **eutils_kwargs)
+
+            for ind, new_arts in zip(inds, results):
+                self._add_update(ind, new_arts, save_and_clear, directory)
+
+            last_collected.update(meta_data.last_collected)
+
+            if update_meta_data is None:
+                update_meta_data = meta_data
+            else:
+                update_meta_data.merge(meta_data)
+
+        update_meta_data.last_collected = last_collected
+        self.meta_data = update_meta_data
+
+
+    def _add_update(self, ind, new_arts, save_and_clear, directory):
+        """Add newly collected articles to the results for a term, dropping any already collected.
+        """
+
+        if save_and_clear:
+            collected = LazyArticles(new_arts.term, directory).ids
+        else:
+            collected = self.results[ind].ids
+
+        new_arts.drop_duplicates(set(str(art_id) for art_id in collected))
+
+        if save_and_clear:
+            new_arts.open_sink(directory, append=True)
+            new_arts.write_sink()
+            new_arts.close_sink()
+        else:
+            for field in ARTICLE_FIELDS:
+                getattr(self.results[ind], field).extend(getattr(new_arts, field))
 
 
     def check_data(self):
@@ -157,3 +311,9 @@ class Words(Base):
         for ind in list(reversed(sorted(inds))):
             self.drop_term(ind)
             self.results.pop(ind)
+
+
+def _select(items, inds):
+    """Select a subset of items from a list, if the list is not empty."""
+
+    return [items[ind] for ind in inds] if items else items
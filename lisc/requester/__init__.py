@@ -1,3 +1,8 @@
 """Requester object and associated functionality."""
 
+from .cache import CountsCache
+from .limiter import RateLimiter, AdaptiveRateLimiter
 from .requester import Requester
+from .retry import RetryPolicy
+from .hedge import HedgePolicy
+from .keys import KeyPool
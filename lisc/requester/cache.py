@@ -0,0 +1,263 @@
+"""Object for caching the results of count requests on disk."""
+
+import os
+import re
+import time
+import sqlite3
+from threading import Lock
+
+from lisc.utils.db import check_directory
+from lisc.utils.io import check_ext
+
+###################################################################################################
+###################################################################################################
+
+class CountsCache():
+    """Disk-backed cache of the counts for requested URLs, tagged by database build.
+
+    Attributes
+    ----------
+    file_path : str
+        Path to the file that stores the cache.
+    max_size : int
+        Maximum number of entries to keep in the cache.
+    db_build : str or None
+        Build of the database that new and retrieved entries are tagged with.
+    n_hits : int
+        Number of requests that were answered from the cache.
+    commit_every : int
+        Number of changes to the cache after which they are committed to the cache file.
+
+    Notes
+    -----
+    Entries are keyed by the requested URL, without any API key. For EUtils searches,
+    this encodes the database, field, date settings and the search term.
+
+    Each entry is tagged with the database build it was collected from. Entries from
+    a different build than the current one are treated as missing, and are replaced
+    when the count is collected again.
+
+    When the cache has more than `max_size` entries, the least recently used entries are dropped.
+
+    To avoid writing to disk on every request, the number of entries is tracked in memory,
+    updates to when entries were last used are held in memory, and changes are committed in
+    batches. Pending changes are written when the cache is flushed or closed.
+    """
+
+    def __init__(self, directory=None, max_size=100000, db_build=None, commit_every=100):
+        """Initialize a CountsCache object, opening or creating the cache file.
+
+        Parameters
+        ----------
+        directory : str or SCDB, optional
+            Folder or database object specifying the location of the cache.
+        max_size : int, optional, default: 100000
+            Maximum number of entries to keep in the cache.
+        db_build : str, optional
+            Build of the database that entries are tagged with.
+        commit_every : int, optional, default: 100
+            Number of changes to the cache after which they are committed to the cache file.
+
+        Examples
+        --------
+        Initialize a ``CountsCache`` object, using a temporary directory:
+
+        >>> from tempfile import TemporaryDirectory
+        >>> with TemporaryDirectory() as dirpath:
+        ...     cache = CountsCache(dirpath)
+        ...     cache.close()
+        """
+
+        self.file_path = os.path.join(check_directory(directory, 'counts'),
+                                      check_ext('counts_cache', '.db'))
+        self.max_size = max_size
+        self.db_build = db_build
+        self.n_hits = 0
+        self.commit_every = commit_every
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.file_path, check_same_thread=False)
+        self._connection.execute('CREATE TABLE IF NOT EXISTS counts '
+                                 '(key TEXT PRIMARY KEY, count INTEGER, '
+                                 'db_build TEXT, last_used REAL)')
+        self._connection.commit()
+
+        self._n_entries = self._connection.execute('SELECT COUNT(*) FROM counts').fetchone()[0]
+        self._last_used = {}
+        self._n_pending = 0
+
+
+    def __len__(self):
+
+        return self._n_entries
+
+
+    def set_build(self, db_build):
+        """Set the database build that entries are tagged with.
+
+        Parameters
+        ----------
+        db_build : str
+            Build of the database, as reported by EInfo.
+        """
+
+        self.db_build = db_build
+
+
+    def get(self, url):
+        """Get the count for a URL from the cache.
+
+        Parameters
+        ----------
+        url : str
+            Requested URL.
+
+        Returns
+        -------
+        count : int or None
+            The cached count, if available for the current database build, otherwise None.
+        """
+
+        key = make_cache_key(url)
+
+        with self._lock:
+
+            row = self._connection.execute('SELECT count, db_build FROM counts WHERE key = ?',
+                                           (key,)).fetchone()
+
+            if row is None or row[1] != self.db_build:
+                return None
+
+            self._last_used[key] = time.time()
+            self.n_hits += 1
+            self._record_change()
+
+        return row[0]
+
+
+    def add(self, url, count):
+        """Add the count for a URL to the cache.
+
+        Parameters
+        ----------
+        url : str
+            Requested URL.
+        count : int
+            Count of the number of articles found at the URL.
+        """
+
+        key = make_cache_key(url)
+
+        with self._lock:
+
+            self._last_used.pop(key, None)
+            updated = self._connection.execute('UPDATE counts SET count = ?, db_build = ?, '
+                                               'last_used = ? WHERE key = ?',
+                                               (count, self.db_build, time.time(), key))
+            if not updated.rowcount:
+                self._connection.execute('INSERT INTO counts VALUES (?, ?, ?, ?)',
+                                         (key, count, self.db_build, time.time()))
+                self._n_entries += 1
+
+            self._evict()
+            self._record_change()
+
+
+    def flush(self):
+        """Write any pending changes to the cache file."""
+
+        with self._lock:
+            self._flush()
+
+
+    def clear(self):
+        """Clear all entries from the cache."""
+
+        with self._lock:
+            self._last_used = {}
+            self._connection.execute('DELETE FROM counts')
+            self._connection.commit()
+            self._n_entries = 0
+            self._n_pending = 0
+
+
+    def close(self):
+        """Close the connection to the cache file, writing any pending changes."""
+
+        self.flush()
+        self._connection.close()
+
+
+    def _record_change(self):
+        """Record a change to the cache, committing changes if there are enough pending.
+
+        Notes
+        -----
+        This method should only be called while holding the lock.
+        """
+
+        self._n_pending += 1
+        if self._n_pending >= self.commit_every:
+            self._flush()
+
+
+    def _flush(self):
+        """Write pending updates of when entries were last used, and commit all changes.
+
+        Notes
+        -----
+        This method should only be called while holding the lock.
+        """
+
+        if self._last_used:
+            self._connection.executemany('UPDATE counts SET last_used = ? WHERE key = ?',
+                                         [(used, key) for key, used in self._last_used.items()])
+            self._last_used = {}
+
+        self._connection.commit()
+        self._n_pending = 0
+
+
+    def _evict(self):
+        """Drop the least recently used entries, if the cache is over its maximum size.
+
+        Notes
+        -----
+        This method should only be called while holding the lock.
+        """
+
+        if self._n_entries > self.max_size:
+
+            # Pending updates of when entries were last used are written first, to evict by them
+            self._flush()
+            self._connection.execute('DELETE FROM counts WHERE key IN (SELECT key FROM counts '
+                                     'ORDER BY last_used ASC LIMIT ?)',
+                                     (self._n_entries - self.max_size,))
+            self._n_entries = self.max_size
+
+
+def make_cache_key(url):
+    """Make the cache key for a URL, by removing any API key.
+
+    Parameters
+    ----------
+    url : str
+        Requested URL.
+
+    Returns
+    -------
+    str
+        Key for the URL in the cache.
+
+    Examples
+    --------
+    Make the cache key for an authenticated URL:
+
+    >>> make_cache_key('https://eutils.ncbi.nlm.nih.gov/esearch.fcgi?db=pubmed&api_key=123')
+    'https://eutils.ncbi.nlm.nih.gov/esearch.fcgi?db=pubmed'
+    """
+
+    # If the API key is the first setting, the next setting, if any, takes its place after '?'
+    url = re.sub(r'\?api_key=[^&]*(&|$)', lambda match: '?' if match.group(1) else '', url)
+
+    return re.sub(r'&api_key=[^&]*', '', url)
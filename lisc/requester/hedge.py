@@ -0,0 +1,100 @@
+"""Object for defining when URL requests are hedged."""
+
+from collections import deque
+from threading import Lock
+
+import numpy as np
+
+###################################################################################################
+###################################################################################################
+
+class HedgePolicy():
+    """Policy for hedging slow requests, based on the observed latency of requests.
+
+    Attributes
+    ----------
+    quantile : float
+        Quantile of observed latencies after which a request is hedged, between 0 and 1.
+    min_samples : int
+        Minimum number of observed latencies before requests are hedged.
+    min_delay : float
+        Minimum amount of time to wait before hedging a request, in seconds.
+    latencies : collections.deque of float
+        Most recently observed latencies, in seconds.
+
+    Notes
+    -----
+    A hedged request is one for which, if no response has arrived after a latency threshold,
+    a duplicate request is sent, and whichever response arrives first is used.
+    The threshold is set as a quantile of recently observed latencies, such that
+    only the slowest requests, in the tail of the latency distribution, are hedged.
+    For example, with a quantile of 0.95, about 5% of requests are duplicated.
+    """
+
+    def __init__(self, quantile=0.95, min_samples=20, window=1000, min_delay=0.):
+        """Initialize a hedge policy object.
+
+        Parameters
+        ----------
+        quantile : float, optional, default: 0.95
+            Quantile of observed latencies after which a request is hedged, between 0 and 1.
+        min_samples : int, optional, default: 20
+            Minimum number of observed latencies before requests are hedged.
+        window : int, optional, default: 1000
+            Number of the most recently observed latencies to use.
+        min_delay : float, optional, default: 0.
+            Minimum amount of time to wait before hedging a request, in seconds.
+
+        Examples
+        --------
+        Initialize a ``HedgePolicy`` object, hedging requests slower than the 99th percentile:
+
+        >>> policy = HedgePolicy(quantile=0.99)
+        """
+
+        if not 0 < quantile < 1:
+            raise ValueError('The quantile must be between 0 and 1.')
+
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.latencies = deque(maxlen=window)
+
+        self._lock = Lock()
+
+
+    def __repr__(self):
+        return 'HedgePolicy(quantile={}, min_samples={}, window={})'.format(\
+            self.quantile, self.min_samples, self.latencies.maxlen)
+
+
+    @property
+    def threshold(self):
+        """The time after which to hedge a request, in seconds, or None if not yet available."""
+
+        with self._lock:
+            if len(self.latencies) < self.min_samples:
+                return None
+            latencies = list(self.latencies)
+
+        return max(self.min_delay, float(np.quantile(latencies, self.quantile)))
+
+
+    def add(self, latency):
+        """Add an observed latency.
+
+        Parameters
+        ----------
+        latency : float
+            Time taken for a request to complete, in seconds.
+
+        Examples
+        --------
+        Add the latency of a request that took 0.2 seconds:
+
+        >>> policy = HedgePolicy()
+        >>> policy.add(0.2)
+        """
+
+        with self._lock:
+            self.latencies.append(latency)
@@ -0,0 +1,224 @@
+"""Object for balancing URL requests across a pool of API keys."""
+
+import re
+from threading import Lock
+
+from lisc.requester.limiter import RateLimiter
+
+###################################################################################################
+###################################################################################################
+
+class KeyPool():
+    """Pool of API keys, used in rotation, with a rate limiter for each key.
+
+    Attributes
+    ----------
+    keys : list of str
+        All API keys in the pool.
+    active : list of str
+        API keys that are currently in rotation.
+    rate_limiters : dict of RateLimiter
+        Rate limiter for each API key.
+    max_failures : int
+        Number of consecutive failures after which a key is taken out of rotation.
+    failures : dict of int
+        Number of consecutive failures for each API key.
+
+    Notes
+    -----
+    Keys are used in round-robin order, with requests throttled by the rate limiter
+    for the key used, such that the rate limit of each key is respected.
+
+    A request fails for a key if the response reflects a problem with the key, which is a
+    response with a 401 or 403 status, or a 400 status with an error about the API key,
+    as returned for invalid keys. Any successful request resets the failure count for the key.
+    Other outcomes, including throttling (429), server and connection errors, are not counted,
+    as they do not reflect a problem with a specific key, and are handled by retrying requests.
+    """
+
+    def __init__(self, api_keys, rate=10., rate_limiters=None, max_failures=3):
+        """Initialize a key pool object.
+
+        Parameters
+        ----------
+        api_keys : list of str
+            API keys to use.
+        rate : float, optional, default: 10.
+            Rate at which requests are allowed for each key, in requests per second.
+        rate_limiters : list of RateLimiter, optional
+            Rate limiter to use for each key. If provided, `rate` is ignored.
+        max_failures : int, optional, default: 3
+            Number of consecutive failures after which a key is taken out of rotation.
+
+        Examples
+        --------
+        Initialize a ``KeyPool`` object, with two API keys:
+
+        >>> pool = KeyPool(['key_1', 'key_2'])
+        """
+
+        if not api_keys:
+            raise ValueError('At least one API key is required.')
+
+        if len(set(api_keys)) != len(api_keys):
+            raise ValueError('API keys in the pool must be unique.')
+
+        if rate_limiters and len(rate_limiters) != len(api_keys):
+            raise ValueError('There must be one rate limiter per API key.')
+
+        self.keys = list(api_keys)
+        self.active = list(api_keys)
+        self.rate_limiters = dict(zip(self.keys, rate_limiters)) if rate_limiters else \
+            {key : RateLimiter(rate) for key in self.keys}
+        self.max_failures = max_failures
+        self.failures = {key : 0 for key in self.keys}
+
+        self._ind = 0
+        self._lock = Lock()
+
+
+    def __repr__(self):
+        return 'KeyPool(n_keys={}, n_active={})'.format(len(self.keys), len(self.active))
+
+
+    def __len__(self):
+
+        return len(self.active)
+
+
+    @property
+    def rate(self):
+        """The combined rate at which requests are allowed across active keys."""
+
+        return sum(self.rate_limiters[key].rate for key in self.active)
+
+
+    def get_key(self):
+        """Get the next API key in rotation.
+
+        Returns
+        -------
+        key : str
+            API key to use for the next request.
+
+        Raises
+        ------
+        ValueError
+            If there are no active keys remaining.
+
+        Examples
+        --------
+        Get the next two keys from a key pool:
+
+        >>> pool = KeyPool(['key_1', 'key_2'])
+        >>> [pool.get_key(), pool.get_key()]
+        ['key_1', 'key_2']
+        """
+
+        with self._lock:
+
+            if not self.active:
+                raise ValueError('No API keys remaining in rotation - can not proceed.')
+
+            self._ind = self._ind % len(self.active)
+            key = self.active[self._ind]
+            self._ind += 1
+
+        return key
+
+
+    @staticmethod
+    def check_response(response):
+        """Check whether the response to a request reflects on the API key used.
+
+        Parameters
+        ----------
+        response : requests.models.Response or None
+            Response to the request, or None if the request failed without a response.
+
+        Returns
+        -------
+        bool or None
+            True if the request succeeded, False if it failed due to the key,
+            or None if the outcome does not reflect the key.
+        """
+
+        if response is None:
+            return None
+
+        if response.status_code < 400:
+            return True
+
+        if response.status_code in (401, 403) or \
+            (response.status_code == 400 and 'api key' in response.text.lower()):
+            return False
+
+        return None
+
+
+    def update(self, key, success=None):
+        """Update the pool with the outcome of a request made with a given key.
+
+        Parameters
+        ----------
+        key : str
+            API key used for the request.
+        success : bool or None, optional
+            Whether the request succeeded, or failed due to the key.
+            If None, the outcome does not reflect the key, and is not counted.
+
+        Examples
+        --------
+        Take a key out of rotation after it fails:
+
+        >>> pool = KeyPool(['key_1', 'key_2'], max_failures=1)
+        >>> pool.update('key_1', False)
+        >>> pool.active
+        ['key_2']
+        """
+
+        if success is None:
+            return
+
+        with self._lock:
+
+            if success:
+                self.failures[key] = 0
+
+            else:
+                self.failures[key] += 1
+                if self.failures[key] >= self.max_failures and key in self.active:
+
+                    # Keep the rotation position, such that the next key in order is used next
+                    if self.active.index(key) < self._ind:
+                        self._ind -= 1
+                    self.active.remove(key)
+
+
+def set_api_key(url, api_key):
+    """Set the API key of a URL.
+
+    Parameters
+    ----------
+    url : str
+        URL to set the API key for.
+    api_key : str
+        API key to use.
+
+    Returns
+    -------
+    str
+        URL, with the API key replaced, or added if the URL did not have one.
+
+    Examples
+    --------
+    Replace the API key of a URL:
+
+    >>> set_api_key('https://eutils.ncbi.nlm.nih.gov/esearch.fcgi?db=pubmed&api_key=1', '2')
+    'https://eutils.ncbi.nlm.nih.gov/esearch.fcgi?db=pubmed&api_key=2'
+    """
+
+    if re.search(r'[?&]api_key=', url):
+        return re.sub(r'([?&]api_key=)[^&]*', lambda match: match.group(1) + api_key, url)
+
+    return url + ('&' if '?' in url else '?') + 'api_key=' + api_key
@@ -0,0 +1,275 @@
+"""Objects for limiting the rate of URL requests."""
+
+import time
+from threading import Lock
+
+###################################################################################################
+###################################################################################################
+
+class RateLimiter():
+    """Token bucket object to limit the rate of requests, which is safe to use across threads.
+
+    Attributes
+    ----------
+    rate : float
+        Rate at which requests are allowed, in requests per second.
+        If 0, requests are not limited.
+    capacity : float
+        Maximum number of tokens that can accumulate, which sets the allowed burst of requests.
+    tokens : float
+        Number of tokens currently available.
+        Negative values reflect tokens that have been reserved by waiting requests.
+
+    Notes
+    -----
+    Each request takes a token from the bucket, which is refilled at the specified rate.
+    If no token is available, the request reserves the next one, and waits until it is due.
+    Since reservations are made while holding a lock, a single object can be shared
+    across threads, and across multiple requester objects, to enforce a shared rate limit.
+    """
+
+    def __init__(self, rate=0., capacity=1):
+        """Initialize a rate limiter object.
+
+        Parameters
+        ----------
+        rate : float, optional, default: 0.
+            Rate at which requests are allowed, in requests per second.
+            If 0, requests are not limited.
+        capacity : float, optional, default: 1
+            Maximum number of tokens that can accumulate, which sets the allowed burst.
+
+        Examples
+        --------
+        Initialize a ``RateLimiter`` object, allowing for 10 requests per second:
+
+        >>> limiter = RateLimiter(rate=10)
+        """
+
+        self.rate = float()
+        self.capacity = capacity
+        self.tokens = capacity
+
+        self._time_last = time.monotonic()
+        self._lock = Lock()
+
+        self.set_rate(rate)
+
+
+    def __repr__(self):
+        return 'RateLimiter(rate={}, capacity={})'.format(self.rate, self.capacity)
+
+
+    @property
+    def wait_time(self):
+        """The average amount of time between requests, in seconds."""
+
+        return 1 / self.rate if self.rate else 0.
+
+
+    def set_rate(self, rate):
+        """Set the rate at which requests are allowed.
+
+        Parameters
+        ----------
+        rate : float
+            Rate at which requests are allowed, in requests per second.
+            If 0, requests are not limited.
+
+        Examples
+        --------
+        Set the rate to 3 requests per second:
+
+        >>> limiter = RateLimiter()
+        >>> limiter.set_rate(3)
+        """
+
+        with self._lock:
+            self._refill()
+            self.rate = float(rate) if rate else 0.
+
+
+    def acquire(self):
+        """Take a token to launch a request, waiting until one is available if needed.
+
+        Returns
+        -------
+        wait_time : float
+            Amount of time that was waited for the token, in seconds.
+
+        Examples
+        --------
+        Acquire a token before launching a request:
+
+        >>> limiter = RateLimiter(rate=10)
+        >>> wait_time = limiter.acquire()
+        """
+
+        with self._lock:
+
+            if not self.rate:
+                return 0.
+
+            self._refill()
+            self.tokens -= 1
+            wait_time = max(0., -self.tokens / self.rate)
+
+        if wait_time:
+            time.sleep(wait_time)
+
+        return wait_time
+
+
+    def update(self, success):
+        """Update the rate limiter with the outcome of a request.
+
+        Parameters
+        ----------
+        success : bool
+            Whether the request succeeded, or was throttled or failed.
+
+        Notes
+        -----
+        This rate limiter uses a fixed rate, such that this does nothing.
+        It is defined so that all rate limiters can be updated in the same way.
+        """
+
+
+    def _refill(self):
+        """Add tokens to the bucket for the time elapsed since the last refill.
+
+        Notes
+        -----
+        This method should only be called while holding the lock.
+        """
+
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._time_last) * self.rate)
+        self._time_last = now
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Rate limiter that adapts the rate of requests to the outcome of requests.
+
+    Attributes
+    ----------
+    rate : float
+        Current rate at which requests are allowed, in requests per second.
+    min_rate, max_rate : float
+        Minimum and maximum rate of requests, in requests per second.
+    increase : float
+        Amount the rate is increased by, for each second of successful requests.
+    decrease : float
+        Factor the rate is multiplied by, when a request is throttled or fails.
+    cooldown : float
+        Minimum amount of time between decreases of the rate, in seconds.
+
+    Notes
+    -----
+    The rate is controlled with additive increase, multiplicative decrease (AIMD).
+    Each successful request increases the rate by `increase` divided by the current rate,
+    such that the rate increases by about `increase` per second while requests are successful,
+    up to `max_rate`. Each throttled or failed request multiplies the rate by `decrease`,
+    down to `min_rate`.
+
+    Since requests that are in flight when the rate is decreased were launched at the prior
+    rate, the rate is decreased at most once per `cooldown` period.
+    """
+
+    def __init__(self, rate=1., max_rate=10., min_rate=0.1, increase=1., decrease=0.5,
+                 cooldown=1., capacity=1):
+        """Initialize an adaptive rate limiter object.
+
+        Parameters
+        ----------
+        rate : float, optional, default: 1.
+            Initial rate at which requests are allowed, in requests per second.
+        max_rate : float, optional, default: 10.
+            Maximum rate of requests, in requests per second.
+        min_rate : float, optional, default: 0.1
+            Minimum rate of requests, in requests per second.
+        increase : float, optional, default: 1.
+            Amount the rate is increased by, for each second of successful requests.
+        decrease : float, optional, default: 0.5
+            Factor the rate is multiplied by, when a request is throttled or fails.
+        cooldown : float, optional, default: 1.
+            Minimum amount of time between decreases of the rate, in seconds.
+        capacity : float, optional, default: 1
+            Maximum number of tokens that can accumulate, which sets the allowed burst.
+
+        Examples
+        --------
+        Initialize an ``AdaptiveRateLimiter`` object, starting at 3 requests per second,
+        which can increase up to 10 requests per second:
+
+        >>> limiter = AdaptiveRateLimiter(rate=3, max_rate=10)
+        """
+
+        if not 0 < min_rate <= max_rate:
+            raise ValueError('The minimum rate must be positive, and less than the maximum rate.')
+
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+
+        self._time_decrease = float('-inf')
+
+        super().__init__(rate, capacity)
+
+
+    def __repr__(self):
+        return 'AdaptiveRateLimiter(rate={}, max_rate={}, min_rate={})'.format(\
+            self.rate, self.max_rate, self.min_rate)
+
+
+    def set_rate(self, rate):
+        """Set the rate at which requests are allowed, within the minimum and maximum rate.
+
+        Parameters
+        ----------
+        rate : float
+            Rate at which requests are allowed, in requests per second.
+
+        Examples
+        --------
+        Set the rate to 3 requests per second:
+
+        >>> limiter = AdaptiveRateLimiter()
+        >>> limiter.set_rate(3)
+        """
+
+        super().set_rate(min(max(rate, self.min_rate), self.max_rate))
+
+
+    def update(self, success):
+        """Update the rate of requests with the outcome of a request.
+
+        Parameters
+        ----------
+        success : bool
+            Whether the request succeeded, or was throttled or failed.
+
+        Examples
+        --------
+        Update the rate after a throttled request:
+
+        >>> limiter = AdaptiveRateLimiter(rate=4)
+        >>> limiter.update(False)
+        >>> limiter.rate
+        2.0
+        """
+
+        with self._lock:
+
+            self._refill()
+
+            if success:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+            else:
+                now = time.monotonic()
+                if now - self._time_decrease >= self.cooldown:
+                    self.rate = max(self.min_rate, self.rate * self.decrease)
+                    self._time_decrease = now
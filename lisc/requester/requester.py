@@ -3,11 +3,17 @@
 import os
 import time
 from copy import deepcopy
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from lisc.utils.db import check_directory
 from lisc.utils.io import check_ext
+from lisc.requester.keys import set_api_key
+from lisc.requester.retry import RetryPolicy
+from lisc.requester.limiter import RateLimiter
 
 ###################################################################################################
 ###################################################################################################
@@ -20,7 +26,11 @@ class Requester():
     is_active : bool
         Status of the requester, reflecting whether it is currently being used to make requests.
     n_requests : int
-        Number of requests that have been made from this object.
+        Number of requests that have been made from this object, not including retries.
+    n_retries : int
+        Number of times that requests have been retried.
+    n_hedges : int
+        Number of duplicate requests that have been sent to hedge slow requests.
     wait_time : float
         Amount of time to wait between requests, in seconds.
     start_time : str
@@ -29,13 +39,33 @@ class Requester():
         Time when request session ended.
     time_last_req : float
         Time at which last request was sent.
+    rate_limiter : RateLimiter
+        Object used to limit the rate of requests.
+        If an adaptive rate limiter, the rate is adapted to the outcome of requests.
+    retry_policy : RetryPolicy
+        Policy for retrying failed requests.
+    raise_errors : bool
+        Whether to raise an error for responses with an error status, after any retries.
+    timeout : tuple of (float, float)
+        Time to wait to connect to the server, and to wait for data from the server, in seconds.
+    hedge_policy : HedgePolicy or None
+        Policy for hedging slow requests. If None, requests are not hedged.
+    key_pool : KeyPool or None
+        Pool of API keys to spread requests across. If None, URLs are requested as given.
+    pool_size : int
+        Maximum number of pooled connections kept open per host.
+    session : requests.Session or None
+        Session used to launch requests, with pooled, persistent connections.
+        Only available while the requester is active.
     logging : {None, 'print', 'store', 'file'}
         What kind of logging, if any, to do for requested URLs.
     log : None or list or FileObject
         Log of requested URLs. Format depends on `logging`.
     """
 
-    def __init__(self, wait_time=0., logging=None, directory=None):
+    def __init__(self, wait_time=0., logging=None, directory=None, pool_size=10,
+                 rate_limiter=None, retry_policy=None, raise_errors=True, timeout=(10., 60.),
+                 hedge_policy=None, key_pool=None):
         """Initialize a requester object.
 
         Parameters
@@ -46,16 +76,65 @@ class Requester():
             What kind of logging, if any, to do for requested URLs.
         directory : SCDB or str or None, optional
             A string or object containing a file path, used for logging.
+        pool_size : int, optional, default: 10
+            Maximum number of pooled connections to keep open per host.
+        rate_limiter : RateLimiter, optional
+            Object to limit the rate of requests, which may be shared with other requesters.
+            If provided, the wait time is taken from the rate limiter, and `wait_time` is ignored.
+        retry_policy : RetryPolicy, optional
+            Policy for retrying failed requests. If not provided, the default policy is used.
+            To not retry requests, use a policy with `max_retries` set to 0.
+        raise_errors : bool, optional, default: True
+            Whether to raise an error for responses with an error status, after any retries.
+        timeout : float or tuple of (float, float), optional, default: (10., 60.)
+            Time to wait to connect to the server, and to wait for data from the server,
+            in seconds. If a single value, it is used for both. Requests that time out fail
+            with a timeout error, and can be retried.
+        hedge_policy : HedgePolicy, optional
+            Policy for hedging slow requests. If not provided, requests are not hedged.
+        key_pool : KeyPool, optional
+            Pool of API keys to spread requests across, with the API key of each requested URL
+            set to the next key in rotation. If provided, each request is throttled by the rate
+            limiter of the key it uses, rather than the rate limiter of the requester.
 
         Examples
         --------
         Initialize a ``Requester`` object, specifying a wait time of 0.1 seconds between requests:
 
         >>> requester = Requester(wait_time=0.1)
+
+        Initialize two ``Requester`` objects, that share a rate limit of 10 requests per second:
+
+        >>> from lisc.requester import RateLimiter
+        >>> limiter = RateLimiter(rate=10)
+        >>> requester_1 = Requester(rate_limiter=limiter)
+        >>> requester_2 = Requester(rate_limiter=limiter)
+
+        Initialize a ``Requester`` object, which adapts its rate of requests, up to 10 per second:
+
+        >>> from lisc.requester import AdaptiveRateLimiter
+        >>> requester = Requester(rate_limiter=AdaptiveRateLimiter(rate=3, max_rate=10))
+
+        Initialize a ``Requester`` object, that retries failed requests up to 5 times:
+
+        >>> from lisc.requester import RetryPolicy
+        >>> requester = Requester(retry_policy=RetryPolicy(max_retries=5))
+
+        Initialize a ``Requester`` object, that hedges requests slower than the 95th percentile:
+
+        >>> from lisc.requester import HedgePolicy
+        >>> requester = Requester(hedge_policy=HedgePolicy(quantile=0.95))
+
+        Initialize a ``Requester`` object, that spreads requests across two API keys:
+
+        >>> from lisc.requester import KeyPool
+        >>> requester = Requester(key_pool=KeyPool(['key_1', 'key_2']))
         """
 
         self.is_active = bool()
         self.n_requests = int()
+        self.n_retries = int()
+        self.n_hedges = int()
 
         self.wait_time = float()
 
@@ -64,8 +143,26 @@ class Requester():
 
         self.time_last_req = float()
 
-        # Set object as active
-        self.set_wait_time(wait_time)
+        self.pool_size = pool_size
+        self.session = None
+        self.timeout = tuple(timeout) if isinstance(timeout, (tuple, list)) else (timeout, timeout)
+
+        self._lock = Lock()
+
+        # Set up the policies for retrying requests & handling errors
+        self.retry_policy = retry_policy if retry_policy else RetryPolicy()
+        self.raise_errors = raise_errors
+
+        # Set up the policy for hedging requests, and the executor to launch hedged requests
+        self.hedge_policy = hedge_policy
+        self._executor = None
+
+        # Set up the pool of API keys, if provided
+        self.key_pool = key_pool
+
+        # Set up rate limiting, and set object as active
+        self.rate_limiter = rate_limiter if rate_limiter else RateLimiter()
+        self.set_wait_time(self.rate_limiter.wait_time if rate_limiter else wait_time)
         self.open()
 
         # Set up for any logging
@@ -80,12 +177,25 @@ class Requester():
         """Get the attributes of the Requester object as a dictionary."""
 
         # Copy is so that attributes aren't dropped from object itself
-        req_dict = deepcopy(self.__dict__)
-        req_dict.pop('time_last_req')
+        #   Session, rate limiter, policies, key pool & private attributes are skipped,
+        #   as they can not be copied, are not data about the requests, or hold API keys
+        req_dict = deepcopy({key : val for key, val in self.__dict__.items() \
+            if key not in ['time_last_req', 'session', 'rate_limiter', 'retry_policy',
+                           'hedge_policy', 'key_pool'] and key[0] != '_'})
 
         return req_dict
 
 
+    @property
+    def rate(self):
+        """The current rate at which requests are allowed, in requests per second.
+
+        If using a pool of API keys, this is the combined rate across all active keys.
+        """
+
+        return self.key_pool.rate if self.key_pool else self.rate_limiter.rate
+
+
     def set_wait_time(self, wait_time):
         """Set the amount of time to rest between requests.
 
@@ -94,6 +204,10 @@ class Requester():
         wait_time : float
             Time, in seconds, to wait between launching URL requests.
 
+        Notes
+        -----
+        This updates the rate of the attached rate limiter, including if it is shared.
+
         Examples
         --------
         Set the wait time to 0.1 seconds:
@@ -103,6 +217,7 @@ class Requester():
         """
 
         self.wait_time = wait_time
+        self.rate_limiter.set_rate(1 / wait_time if wait_time else 0.)
 
 
     def check(self):
@@ -110,19 +225,28 @@ class Requester():
 
         print('Requester object is active: \t', str(self.is_active))
         print('Number of requests sent: \t', str(self.n_requests))
+        print('Number of retries sent: \t', str(self.n_retries))
+        print('Number of hedges sent: \t\t', str(self.n_hedges))
+        print('Current request rate: \t\t', str(self.rate))
         print('Requester opened: \t\t', str(self.start_time))
         print('Requester closed: \t\t', str(self.end_time))
 
 
-    def throttle(self):
-        """Slow down rate of requests by waiting if a new request is initiated too soon."""
+    def throttle(self, key=None):
+        """Slow down rate of requests by waiting if a new request is initiated too soon.
+
+        Parameters
+        ----------
+        key : str, optional
+            API key from the key pool to be used for the request.
+            If provided, the request is throttled by the rate limiter for the key.
 
-        # Check how long it has been since last request was sent
-        time_since_req = time.time() - self.time_last_req
+        Notes
+        -----
+        Throttling is done by the rate limiter, such that this is safe to use across threads.
+        """
 
-        # If last request was too recent, pause
-        if time_since_req < self.wait_time:
-            self.wait(self.wait_time - time_since_req)
+        self._get_rate_limiter(key).acquire()
 
 
     @staticmethod
@@ -138,19 +262,34 @@ class Requester():
         time.sleep(wait_time)
 
 
-    def request_url(self, url):
+    def request_url(self, url, data=None):
         """Request a URL.
 
         Parameters
         ----------
         url : str
             Web address to request.
+        data : dict, optional
+            Data to send in the body of the request. If provided, the request is a POST request.
 
         Returns
         -------
         out : requests.models.Response
             Object containing the requested web page.
 
+        Raises
+        ------
+        requests.HTTPError
+            If the response has an error status, after any retries, and `raise_errors` is True.
+        requests.RequestException
+            If the request fails without a response, such as from a connection error,
+            after any retries.
+
+        Notes
+        -----
+        Failed requests are retried as defined by the retry policy. Each retry is throttled
+        by the rate limiter, after waiting for the backoff time of the retry policy.
+
         Examples
         --------
         Use a ``Requester`` object to request the LISC Github repository url:
@@ -163,29 +302,64 @@ class Requester():
         if not self.is_active:
             raise ValueError('Requester object is not active.')
 
-        # Check and throttle, if required,
-        self.throttle()
-
-        # Log and request the URL
+        # Log the URL, and request it, retrying as needed
         self._log_url(url)
-        out = requests.get(url)
+
+        n_retries = 0
+        out, error = self._send(url, data)
+        while self.retry_policy.should_retry(n_retries, out, error):
+
+            self.wait(self.retry_policy.get_wait_time(n_retries, out))
+            out, error = self._send(url, data)
+
+            n_retries += 1
+            with self._lock:
+                self.n_retries += 1
 
         # Update data on requests
-        self.time_last_req = time.time()
-        self.n_requests += 1
+        with self._lock:
+            self.time_last_req = time.time()
+            self.n_requests += 1
+
+        if error is not None:
+            raise error
+
+        if self.raise_errors:
+            out.raise_for_status()
 
         return out
 
 
     def open(self):
-        """Set the current object as active."""
+        """Set the current object as active, opening a session for requests.
+
+        Notes
+        -----
+        The session keeps connections alive and re-uses them across requests,
+        such that repeated requests to the same host do not each require a new connection.
+        """
+
+        if not self.session:
+            self.session = self._make_session(self.pool_size)
+
+        if self.hedge_policy and not self._executor:
+            self._executor = ThreadPoolExecutor(max_workers=2 * self.pool_size)
 
         self.start_time = self._get_time()
         self.is_active = True
 
 
     def close(self):
-        """Set the current object as inactive."""
+        """Set the current object as inactive, closing the session for requests."""
+
+        if self.session:
+            self.session.close()
+            self.session = None
+
+        # Any hedged requests that are still in flight are abandoned, rather than waited for
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
         self.end_time = self._get_time()
         self.is_active = False
@@ -195,6 +369,176 @@ class Requester():
             self.log.close()
 
 
+    def _send(self, url, data=None):
+        """Send a single request for a URL, throttling, hedging, and rotating API keys, as needed.
+
+        Parameters
+        ----------
+        url : str
+            Web address to request.
+        data : dict, optional
+            Data to send in the body of the request. If provided, the request is a POST request.
+
+        Returns
+        -------
+        out : requests.models.Response or None
+            Object containing the requested web page, or None if the request failed.
+        error : requests.RequestException or None
+            Error raised by the request, if it failed without a response.
+
+        Notes
+        -----
+        If using a pool of API keys, and the request fails due to the key, the request
+        is sent again with the next key in rotation, until it does not fail due to the key,
+        or no keys remain in rotation.
+        """
+
+        if not self.key_pool:
+            return self._send_with_key(url, data)
+
+        while True:
+
+            key = self.key_pool.get_key()
+            out, error = self._send_with_key(set_api_key(url, key), data, key)
+
+            key_success = self.key_pool.check_response(out)
+            self.key_pool.update(key, key_success)
+
+            if key_success is not False or not self.key_pool.active:
+                return out, error
+
+
+    def _send_with_key(self, url, data=None, key=None):
+        """Send a single request for a URL, throttling and hedging as needed.
+
+        Parameters
+        ----------
+        url : str
+            Web address to request.
+        data : dict, optional
+            Data to send in the body of the request. If provided, the request is a POST request.
+        key : str, optional
+            API key from the key pool used in the URL, which sets the rate limiter to use.
+
+        Returns
+        -------
+        out : requests.models.Response or None
+            Object containing the requested web page, or None if the request failed.
+        error : requests.RequestException or None
+            Error raised by the request, if it failed without a response.
+
+        Notes
+        -----
+        POST requests are not hedged, as they may not be safe to send more than once.
+        """
+
+        self.throttle(key)
+
+        if self.hedge_policy and not data:
+            out, error = self._send_hedged(url, key)
+        else:
+            out, error = self._get_response(url, data)
+
+        # Responses with a status that is retried reflect throttling or server errors
+        self._get_rate_limiter(key).update(error is None and \
+            out.status_code not in self.retry_policy.statuses)
+
+        return out, error
+
+
+    def _send_hedged(self, url, key=None):
+        """Send a request, sending a duplicate request if there is no response within the
+        latency threshold of the hedge policy, and using whichever response arrives first.
+
+        Parameters
+        ----------
+        url : str
+            Web address to request.
+        key : str, optional
+            API key from the key pool used in the URL, which sets the rate limiter to use.
+
+        Returns
+        -------
+        out : requests.models.Response or None
+            Object containing the requested web page, or None if the request failed.
+        error : requests.RequestException or None
+            Error raised by the request, if it failed without a response.
+        """
+
+        threshold = self.hedge_policy.threshold
+
+        futures = {self._executor.submit(self._get_response, url)}
+        if threshold is not None:
+            done, _ = wait(futures, timeout=threshold)
+            if not done:
+
+                # The duplicate request is throttled, so that hedging stays within the rate limit
+                self.throttle(key)
+                futures.add(self._executor.submit(self._get_response, url))
+                with self._lock:
+                    self.n_hedges += 1
+
+        # Use the first response without a retried status, such as throttling or server errors,
+        #   or otherwise, once all requests have finished, the last response
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            outputs = [future.result() for future in done]
+            for out, error in outputs:
+                if error is None and out.status_code not in self.retry_policy.statuses:
+                    return out, error
+
+        return outputs[-1]
+
+
+    def _get_response(self, url, data=None):
+        """Get the response for a URL, recording the latency of the request.
+
+        Parameters
+        ----------
+        url : str
+            Web address to request.
+        data : dict, optional
+            Data to send in the body of the request. If provided, the request is a POST request.
+
+        Returns
+        -------
+        out : requests.models.Response or None
+            Object containing the requested web page, or None if the request failed.
+        error : requests.RequestException or None
+            Error raised by the request, if it failed without a response.
+        """
+
+        start = time.monotonic()
+
+        try:
+            out = self.session.post(url, data=data, timeout=self.timeout) if data else \
+                self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as exc:
+            return None, exc
+
+        if self.hedge_policy:
+            self.hedge_policy.add(time.monotonic() - start)
+
+        return out, None
+
+
+    def _get_rate_limiter(self, key=None):
+        """Get the rate limiter to use for a request.
+
+        Parameters
+        ----------
+        key : str, optional
+            API key from the key pool to be used for the request.
+
+        Returns
+        -------
+        RateLimiter
+            The rate limiter for the key, if provided, or otherwise of the requester.
+        """
+
+        return self.key_pool.rate_limiters[key] if key else self.rate_limiter
+
+
     def _set_up_logging(self, logging, directory):
         """Set up for URL logging.
 
@@ -232,14 +576,40 @@ class Requester():
             URL to log.
         """
 
-        if self.logging == 'print':
-            print(url)
+        with self._lock:
+
+            if self.logging == 'print':
+                print(url)
+
+            elif self.logging == 'store':
+                self.log.append(url)
+
+            elif self.logging == 'file':
+                self.log.write('\n' + url)
+
+
+    @staticmethod
+    def _make_session(pool_size):
+        """Make a session for launching requests, with a pool of persistent connections.
+
+        Parameters
+        ----------
+        pool_size : int
+            Maximum number of pooled connections to keep open per host.
+
+        Returns
+        -------
+        session : requests.Session
+            Session object to launch requests from.
+        """
+
+        session = requests.Session()
 
-        elif self.logging == 'store':
-            self.log.append(url)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        for prefix in ['https://', 'http://']:
+            session.mount(prefix, adapter)
 
-        elif self.logging == 'file':
-            self.log.write('\n' + url)
+        return session
 
 
     @staticmethod
@@ -0,0 +1,179 @@
+"""Object for defining how failed URL requests are retried."""
+
+import time
+import random
+from email.utils import parsedate_to_datetime
+
+import requests
+
+###################################################################################################
+###################################################################################################
+
+class RetryPolicy():
+    """Policy for retrying failed requests, with jittered exponential backoff.
+
+    Attributes
+    ----------
+    max_retries : int
+        Maximum number of times to retry a request.
+    backoff : float
+        Base amount of time to wait before retrying, in seconds.
+        The maximum wait is doubled for each subsequent retry.
+    max_wait : float
+        Maximum amount of time to wait before any retry, in seconds.
+    jitter : bool
+        Whether to randomize wait times, such that concurrent requests do not retry in sync.
+    statuses : tuple of int
+        Response status codes for which requests are retried.
+
+    Notes
+    -----
+    Requests are retried if they fail with a connection error or time out, or if the
+    response has one of the specified status codes. If a response includes a 'Retry-After'
+    header, the wait time is taken from the header, up to the maximum wait time.
+
+    With jitter, the wait time before a retry is drawn uniformly from 0 up to the backoff
+    time for that retry, which is known as 'full jitter'.
+    """
+
+    def __init__(self, max_retries=3, backoff=1., max_wait=60., jitter=True,
+                 statuses=(429, 500, 502, 503, 504)):
+        """Initialize a retry policy object.
+
+        Parameters
+        ----------
+        max_retries : int, optional, default: 3
+            Maximum number of times to retry a request. If 0, requests are not retried.
+        backoff : float, optional, default: 1.
+            Base amount of time to wait before retrying, in seconds.
+        max_wait : float, optional, default: 60.
+            Maximum amount of time to wait before any retry, in seconds.
+        jitter : bool, optional, default: True
+            Whether to randomize wait times.
+        statuses : tuple of int, optional, default: (429, 500, 502, 503, 504)
+            Response status codes for which requests are retried.
+
+        Examples
+        --------
+        Initialize a ``RetryPolicy`` object, retrying up to 5 times, waiting up to 30 seconds:
+
+        >>> policy = RetryPolicy(max_retries=5, max_wait=30)
+        """
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_wait = max_wait
+        self.jitter = jitter
+        self.statuses = tuple(statuses)
+
+
+    def __repr__(self):
+        return 'RetryPolicy(max_retries={}, backoff={}, max_wait={}, jitter={})'.format(\
+            self.max_retries, self.backoff, self.max_wait, self.jitter)
+
+
+    def should_retry(self, n_retries, response=None, error=None):
+        """Check whether a request should be retried.
+
+        Parameters
+        ----------
+        n_retries : int
+            Number of times the request has already been retried.
+        response : requests.models.Response, optional
+            Response to the request, if one was received.
+        error : Exception, optional
+            Error raised by the request, if it failed without a response.
+
+        Returns
+        -------
+        bool
+            Whether the request should be retried.
+
+        Examples
+        --------
+        Check whether to retry a request that failed to connect:
+
+        >>> import requests
+        >>> policy = RetryPolicy()
+        >>> policy.should_retry(0, error=requests.ConnectionError())
+        True
+        """
+
+        if n_retries >= self.max_retries:
+            return False
+
+        if error is not None:
+            return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+        return response is not None and response.status_code in self.statuses
+
+
+    def get_wait_time(self, n_retries, response=None):
+        """Get the amount of time to wait before retrying a request.
+
+        Parameters
+        ----------
+        n_retries : int
+            Number of times the request has already been retried.
+        response : requests.models.Response, optional
+            Response to the request, if one was received.
+
+        Returns
+        -------
+        float
+            Amount of time to wait before retrying, in seconds.
+
+        Examples
+        --------
+        Get the wait time before the first retry, without jitter:
+
+        >>> policy = RetryPolicy(backoff=0.5, jitter=False)
+        >>> policy.get_wait_time(0)
+        0.5
+        """
+
+        retry_after = None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+        if retry_after is not None:
+            return min(retry_after, self.max_wait)
+
+        wait_time = min(self.backoff * 2 ** n_retries, self.max_wait)
+
+        return random.uniform(0, wait_time) if self.jitter else wait_time
+
+
+def parse_retry_after(value):
+    """Parse the value of a 'Retry-After' header, as a number of seconds to wait.
+
+    Parameters
+    ----------
+    value : str or None
+        Value of the header, as a number of seconds, or as an HTTP date.
+
+    Returns
+    -------
+    float or None
+        Number of seconds to wait, or None if the value is missing or can not be parsed.
+
+    Examples
+    --------
+    Parse a header given as a number of seconds:
+
+    >>> parse_retry_after('120')
+    120.0
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(0., float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0., parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
@@ -1,5 +1,9 @@
 """Tests for lisc.collect.counts."""
 
+import os
+
+import numpy as np
+
 from lisc.collect.counts import *
 
 ###################################################################################################
@@ -41,3 +45,151 @@ def test_collect_counts_nocooc(test_req):
         terms_a, exclusions_a=excls_a, collect_coocs=False, logging=test_req)
     assert len(counts) == len(terms_a)
     assert meta_data.requester['n_requests'] > 0
+
+def test_collect_counts_workers(test_req):
+
+    terms_a = ['language', 'memory', 'attention']
+
+    # Test co-occurence with multiple workers, checking it matches serial collection
+    cooc, counts, meta_data = collect_counts(terms_a, n_workers=3, logging=test_req)
+    assert cooc.shape == (len(terms_a), len(terms_a))
+    assert (cooc == cooc.T).all()
+    assert len(counts) == len(terms_a)
+
+    cooc_serial, counts_serial, _ = collect_counts(terms_a, n_workers=1, logging=test_req)
+    assert np.array_equal(counts, counts_serial)
+    assert np.array_equal(cooc, cooc_serial)
+
+def test_init_counts():
+
+    counts_a, counts_b, coocs = init_counts(3)
+    assert (counts_a == -1).all()
+    assert counts_b is None
+    assert coocs.shape == (3, 3)
+    assert (coocs.diagonal() == 0).all()
+
+    counts_a, counts_b, coocs = init_counts(3, 2)
+    assert len(counts_b) == 2
+    assert coocs.shape == (3, 2)
+    assert (coocs == -1).all()
+
+    counts_a, counts_b, coocs = init_counts(3, collect_coocs=False)
+    assert counts_b is None and coocs is None
+
+def test_plan_counts():
+
+    terms_a = [['language'], ['memory'], ['attention']]
+    terms_b = [['brain'], ['body']]
+
+    plan = plan_counts(terms_a)
+    assert plan.n_counts == 3
+    assert plan.inds_coocs == [(0, 1), (0, 2), (1, 2)]
+    assert plan.n_requests == 1 + 3 + 3
+
+    plan = plan_counts(terms_a, terms_b)
+    assert plan.inds_b == [0, 1]
+    assert plan.n_requests == 1 + 3 + 2 + 6
+
+    plan = plan_counts(terms_a, collect_coocs=False)
+    assert plan.n_requests == 1 + 3
+
+def test_request_plan():
+
+    counts_a, counts_b, coocs = init_counts(2, 2)
+    counts_a[0], counts_b[1], coocs[0, 0] = 10, 10, 5
+
+    plan = RequestPlan(counts_a, counts_b, coocs)
+    assert plan.inds_a == [1]
+    assert plan.inds_b == [0]
+    assert plan.inds_coocs == [(0, 1), (1, 0), (1, 1)]
+    plan.check()
+
+def test_collect_counts_uids(test_req):
+
+    terms_a = ['language', 'memory']
+    excls_a = [['protein'], ['protein']]
+    terms_b = ['brain']
+
+    # Test co-occurence computed from sets of UIDs
+    cooc, counts, meta_data = collect_counts(\
+        terms_a, exclusions_a=excls_a, terms_b=terms_b, method='uids', logging=test_req)
+    assert cooc.shape == (len(terms_a), len(terms_b))
+    assert len(counts[0]) == len(terms_a)
+    assert len(counts[1]) == len(terms_b)
+
+    # Test that counts, and co-occurrences with terms with truncated UIDs, match the search
+    cooc_search, counts_search, _ = collect_counts(\
+        terms_a, exclusions_a=excls_a, terms_b=terms_b, logging=test_req)
+    assert counts[1][0] > 10000
+    assert np.array_equal(counts[1], counts_search[1])
+    assert np.array_equal(cooc, cooc_search)
+
+    # Test co-occurence computed from sets of UIDs collected across date windows
+    cooc, counts, meta_data = collect_counts(\
+        terms_a, terms_b=terms_b, method='uids', split_dates=True,
+        mindate='2019/01', maxdate='2019/03', logging=test_req)
+    assert cooc.shape == (len(terms_a), len(terms_b))
+
+def test_counts_checkpoint(tdb, treq):
+
+    counts_a, counts_b, coocs = init_counts(2, 2)
+    counts_a[0] = 10
+    checkpoint_data = {'term_args_a' : ['a', 'b'], 'term_args_b' : ['c', 'd'],
+                       'counts_a' : counts_a, 'counts_b' : counts_b,
+                       'co_occurences' : coocs, 'requester' : {}}
+
+    save_counts_checkpoint(checkpoint_data, treq, tdb)
+    loaded = load_counts_checkpoint(tdb)
+    assert loaded['counts_a'][0] == 10
+    assert loaded['requester']['n_requests'] == treq.n_requests
+
+    os.remove(tdb.get_file_path('counts', 'counts_checkpoint.p'))
+    assert load_counts_checkpoint(tdb) is None
+
+def test_iter_counts_bounded(test_req, tcache):
+
+    urls = ['http://www.fake.com/' + str(ind) for ind in range(100)]
+    for ind, url in enumerate(urls):
+        tcache.add(url, ind)
+
+    # Test that URLs are submitted as counts are consumed, with a bounded number in flight
+    submitted = []
+    def iter_urls():
+        for url in urls:
+            submitted.append(url)
+            yield url
+
+    counts = iter_counts(test_req, iter_urls(), n_workers=2, cache=tcache)
+    assert next(counts) == 0
+    assert len(submitted) == 4
+    assert list(counts) == list(range(1, 100))
+
+def test_collect_counts_resume(tdb, test_req):
+
+    terms_a = [['language'], ['memory']]
+
+    # Save a checkpoint with some values already collected, and resume from it
+    counts_a, counts_b, coocs = init_counts(len(terms_a))
+    counts_a[0], coocs[0, 1] = 10, 5
+    term_args = ['("language")', '("memory")']
+    checkpoint_data = {'term_args_a' : term_args, 'term_args_b' : term_args,
+                       'counts_a' : counts_a, 'counts_b' : counts_b,
+                       'co_occurences' : coocs, 'requester' : {}}
+    save_counts_checkpoint(checkpoint_data, test_req, tdb)
+
+    cooc, counts, meta_data = collect_counts(terms_a, checkpoint=1, resume=True,
+                                             directory=tdb, logging=test_req)
+    assert counts[0] == 10
+    assert cooc[0, 1] == cooc[1, 0] == 5
+    assert load_counts_checkpoint(tdb) is None
+
+def test_collect_counts_cache(test_req, tcache):
+
+    terms_a = ['language', 'memory']
+    terms_b = ['brain']
+
+    # Test that a repeated collection is answered from the cache
+    cooc1, counts1, _ = collect_counts(terms_a, terms_b=terms_b, cache=tcache, logging=test_req)
+    cooc2, counts2, _ = collect_counts(terms_a, terms_b=terms_b, cache=tcache, logging=test_req)
+    assert np.array_equal(cooc1, cooc2)
+    assert tcache.n_hits == len(tcache)
@@ -0,0 +1,110 @@
+"""Tests for lisc.collect.parse."""
+
+from bs4 import BeautifulSoup
+
+from lisc.data.articles import Articles
+from lisc.collect.words import get_article_info
+
+from lisc.collect.parse import *
+
+###################################################################################################
+###################################################################################################
+
+TEST_PAGE = b"""<?xml version="1.0" ?>
+<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle//EN" "pubmed_190101.dtd">
+<PubmedArticleSet>
+<PubmedArticle>
+  <MedlineCitation Status="MEDLINE" Owner="NLM">
+    <PMID Version="1">28000963</PMID>
+    <Article PubModel="Print-Electronic">
+      <Journal>
+        <JournalIssue CitedMedium="Internet">
+          <PubDate><Year>2017</Year><Month>Feb</Month></PubDate>
+        </JournalIssue>
+        <Title>Cognitive science</Title>
+        <ISOAbbreviation>Cogn Sci</ISOAbbreviation>
+      </Journal>
+      <ArticleTitle>A Model of the <i>N400</i> &amp; P600.</ArticleTitle>
+      <Abstract>
+        <AbstractText Label="BACKGROUND">Ten years ago, <b>words</b>.</AbstractText>
+        <AbstractText Label="RESULTS">More words.</AbstractText>
+      </Abstract>
+      <AuthorList CompleteYN="Y">
+        <Author ValidYN="Y">
+          <LastName>Brouwer</LastName><ForeName>Harm</ForeName><Initials>H</Initials>
+          <AffiliationInfo><Affiliation>Saarland University.</Affiliation></AffiliationInfo>
+        </Author>
+        <Author ValidYN="Y">
+          <LastName>Crocker</LastName><ForeName>Matthew W</ForeName><Initials>MW</Initials>
+        </Author>
+      </AuthorList>
+    </Article>
+    <KeywordList Owner="NOTNLM">
+      <Keyword MajorTopicYN="N">Computational modeling</Keyword>
+      <Keyword MajorTopicYN="N">Language</Keyword>
+    </KeywordList>
+  </MedlineCitation>
+  <PubmedData>
+    <ArticleIdList>
+      <ArticleId IdType="pubmed">28000963</ArticleId>
+      <ArticleId IdType="doi">10.1111/cogs.12461</ArticleId>
+    </ArticleIdList>
+    <ReferenceList>
+      <Reference>
+        <Citation>Reference title</Citation>
+        <ArticleIdList><ArticleId IdType="pubmed">12345</ArticleId></ArticleIdList>
+      </Reference>
+    </ReferenceList>
+  </PubmedData>
+</PubmedArticle>
+<PubmedArticle>
+  <MedlineCitation Status="MEDLINE" Owner="NLM">
+    <Article>
+      <Journal>
+        <JournalIssue><PubDate><MedlineDate>Winter 1998</MedlineDate></PubDate></JournalIssue>
+        <Title>Journal title</Title>
+      </Journal>
+      <ArticleTitle>Another title.</ArticleTitle>
+    </Article>
+  </MedlineCitation>
+  <PubmedData>
+    <ArticleIdList>
+      <ArticleId IdType="pubmed">111</ArticleId>
+      <ArticleId IdType="pubmed">222</ArticleId>
+    </ArticleIdList>
+  </PubmedData>
+</PubmedArticle>
+</PubmedArticleSet>
+"""
+
+def test_iter_articles():
+
+    assert len(list(iter_articles(TEST_PAGE))) == 2
+    assert list(iter_articles(b'')) == []
+    assert list(iter_articles(b'<html><body>Not found</body></html>')) == []
+
+def test_parse_articles():
+
+    arts = parse_articles(TEST_PAGE, Articles('test'))
+    arts._check_results()
+
+    assert arts.ids == ['28000963', ['111', '222']]
+    assert arts.titles[0] == 'A Model of the N400 & P600.'
+    assert arts.authors[0][0] == ('Brouwer', 'Harm', 'H', 'Saarland University.')
+    assert arts.authors[1] is None
+    assert arts.journals == [('Cognitive science', 'Cogn Sci'), ('Journal title', None)]
+    assert arts.words == ['Ten years ago, words. More words.', '']
+    assert arts.keywords == [['Computational modeling', 'Language'], []]
+    assert arts.years == [2017, 1998]
+    assert arts.dois == ['10.1111/cogs.12461', None]
+
+def test_parse_articles_matches_bs4():
+
+    arts_lxml = parse_articles(TEST_PAGE, Articles('test'))
+
+    arts_bs4 = Articles('test')
+    for article in BeautifulSoup(TEST_PAGE, 'xml').find_all('PubmedArticle'):
+        arts_bs4 = get_article_info(arts_bs4, article)
+
+    for field in ['ids', 'titles', 'authors', 'journals', 'words', 'keywords', 'years', 'dois']:
+        assert getattr(arts_lxml, field) == getattr(arts_bs4, field)
@@ -64,3 +64,13 @@ def test_none_process():
     assert process_authors(None) is None
     assert process_pub_date(None) is None
     assert process_ids(None, 'doi') is None
+
+
+def test_extract_count():
+
+    page = b'<?xml version="1.0" encoding="UTF-8" ?>\n<eSearchResult><Count>120</Count>' \
+           b'<RetMax>0</RetMax><TranslationStack><TermSet><Count>5000</Count></TermSet>' \
+           b'</TranslationStack></eSearchResult>'
+    assert extract_count(page) == 120
+
+    assert extract_count(b'<eSearchResult><ERROR>Empty term</ERROR></eSearchResult>') == 0
@@ -0,0 +1,37 @@
+"""Tests for lisc.collect.uids."""
+
+import numpy as np
+
+from lisc.urls.eutils import EUtils
+
+from lisc.collect.uids import *
+
+###################################################################################################
+###################################################################################################
+
+def test_get_uids(test_req):
+
+    urls = EUtils(db='pubmed', field='TIAB', retmode='xml')
+    urls.build_url('search', settings=['db', 'field', 'retmode'])
+
+    uids, count = get_uids(test_req, urls, '("language")AND("memory")AND("protein")',
+                           page_size=50)
+    assert isinstance(uids, np.ndarray)
+    assert len(uids) > 50
+    assert count == len(uids)
+    assert (np.diff(uids.astype(int)) > 0).all()
+
+def test_compute_overlaps():
+
+    uids_a = [np.array([1, 2, 3]), np.array([2, 3, 4]), np.array([5])]
+    uids_b = [np.array([3, 5]), np.array([1])]
+
+    overlaps = compute_overlaps(uids_a)
+    assert overlaps.shape == (3, 3)
+    assert (overlaps == overlaps.T).all()
+    assert overlaps[0, 1] == 2
+    assert (overlaps.diagonal() == 0).all()
+
+    overlaps = compute_overlaps(uids_a, uids_b)
+    assert overlaps.shape == (3, 2)
+    assert overlaps.tolist() == [[1, 1], [1, 0], [1, 0]]
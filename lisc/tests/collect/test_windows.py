@@ -0,0 +1,31 @@
+"""Tests for lisc.collect.windows."""
+
+from datetime import date
+
+from lisc.urls.eutils import EUtils
+
+from lisc.collect.windows import *
+
+###################################################################################################
+###################################################################################################
+
+def test_get_date_windows(test_req):
+
+    urls = EUtils(db='pubmed', retmax='0', field='TIAB', retmode='xml', datetype='pdat')
+    urls.build_url('search', settings=['db', 'retmax', 'retmode', 'field', 'datetype'])
+
+    windows = get_date_windows(test_req, urls, '"language"', '2018', '2019', max_count=20000)
+    assert len(windows) > 1
+    assert windows[0]['mindate'] == '2018/01/01'
+    assert windows[-1]['maxdate'] <= '2019/12/31'
+
+def test_parse_date():
+
+    assert parse_date('2019') == date(2019, 1, 1)
+    assert parse_date('2019', end=True) == date(2019, 12, 31)
+    assert parse_date('2019/02', end=True) == date(2019, 2, 28)
+    assert parse_date('2019/02/14', end=True) == date(2019, 2, 14)
+
+def test_format_date():
+
+    assert format_date(date(2019, 2, 1)) == '2019/02/01'
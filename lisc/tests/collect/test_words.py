@@ -1,9 +1,15 @@
 """Tests for lisc.collect.words."""
 
+from py.test import raises
+
 import requests
 from bs4 import BeautifulSoup
 
+from lisc.data.term import Term
+from lisc.urls.eutils import EUtils
+from lisc.data.article_store import ArticleStore
 from lisc.collect.words import *
+from lisc.collect.words import _remove_manifest, _get_windows
 
 ###################################################################################################
 ###################################################################################################
@@ -38,6 +44,105 @@ def test_collect_words_nohistory(tdb, test_req):
     for field in ['titles', 'authors', 'ids', 'journals', 'keywords', 'words', 'years']:
         assert getattr(res[0], field) == []
 
+def test_collect_words_workers(test_req):
+
+    terms = [['science'], ['engineering']]
+    retmax = 2
+
+    # Test with multiple workers parsing pages of articles
+    res, meta_data = collect_words(terms, db='pubmed', retmax=retmax, n_workers=2,
+                                   queue_size=1, logging=test_req)
+    assert [arts.label for arts in res] == ['science', 'engineering']
+    for arts in res:
+        assert arts.n_articles == retmax
+
+def test_collect_words_paging(test_req):
+
+    terms = [['science']]
+    retmax = 5
+
+    # Test with using history, fetching small pages concurrently
+    res, meta_data = collect_words(terms, db='pubmed', retmax=retmax, usehistory=True,
+                                   page_size=2, n_fetchers=2, logging=test_req)
+    assert res[0].n_articles == retmax
+    assert len(set(res[0].ids)) == retmax
+
+    with raises(ValueError):
+        collect_words(terms, page_size=0)
+
+def test_collect_words_split_dates(test_req):
+
+    terms = [['science']]
+    retmax = 5
+
+    # Test with splitting the search into date windows
+    res, meta_data = collect_words(terms, db='pubmed', retmax=retmax, split_dates=True,
+                                   mindate='2018', maxdate='2019', logging=test_req)
+    assert res[0].n_articles == retmax
+    assert len(set(res[0].ids)) == retmax
+
+def test_get_windows():
+
+    # Test that searches are not split if all articles can be collected from a single search
+    assert _get_windows(None, None, '"science"', 5, False, None, None) == [{}]
+    assert _get_windows(None, None, '"science"', 5, True, '2018', '2019') == \
+        [{'mindate' : '2018/01/01', 'maxdate' : '2019/12/31'}]
+
+    # Test that windows are split lazily, without requests until windows are used
+    windows = _get_windows(None, None, '"science"', None, True, '2018', '2019')
+    assert not isinstance(windows, list)
+
+def test_collect_words_store(tdb, test_req):
+
+    terms = [['science'], ['science', 'engineering']]
+    retmax = 2
+
+    # Test with a shared store of articles, such that overlapping articles are stored once
+    store = ArticleStore(tdb)
+    res, meta_data = collect_words(terms, db='pubmed', retmax=retmax, store=store,
+                                   save_and_clear=True, directory=tdb, logging=test_req)
+    assert res[0].n_articles == retmax
+    assert len(store) == len(set(res[0].ids + res[1].ids))
+    assert res[0].to_articles().ids == res[0].ids
+
+def test_collect_words_resume(tdb, test_req):
+
+    terms = [['language'], ['memory']]
+
+    # Save a manifest with the first term finished, and resume from it
+    Articles(Term('language', ['language'], [], [])).save(tdb)
+    manifest = {'term_args' : ['("language")', '("memory")'],
+                'finished' : ['language'], 'current' : None}
+    save_words_manifest(manifest, tdb)
+
+    res, meta_data = collect_words(terms, retmax=2, save_and_clear=True, resume=True,
+                                   directory=tdb, logging=test_req)
+    assert meta_data['requester']['n_requests'] > 0
+    assert load_words_manifest(tdb) is None
+
+    with raises(ValueError):
+        collect_words(terms, resume=True)
+
+def test_save_load_words_manifest(tdb):
+
+    manifest = {'term_args' : ['("language")'], 'finished' : [],
+                'current' : {'label' : 'language', 'pages' : [{'id' : '1,2'}],
+                             'n_written' : 1, 'n_bytes' : 100}}
+    save_words_manifest(manifest, tdb)
+    assert load_words_manifest(tdb) == manifest
+
+    _remove_manifest(tdb)
+    assert load_words_manifest(tdb) is None
+
+def test_post_ids(test_req):
+
+    urls = EUtils(db='pubmed')
+    urls.build_url('post', settings=['db'])
+
+    web_env, query_key = post_ids(test_req, urls, ['28000963', '28000964'])
+    assert web_env
+    assert query_key
+
 def test_get_article_info():
 
     arts = Articles('test')
@@ -8,6 +8,7 @@ import pkg_resources as pkg
 
 from lisc.objects import Counts, Words
 from lisc.requester import Requester
+from lisc.requester.cache import CountsCache
 from lisc.data.meta_data import MetaData
 from lisc.core.modutils import safe_import
 from lisc.utils.db import create_file_structure
@@ -51,6 +52,16 @@ def test_req():
 def tdb():
     return TestDB()
 
+@pytest.fixture(scope='function')
+def tcache(tdb):
+    """Empty counts cache, which is closed and removed after the test."""
+
+    cache = CountsCache(tdb)
+    cache.clear()
+    yield cache
+    cache.close()
+    os.remove(cache.file_path)
+
 @pytest.fixture(scope='session')
 def tcounts():
     return Counts()
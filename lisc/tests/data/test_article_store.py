@@ -0,0 +1,66 @@
+"""Tests for lisc.data.article_store."""
+
+import pickle
+
+from py.test import raises
+
+from lisc.data.term import Term
+
+from lisc.data.article_store import *
+
+from lisc.tests.tobjs import load_arts
+
+###################################################################################################
+###################################################################################################
+
+def test_article_store(tdb):
+
+    store = ArticleStore(tdb)
+    store.clear()
+
+    # Check that overlapping articles are only stored once
+    assert store.add(load_arts(ids=['1', '2', None])) == 2
+    assert store.add(load_arts(ids=['2', '3'])) == 1
+    assert len(store) == 3
+    assert '3' in store and 3 in store
+    assert '4' not in store
+
+    assert store.get_article('2')['title'] == 'title 2'
+    with raises(KeyError):
+        store.get_article('4')
+
+    arts = store.get_articles('second', ['3', '2'])
+    assert arts.ids == ['3', '2']
+    assert arts.titles == ['title 3', 'title 2']
+
+    # Check that the store is reloaded, with and without an updated index
+    assert len(ArticleStore(tdb)) == 3
+    store.update_index()
+    assert ArticleStore(tdb).get_article(1)['title'] == 'title 1'
+
+def test_article_refs(tdb):
+
+    store = ArticleStore(tdb)
+    store.add(load_arts(ids=['5', '6']))
+
+    refs = ArticleRefs(Term('refs', ['refs'], [], []), ['6', '5'], store)
+    assert refs.n_articles == 2
+    assert [art['id'] for art in refs] == ['6', '5']
+    assert refs.to_articles().ids == ['6', '5']
+
+    refs.save(tdb)
+    loaded = ArticleRefs('refs')
+    loaded.load(tdb)
+    assert loaded.term == refs.term
+    assert loaded.to_articles().titles == ['title 6', 'title 5']
+
+def test_article_refs_pickle(tdb):
+
+    store = ArticleStore(tdb)
+    store.add(load_arts(ids=['7']))
+
+    # Check that references, with their store, can be pickled, and used once reloaded
+    refs = pickle.loads(pickle.dumps(ArticleRefs('pickle', ['7'], store)))
+    assert refs.to_articles().titles == ['title 7']
+    refs.store.add(load_arts(ids=['8']))
+    assert '8' in refs.store
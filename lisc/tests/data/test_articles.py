@@ -6,8 +6,12 @@ from py.test import raises
 
 from lisc.data.term import Term
 
+from lisc.data.index import load_index
+
 from lisc.data.articles import *
 
+from lisc.tests.tobjs import load_arts
+
 ###################################################################################################
 ###################################################################################################
 
@@ -71,3 +75,69 @@ def test_save_and_clear(tdb, tarts_full):
 
     tarts_full.save_and_clear(tdb)
     assert tarts_full.n_articles == 0
+
+def test_sink(tdb, tarts_full):
+
+    arts = Articles(Term('sink', ['search'], [], []))
+
+    # Stream two pages of articles to file, checking that data is cleared after each
+    arts.open_sink(tdb)
+    for ind in range(2):
+        for field in ARTICLE_FIELDS:
+            getattr(arts, field).extend(getattr(tarts_full, field))
+        arts.write_sink()
+        assert arts.n_articles == 0
+    arts.close_sink()
+
+    # Check that streamed data can be appended to, and loaded as saved data
+    arts.open_sink(tdb, append=True)
+    arts.close_sink()
+
+    loaded = Articles('sink')
+    loaded.load(tdb)
+    assert loaded.n_articles == 2 * tarts_full.n_articles
+    assert loaded.term == arts.term
+
+    with raises(ValueError):
+        arts.write_sink()
+
+def test_save_load_columns(tdb, tarts_full):
+
+    tarts_full.save_columns(tdb)
+
+    # Check that columnar data matches data saved & loaded from json
+    tarts_full.save(tdb)
+    expected = Articles(tarts_full.label)
+    expected.load(tdb)
+
+    for mmap in [True, False]:
+        loaded = Articles(tarts_full.label)
+        loaded.load_columns(tdb, mmap=mmap)
+        assert loaded.term == expected.term
+        assert loaded.n_articles == expected.n_articles
+        for field in ARTICLE_FIELDS:
+            assert list(getattr(loaded, field)) == getattr(expected, field)
+
+def test_save_index(tdb, tarts_full):
+
+    tarts_full.save(tdb)
+    f_path = tarts_full._get_file_path(tdb)
+
+    offsets, ids = load_index(f_path)
+    assert len(offsets) == tarts_full.n_articles + 1
+    assert offsets[-1] == os.path.getsize(f_path)
+
+def test_drop_duplicates():
+
+    arts = load_arts(add_data=True, n_data=3)
+    arts.drop_duplicates()
+    assert arts.n_articles == 1
+    assert len(arts.titles) == 1
+
+    seen = {'2'}
+    arts.add_data('ids', 2)
+    for field in ARTICLE_FIELDS[1:]:
+        arts.add_data(field, None)
+    arts.drop_duplicates(seen)
+    assert arts.ids == [1]
+    assert seen == {'1', '2'}
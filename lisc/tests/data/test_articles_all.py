@@ -2,6 +2,9 @@
 
 from lisc.data.articles_all import *
 from lisc.data.articles_all import _count_authors, _count_end_authors, _fix_author_names
+from lisc.data.article_store import ArticleStore, ArticleRefs
+
+from lisc.tests.tobjs import load_arts
 
 ###################################################################################################
 ###################################################################################################
@@ -11,6 +14,15 @@ def test_articles_all(tarts_full):
     data_all = ArticlesAll(tarts_full)
     assert data_all
 
+def test_articles_all_refs(tdb):
+
+    store = ArticleStore(tdb)
+    store.add(load_arts(ids=['11', '12']))
+
+    data_all = ArticlesAll(ArticleRefs('refs', ['11', '12'], store))
+    assert data_all.n_articles == 2
+    assert data_all.years[2112] == 2
+
 def test_check(tarts_all):
 
     tarts_all.check_frequencies(data_type='words')
@@ -0,0 +1,64 @@
+"""Tests for lisc.data.columns."""
+
+import os
+
+import numpy as np
+
+from lisc.data.columns import *
+
+###################################################################################################
+###################################################################################################
+
+def test_array_column():
+
+    column = ArrayColumn(encode_array(['1', None, '3']), str)
+
+    assert len(column) == 3
+    assert column[0] == '1'
+    assert column[1] is None
+    assert column[-1] == '3'
+    assert column[1:] == [None, '3']
+    assert list(column) == ['1', None, '3']
+
+def test_blob_column():
+
+    values = ['title', None, 'títle']
+    column = BlobColumn(*encode_blob(values))
+
+    assert len(column) == 3
+    assert column[-1] == 'títle'
+    assert list(column) == values
+
+    values = [['a', 'b'], None, [('A', 'B', None, 'D')]]
+    column = BlobColumn(*encode_blob(values, 'json'))
+
+    assert column[0] == ['a', 'b']
+    assert column[1] is None
+    assert column[2] == [['A', 'B', None, 'D']]
+
+def test_check_column_kind():
+
+    assert check_column_kind([1, None, 2]) == 'array'
+    assert check_column_kind(['1', '2']) == 'array'
+    assert check_column_kind(['01', '2']) == 'str'
+    assert check_column_kind(['title', None]) == 'str'
+    assert check_column_kind([True, False]) == 'json'
+    assert check_column_kind([['a'], 'b']) == 'json'
+
+def test_save_load_columns(tdb):
+
+    folder = os.path.join(tdb.get_folder_path('raw'), 'test_columns')
+
+    columns = {'ids' : ['1', '2'], 'years' : [2000, None],
+               'titles' : ['title', None], 'keywords' : [['a', 'b'], []]}
+
+    info = save_columns(columns, folder)
+    assert info['ids'] == {'kind' : 'array', 'dtype' : 'str'}
+    assert info['years'] == {'kind' : 'array', 'dtype' : 'int'}
+
+    for mmap in [True, False]:
+        loaded = load_columns(info, folder, mmap)
+        for name, values in columns.items():
+            assert list(loaded[name]) == values
+
+    assert isinstance(loaded['years'].array, np.ndarray)
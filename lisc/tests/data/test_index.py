@@ -0,0 +1,32 @@
+"""Tests for lisc.data.index."""
+
+import os
+
+from lisc.data.index import *
+
+###################################################################################################
+###################################################################################################
+
+def test_build_load_index(tdb, tarts_full):
+
+    tarts_full.save(tdb)
+    f_path = tarts_full._get_file_path(tdb)
+
+    index = build_index(f_path)
+    assert index['ids'] == [1] * tarts_full.n_articles
+    assert index['offsets'][-1] == os.path.getsize(f_path)
+
+    # Check that a missing index is rebuilt & saved
+    os.remove(get_index_path(f_path))
+    offsets, ids = load_index(f_path)
+    assert list(offsets) == index['offsets']
+    assert os.path.exists(get_index_path(f_path))
+
+def test_add_to_index():
+
+    index = make_index(10)
+    for art_id in ['123', None, ['456', '789'], 'doi_str']:
+        add_to_index(index, 5, art_id)
+
+    assert index['offsets'] == [10, 15, 20, 25, 30]
+    assert index['ids'] == [123, None, 456, None]
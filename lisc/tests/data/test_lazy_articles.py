@@ -0,0 +1,44 @@
+"""Tests for lisc.data.lazy_articles."""
+
+from py.test import raises
+
+from lisc.data.term import Term
+from lisc.data.articles import Articles
+
+from lisc.data.lazy_articles import *
+
+###################################################################################################
+###################################################################################################
+
+def test_lazy_articles(tdb):
+
+    arts = Articles(Term('lazy', ['search'], [], []))
+    for ind in range(3):
+        arts.add_data('ids', str(100 + ind))
+        arts.add_data('titles', 'title ' + str(ind))
+        arts.add_data('journals', ['science', 'sc'])
+        arts.add_data('authors', [['A', 'B', 'C', 'D']])
+        arts.add_data('words', 'Lots of wörds data.')
+        arts.add_data('keywords', ['lots', 'of', 'keywords'])
+        arts.add_data('years', 2112)
+        arts.add_data('dois', None)
+    arts.save(tdb)
+
+    lazy = LazyArticles('lazy', tdb)
+    assert lazy.term == arts.term
+    assert len(lazy) == lazy.n_articles == 3
+    assert list(lazy.ids) == arts.ids
+
+    expected = list(arts)
+    assert lazy[0] == expected[0]
+    assert lazy[-1] == expected[-1]
+    assert lazy[1:] == expected[1:]
+    assert list(lazy) == expected
+    assert lazy.get_article(101) == lazy.get_article('101') == expected[1]
+
+    with raises(KeyError):
+        lazy.get_article('999')
+
+    loaded = lazy.to_articles([2, 0])
+    assert loaded.ids == ['102', '100']
+    assert lazy.to_articles().titles == arts.titles
@@ -24,6 +24,14 @@ def test_meta_data_add_requester(tmetadata, treq):
     tmetadata.add_requester(treq)
     assert tmetadata.requester
 
+def test_meta_data_set_last_collected(tmetadata):
+
+    tmetadata.set_last_collected(['label'], '2020/01/31')
+    assert tmetadata.last_collected == {'label' : '2020/01/31'}
+
+    tmetadata.set_last_collected(['label', 'other'])
+    assert tmetadata.last_collected['other'][0:4] == str(datetime.now().year)
+
 def test_meta_data_add_db_info(tmetadata):
 
     tmetadata.add_db_info({'dbname' : 'name'})
@@ -43,3 +51,25 @@ def test_meta_data_as_dict(tmetadata, treq):
     tmetadata.add_requester(treq)
     mt_dict = tmetadata.as_dict()
     assert 'requester_n_requests' in mt_dict
+
+def test_meta_data_merge():
+
+    meta_data = MetaData()
+    meta_data.requester = {'n_requests' : 10, 'n_retries' : 1, 'start_time' : 'start_1',
+                           'end_time' : 'end_1'}
+    meta_data.log = ['url_1']
+    meta_data.set_last_collected(['label_1'], '2020/01/31')
+
+    other = MetaData()
+    other.requester = {'n_requests' : 5, 'n_retries' : 2, 'start_time' : 'start_2',
+                       'end_time' : 'end_2'}
+    other.db_info = {'dbbuild' : 'Build-2'}
+    other.log = ['url_2']
+    other.set_last_collected(['label_2'], '2020/02/01')
+
+    meta_data.merge(other)
+    assert meta_data.requester == {'n_requests' : 15, 'n_retries' : 3,
+                                   'start_time' : 'start_1', 'end_time' : 'end_2'}
+    assert meta_data.db_info == {'dbbuild' : 'Build-2'}
+    assert meta_data.log == ['url_1', 'url_2']
+    assert meta_data.last_collected == {'label_1' : '2020/01/31', 'label_2' : '2020/02/01'}
@@ -0,0 +1,90 @@
+"""Tests for lisc.data.uids."""
+
+import os
+
+import numpy as np
+
+from lisc.data.uids import *
+
+###################################################################################################
+###################################################################################################
+
+def test_uid_store(tdb):
+
+    store = UIDStore(tdb)
+    assert store.directory == tdb.get_folder_path('uids')
+
+def test_uid_store_add_get(tdb):
+
+    store = UIDStore(tdb)
+    store.add('term_a', [5, 3, 1, 3], {'dbbuild' : 'Build-1'})
+    store.add('term_b', [3, 5, 70000])
+
+    assert 'term_a' in store
+    assert store.count('term_a') == 3
+    assert store.index['term_a']['dbbuild'] == 'Build-1'
+    assert store['term_a'].tolist() == [1, 3, 5]
+    assert store.get('term_b').tolist() == [3, 5, 70000]
+
+    # Check that the store can be reloaded from disk
+    store = UIDStore(tdb)
+    assert len(store) == 2
+    assert store.get('term_a').tolist() == [1, 3, 5]
+
+def test_uid_store_check(tdb):
+
+    store = UIDStore(tdb)
+    store.add('term_a', [1, 3, 5], {'dbbuild' : 'Build-1'})
+    store.add('term_b', [1, 3, 5], {'dbbuild' : 'Build-1'}, n_articles=20000)
+    store.add('term_c', [1, 3, 5], split=True)
+
+    assert store.check('term_a')
+    assert store.check('term_a', {'dbbuild' : 'Build-1'})
+    assert not store.check('term_a', {'dbbuild' : 'Build-2'})
+    assert not store.check('term_d')
+
+    # Check that truncated sets are not used when splitting into date windows
+    assert store.check('term_b')
+    assert store.index['term_b']['truncated']
+    assert store.index['term_b']['n_articles'] == 20000
+    assert not store.check('term_b', split=True)
+    assert store.check('term_c', {'dbbuild' : 'Build-2'}, split=True)
+    assert store.index['term_c']['split']
+
+def test_uid_store_set_ops(tdb):
+
+    store = UIDStore(tdb)
+    store.add('term_a', [1, 3, 5])
+    store.add('term_b', [3, 5, 70000])
+
+    assert store.intersection('term_a', 'term_b').tolist() == [3, 5]
+    assert store.union('term_a', 'term_b').tolist() == [1, 3, 5, 70000]
+    assert store.count_intersection('term_a', 'term_b') == 2
+    assert store.count_union('term_a', 'term_b') == 4
+
+def test_uid_store_realistic(tdb):
+
+    # Check that sets of realistic PMIDs are stored compactly, relative to the first UID
+    store = UIDStore(tdb)
+    uids = np.array([30001234, 30001240, 30005000, 30005001])
+    store.add('term_pmids', uids)
+
+    assert store.index['term_pmids']['base'] == 30001234
+    assert (store.get('term_pmids') == uids).all()
+    assert np.load(os.path.join(store.directory, store.index['term_pmids']['file'])).dtype \
+        == np.uint16
+
+def test_encode_decode_uids():
+
+    for uids in [np.array([1, 2, 3]), np.array([1, 300, 301]), np.array([10, 100000]),
+                 np.array([30001234, 30001240, 30005000]), np.array([30001234]),
+                 np.array([], dtype=np.uint32)]:
+
+        base, deltas = encode_uids(uids.astype(np.uint32))
+        assert (decode_uids(base, deltas) == uids).all()
+
+    assert encode_uids(np.array([1, 2, 3], dtype=np.uint32))[1].dtype == np.uint8
+    assert encode_uids(np.array([1, 300, 301], dtype=np.uint32))[1].dtype == np.uint16
+    assert encode_uids(np.array([30001234, 30001240, 30005000], dtype=np.uint32))[1].dtype \
+        == np.uint16
+    assert encode_uids(np.array([], dtype=np.uint32))[0] is None
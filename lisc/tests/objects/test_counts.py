@@ -1,5 +1,8 @@
 """Tests for lisc.objects.counts."""
 
+import numpy as np
+from py.test import raises
+
 from lisc.objects.counts import Counts
 
 ###################################################################################################
@@ -40,6 +43,44 @@ def test_collect_two(test_req):
     check_funcs(counts)
     drop_data(counts)
 
+def test_add_terms_append():
+
+    counts = Counts()
+    counts.add_terms([['language'], ['memory']])
+
+    # Set some collected data, then append a term
+    counts.square = True
+    counts.counts = np.array([[0, 5], [5, 0]])
+    counts.terms['A'].counts = np.array([10, 20])
+
+    counts.add_terms([['attention']], append=True)
+    assert counts.terms['A'].n_terms == 3
+    assert counts.terms['A'].counts.tolist() == [10, 20, -1]
+    assert counts.counts.tolist() == [[0, 5, -1], [5, 0, -1], [-1, -1, 0]]
+
+    # Check that appending to list B for square data fails, without changing the terms
+    with raises(ValueError):
+        counts.add_terms([['brain']], dim='B', append=True)
+    assert counts.terms['B'].n_terms == 0
+    assert counts.counts.shape == (3, 3)
+
+    # Check that adding terms without appending resets the data
+    counts.add_terms([['language'], ['memory']])
+    assert counts.terms['A'].counts.tolist() == [0, 0]
+
+def test_update_collection(test_req):
+
+    counts = Counts()
+    counts.add_terms([['language'], ['memory']])
+    counts.add_terms([['cognition']], dim='B')
+    counts.run_collection(db='pubmed', logging=test_req)
+
+    counts.add_terms([['attention']], append=True)
+    counts.update_collection(db='pubmed', logging=test_req)
+    assert counts.counts.shape == (3, 1)
+    assert (counts.counts >= 0).all()
+    assert (counts.terms['A'].counts >= 0).all()
+
 def compute_scores(counts):
 
     for score_type in ['normalize', 'association', 'similarity']:
@@ -1,8 +1,10 @@
 """Tests for lisc.objects.words"""
 
+from datetime import datetime, timedelta
+
 from py.test import raises
 
-from lisc.data import Term, Articles
+from lisc.data import Term, Articles, LazyArticles, ArticleRefs, MetaData
 from lisc.objects.words import Words
 
 ###################################################################################################
@@ -55,6 +57,48 @@ def test_collect(test_req):
     check_funcs(words)
     drop_data(words, retmax+1)
 
+def test_update_collection(tdb):
+
+    words = Words()
+    words.add_terms(['language', 'memory'])
+
+    # Test error for updating without a previous collection
+    with raises(ValueError):
+        words.update_collection()
+
+    words.run_collection(db='pubmed', retmax=2, save_and_clear=True, directory=tdb)
+    n_articles = [LazyArticles(label, tdb).n_articles for label in words.labels]
+
+    # Test updating from a week ago, appending any new articles to the saved data
+    words.meta_data.set_last_collected(words.labels, '{:%Y/%m/%d}'.format(
+        datetime.now() - timedelta(days=7)))
+    words.update_collection(save_and_clear=True, directory=tdb)
+    for label, n_arts in zip(words.labels, n_articles):
+        ids = list(LazyArticles(label, tdb).ids)
+        assert len(ids) >= n_arts
+        assert len(set(ids)) == len(ids)
+    assert words.meta_data.last_collected['language'] == '{:%Y/%m/%d}'.format(datetime.now())
+
+def test_update_collection_refs():
+
+    words = Words()
+    words.add_results(ArticleRefs(Term('language', ['language'], [], []), ['1']))
+    words.meta_data = MetaData()
+    words.meta_data.set_last_collected(words.labels, '2020/01/01')
+
+    # Test error for updating results that are references to an article store
+    with raises(ValueError):
+        words.update_collection()
+
+def test_update_collection_settings():
+
+    words = Words()
+
+    # Test error for providing settings that are set by the update
+    for setting in [{'mindate' : '2020/01/01'}, {'datetype' : 'pdat'}, {'retmax' : 5}]:
+        with raises(ValueError):
+            words.update_collection(**setting)
+
 def check_dunders(words):
 
     for ind, result in enumerate(words):
@@ -0,0 +1,71 @@
+"""Tests for lisc.requester.cache."""
+
+from contextlib import closing
+
+from lisc.requester.cache import *
+
+###################################################################################################
+###################################################################################################
+
+TEST_URL = 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?db=pubmed&term=brain'
+
+def test_counts_cache(tdb, tcache):
+
+    assert tcache.file_path.startswith(tdb.get_folder_path('counts'))
+
+def test_counts_cache_add_get(tdb, tcache):
+
+    tcache.set_build('Build-1')
+
+    assert tcache.get(TEST_URL) is None
+    tcache.add(TEST_URL, 10)
+    assert tcache.get(TEST_URL) == 10
+    assert tcache.n_hits == 1
+    assert len(tcache) == 1
+
+    # Check that entries persist on disk, and are treated as missing for a different build
+    tcache.flush()
+    with closing(CountsCache(tdb, db_build='Build-1')) as cache:
+        assert cache.get(TEST_URL) == 10
+        cache.set_build('Build-2')
+        assert cache.get(TEST_URL) is None
+
+def test_counts_cache_flush(tdb, tcache):
+
+    tcache.commit_every = 10
+
+    # Check that changes are only committed to the cache file once flushed
+    tcache.add(TEST_URL, 10)
+    assert len(tcache) == 1
+    with closing(CountsCache(tdb)) as cache:
+        assert len(cache) == 0
+
+    tcache.flush()
+    with closing(CountsCache(tdb)) as cache:
+        assert len(cache) == 1
+
+    # Check that updating an entry does not change the number of entries
+    tcache.add(TEST_URL, 20)
+    assert len(tcache) == 1
+    assert tcache.get(TEST_URL) == 20
+
+def test_counts_cache_evict(tcache):
+
+    tcache.max_size = 2
+
+    tcache.add(TEST_URL + '1', 1)
+    tcache.add(TEST_URL + '2', 2)
+    tcache.get(TEST_URL + '1')
+    tcache.add(TEST_URL + '3', 3)
+
+    # Check that the least recently used entry is the one that was dropped
+    assert len(tcache) == 2
+    assert tcache.get(TEST_URL + '2') is None
+    assert tcache.get(TEST_URL + '1') == 1
+
+def test_make_cache_key():
+
+    assert make_cache_key(TEST_URL + '&api_key=123') == TEST_URL
+    assert make_cache_key(TEST_URL.replace('&term', '&api_key=123&term')) == TEST_URL
+    assert make_cache_key(TEST_URL.replace('?db', '?api_key=123&db')) == TEST_URL
+    assert make_cache_key('https://test.com/search?api_key=123') == 'https://test.com/search'
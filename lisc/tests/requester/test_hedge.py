@@ -0,0 +1,39 @@
+"""Tests for lisc.requester.hedge."""
+
+from pytest import raises, approx
+
+from lisc.requester.hedge import *
+
+###################################################################################################
+###################################################################################################
+
+def test_hedge_policy():
+
+    assert HedgePolicy()
+
+    with raises(ValueError):
+        HedgePolicy(quantile=1.5)
+
+def test_threshold():
+
+    policy = HedgePolicy(quantile=0.9, min_samples=10, window=100)
+
+    for latency in range(9):
+        policy.add(latency)
+    assert policy.threshold is None
+
+    for latency in range(9, 100):
+        policy.add(latency)
+    assert policy.threshold == approx(89.1)
+
+    # Check that only the most recent latencies are used
+    for ind in range(100):
+        policy.add(1.)
+    assert policy.threshold == 1.
+
+def test_threshold_min_delay():
+
+    policy = HedgePolicy(min_samples=1, min_delay=0.5)
+    policy.add(0.1)
+
+    assert policy.threshold == 0.5
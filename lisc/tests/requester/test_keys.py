@@ -0,0 +1,75 @@
+"""Tests for lisc.requester.keys."""
+
+from pytest import raises
+
+from lisc.requester.limiter import RateLimiter
+from lisc.requester.keys import *
+
+from lisc.tests.tobjs import load_response
+
+###################################################################################################
+###################################################################################################
+
+def test_key_pool():
+
+    pool = KeyPool(['key_1', 'key_2'], rate=5)
+    assert len(pool) == 2
+    assert pool.rate == 10
+
+    limiters = [RateLimiter(1), RateLimiter(2)]
+    pool = KeyPool(['key_1', 'key_2'], rate_limiters=limiters)
+    assert pool.rate_limiters['key_2'] is limiters[1]
+
+    for api_keys in [[], ['key_1', 'key_1']]:
+        with raises(ValueError):
+            KeyPool(api_keys)
+    with raises(ValueError):
+        KeyPool(['key_1', 'key_2'], rate_limiters=limiters[0:1])
+
+def test_get_key():
+
+    pool = KeyPool(['key_1', 'key_2', 'key_3'], max_failures=1)
+    assert [pool.get_key() for ind in range(4)] == ['key_1', 'key_2', 'key_3', 'key_1']
+
+    pool.update('key_2', False)
+    assert [pool.get_key() for ind in range(3)] == ['key_3', 'key_1', 'key_3']
+
+    pool.update('key_1', False)
+    pool.update('key_3', False)
+    with raises(ValueError):
+        pool.get_key()
+
+def test_check_response():
+
+    assert KeyPool.check_response(None) is None
+    assert KeyPool.check_response(load_response(200)) is True
+    assert KeyPool.check_response(load_response(403)) is False
+    assert KeyPool.check_response(load_response(400, content=b'{"error":"API key invalid"}')) is False
+    assert KeyPool.check_response(load_response(400, content=b'Bad request')) is None
+    assert KeyPool.check_response(load_response(429)) is None
+    assert KeyPool.check_response(load_response(503)) is None
+
+def test_update():
+
+    pool = KeyPool(['key_1', 'key_2'], max_failures=2)
+
+    # Check that only consecutive failures take a key out of rotation
+    pool.update('key_1', False)
+    pool.update('key_1', True)
+    pool.update('key_1', False)
+    pool.update('key_1', None)
+    assert pool.active == ['key_1', 'key_2']
+
+    pool.update('key_1', False)
+    assert pool.active == ['key_2']
+    assert pool.keys == ['key_1', 'key_2']
+
+def test_set_api_key():
+
+    url = 'https://eutils.ncbi.nlm.nih.gov/esearch.fcgi?db=pubmed&api_key=1&term=("brain")'
+    assert set_api_key(url, '22') == \
+        'https://eutils.ncbi.nlm.nih.gov/esearch.fcgi?db=pubmed&api_key=22&term=("brain")'
+
+    assert set_api_key('https://test.com/search?db=pubmed', '2') == \
+        'https://test.com/search?db=pubmed&api_key=2'
+    assert set_api_key('https://test.com/search', '2') == 'https://test.com/search?api_key=2'
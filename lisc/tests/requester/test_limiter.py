@@ -0,0 +1,106 @@
+"""Tests for lisc.requester.limiter."""
+
+import time
+from threading import Thread
+
+from pytest import raises
+
+from lisc.requester.limiter import *
+
+###################################################################################################
+###################################################################################################
+
+def test_rate_limiter():
+
+    assert RateLimiter()
+
+def test_set_rate():
+
+    limiter = RateLimiter()
+    assert limiter.wait_time == 0.
+
+    limiter.set_rate(10)
+    assert limiter.rate == 10
+    assert limiter.wait_time == 0.1
+
+def test_acquire():
+
+    # Check that with no rate set, there is no waiting
+    limiter = RateLimiter()
+    for ind in range(10):
+        assert limiter.acquire() == 0.
+
+    # Check that requests after the burst capacity are spaced by the rate
+    limiter = RateLimiter(rate=100, capacity=1)
+    start = time.monotonic()
+    for ind in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.05
+
+def test_acquire_threads():
+
+    limiter = RateLimiter(rate=100, capacity=1)
+
+    def acquire_tokens():
+        for ind in range(3):
+            limiter.acquire()
+
+    threads = [Thread(target=acquire_tokens) for ind in range(4)]
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Check that the rate limit is shared across all threads
+    assert time.monotonic() - start >= 0.11
+
+def test_update():
+
+    limiter = RateLimiter(rate=10)
+    limiter.update(False)
+    assert limiter.rate == 10
+
+def test_adaptive_rate_limiter():
+
+    assert AdaptiveRateLimiter()
+
+    with raises(ValueError):
+        AdaptiveRateLimiter(min_rate=5, max_rate=1)
+
+def test_adaptive_set_rate():
+
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=10, min_rate=1)
+
+    limiter.set_rate(20)
+    assert limiter.rate == 10
+    limiter.set_rate(0)
+    assert limiter.rate == 1
+
+def test_adaptive_update():
+
+    limiter = AdaptiveRateLimiter(rate=2, max_rate=4, min_rate=0.5, cooldown=0.)
+
+    # Check that the rate increases additively, up to the maximum rate
+    limiter.update(True)
+    assert limiter.rate == 2.5
+    for ind in range(20):
+        limiter.update(True)
+    assert limiter.rate == 4
+
+    # Check that the rate decreases multiplicatively, down to the minimum rate
+    limiter.update(False)
+    assert limiter.rate == 2
+    for ind in range(5):
+        limiter.update(False)
+    assert limiter.rate == 0.5
+
+def test_adaptive_update_cooldown():
+
+    limiter = AdaptiveRateLimiter(rate=8, max_rate=8, cooldown=10.)
+
+    # Check that successive failures only decrease the rate once within the cooldown
+    for ind in range(3):
+        limiter.update(False)
+    assert limiter.rate == 4
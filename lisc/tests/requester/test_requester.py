@@ -3,7 +3,13 @@
 import os
 import time
 
-from lisc.requester import Requester
+import requests
+from pytest import raises, approx
+
+from lisc.requester import (Requester, RateLimiter, AdaptiveRateLimiter, RetryPolicy,
+                            HedgePolicy, KeyPool)
+
+from lisc.tests.tobjs import load_response
 
 ###################################################################################################
 ###################################################################################################
@@ -73,3 +79,160 @@ def test_close(treq):
     treq.close()
 
     assert not treq.is_active
+
+def test_session(treq):
+
+    assert treq.session
+    assert treq.session.get_adapter('https://').poolmanager.connection_pool_kw['maxsize'] == \
+        treq.pool_size
+
+    treq.close()
+    assert treq.session is None
+
+    treq.open()
+    assert treq.session
+
+def test_rate_limiter():
+
+    limiter = RateLimiter(rate=10)
+    req_1 = Requester(rate_limiter=limiter)
+    req_2 = Requester(rate_limiter=limiter)
+
+    assert req_1.rate_limiter is req_2.rate_limiter
+    assert req_1.wait_time == req_2.wait_time == 0.1
+    assert 'rate_limiter' not in req_1.as_dict()
+
+class _FakeSession():
+    """Session that returns a pre-defined sequence of responses, or raises errors.
+
+    Outputs can be given as a tuple of (delay, output), to delay the response.
+    """
+
+    def __init__(self, outputs):
+        self.outputs = list(outputs)
+        self.urls = []
+
+    def get(self, url, timeout=None):
+
+        self.urls.append(url)
+        output = self.outputs.pop(0)
+        if isinstance(output, tuple):
+            time.sleep(output[0])
+            output = output[1]
+        if isinstance(output, Exception):
+            raise output
+
+        return load_response(output)
+
+    def close(self):
+        pass
+
+def test_request_url_retry():
+
+    req = Requester(retry_policy=RetryPolicy(max_retries=3, backoff=0.))
+    req.session = _FakeSession([503, requests.ConnectionError(), 429, 200])
+
+    assert req.request_url('http://www.fake.com').status_code == 200
+    assert req.n_requests == 1
+    assert req.n_retries == 3
+    assert req.as_dict()['n_retries'] == 3
+
+def test_request_url_errors():
+
+    req = Requester(retry_policy=RetryPolicy(max_retries=1, backoff=0.))
+
+    req.session = _FakeSession([503, 503])
+    with raises(requests.HTTPError):
+        req.request_url('http://www.fake.com')
+
+    req.session = _FakeSession([requests.ConnectionError(), requests.ConnectionError()])
+    with raises(requests.ConnectionError):
+        req.request_url('http://www.fake.com')
+
+    req.session = _FakeSession([404])
+    with raises(requests.HTTPError):
+        req.request_url('http://www.fake.com')
+
+    assert req.n_requests == 3
+    assert req.n_retries == 2
+
+    req.raise_errors = False
+    req.session = _FakeSession([503, 503])
+    assert req.request_url('http://www.fake.com').status_code == 503
+
+def test_request_url_adaptive():
+
+    limiter = AdaptiveRateLimiter(rate=100, max_rate=200, cooldown=0.)
+    req = Requester(rate_limiter=limiter, retry_policy=RetryPolicy(max_retries=1, backoff=0.))
+    assert req.rate == 100
+
+    req.session = _FakeSession([429, 200])
+    req.request_url('http://www.fake.com')
+    assert req.rate == approx(50 + 1 / 50)
+
+    req.session = _FakeSession([requests.ConnectionError(), 404])
+    with raises(requests.HTTPError):
+        req.request_url('http://www.fake.com')
+    assert req.rate == approx(25.01 + 1 / 25.01)
+
+def test_timeout():
+
+    assert Requester().timeout == (10., 60.)
+    assert Requester(timeout=5).timeout == (5, 5)
+
+    req = Requester(timeout=(0.001, 0.001), retry_policy=RetryPolicy(max_retries=0))
+    with raises(requests.RequestException):
+        req.request_url('http://10.255.255.1')
+
+def test_request_url_hedged():
+
+    policy = HedgePolicy(min_samples=5)
+    req = Requester(hedge_policy=policy)
+
+    # Check that requests are not hedged before enough latencies are observed
+    req.session = _FakeSession([(0.05, 200)] * 5)
+    for ind in range(5):
+        assert req.request_url('http://www.fake.com').status_code == 200
+    assert req.n_hedges == 0
+    assert len(policy.latencies) == 5
+    assert policy.threshold >= 0.05
+
+    # Check that a slow request is hedged, using the faster response
+    req.session = _FakeSession([(1., 500), (0., 200)])
+    start = time.monotonic()
+    assert req.request_url('http://www.fake.com').status_code == 200
+    assert time.monotonic() - start < 0.5
+    assert req.n_hedges == 1
+    assert req.n_requests == 6
+
+    # Check that a fast throttled response does not win over a slower successful response
+    req.session = _FakeSession([(1., 200), (0., 429)])
+    assert req.request_url('http://www.fake.com').status_code == 200
+    assert req.n_hedges == 2
+
+    req.close()
+    assert 'hedge_policy' not in req.as_dict()
+
+def test_request_url_key_pool():
+
+    pool = KeyPool(['key_1', 'key_2', 'key_3'], rate=100, max_failures=1)
+    req = Requester(key_pool=pool, retry_policy=RetryPolicy(max_retries=0))
+    assert req.rate == 300
+    assert 'key_pool' not in req.as_dict()
+
+    # Check that keys are used in rotation, and that a failing key is taken out of rotation
+    req.session = _FakeSession([200, 401, 200, 200, 200])
+    for ind in range(4):
+        req.request_url('http://www.fake.com?db=pubmed&api_key=key_1')
+
+    assert [url[-5:] for url in req.session.urls] == \
+        ['key_1', 'key_2', 'key_3', 'key_1', 'key_3']
+    assert pool.active == ['key_1', 'key_3']
+    assert req.rate == 200
+    assert req.n_requests == 4
+
+    # Check that an error is raised if all keys fail
+    req.session = _FakeSession([401, 401])
+    with raises(requests.HTTPError):
+        req.request_url('http://www.fake.com?db=pubmed&api_key=key_1')
+    assert not pool.active
@@ -0,0 +1,58 @@
+"""Tests for lisc.requester.retry."""
+
+import time
+from email.utils import formatdate
+
+import requests
+
+from lisc.requester.retry import *
+
+from lisc.tests.tobjs import load_response
+
+###################################################################################################
+###################################################################################################
+
+def test_retry_policy():
+
+    assert RetryPolicy()
+
+def test_should_retry():
+
+    policy = RetryPolicy(max_retries=2)
+
+    assert policy.should_retry(0, response=load_response(503))
+    assert policy.should_retry(1, response=load_response(429))
+    assert not policy.should_retry(2, response=load_response(503))
+    assert not policy.should_retry(0, response=load_response(200))
+    assert not policy.should_retry(0, response=load_response(404))
+
+    assert policy.should_retry(0, error=requests.ConnectionError())
+    assert policy.should_retry(0, error=requests.Timeout())
+    assert not policy.should_retry(0, error=requests.TooManyRedirects())
+
+def test_get_wait_time():
+
+    policy = RetryPolicy(backoff=0.5, max_wait=3., jitter=False)
+    assert [policy.get_wait_time(ind) for ind in range(4)] == [0.5, 1., 2., 3.]
+
+    policy = RetryPolicy(backoff=0.5, max_wait=3., jitter=True)
+    for ind in range(4):
+        assert 0. <= policy.get_wait_time(ind) <= min(0.5 * 2 ** ind, 3.)
+
+def test_get_wait_time_retry_after():
+
+    policy = RetryPolicy(backoff=0.5, max_wait=10., jitter=True)
+
+    assert policy.get_wait_time(0, load_response(429, {'Retry-After' : '2'})) == 2.
+    assert policy.get_wait_time(0, load_response(429, {'Retry-After' : '20'})) == 10.
+
+def test_parse_retry_after():
+
+    assert parse_retry_after('5') == 5.
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('not a date') is None
+
+    wait_time = parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+    assert 25 < wait_time <= 30
+
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.
@@ -3,6 +3,7 @@
 import pkg_resources as pkg
 from itertools import repeat
 
+import requests
 from bs4.element import Tag
 
 from lisc.objects.base import Base
@@ -61,16 +62,19 @@ def load_base(set_terms=False, set_clusions=False, set_labels=False, n_terms=2):
 
     return base
 
-def load_arts(add_data=False, n_data=1):
-    """Helper function to load Articles object for testing."""
+def load_arts(add_data=False, n_data=1, ids=None):
+    """Helper function to load Articles object for testing.
+
+    If `ids` are given, an article is added for each ID, titled with the ID.
+    """
 
     arts = Articles(Term('label', ['search'], ['inclusion'], ['exclusion']))
 
-    if add_data:
-        for ind in range(n_data):
+    if add_data or ids is not None:
+        for art_id in ids if ids is not None else [1] * n_data:
 
-            arts.add_data('ids', 1)
-            arts.add_data('titles', 'title')
+            arts.add_data('ids', art_id)
+            arts.add_data('titles', 'title' if ids is None else 'title ' + str(art_id))
             arts.add_data('journals', ['science', 'sc'])
             arts.add_data('authors', [('A', 'B', 'C', 'D')])
             arts.add_data('words', 'Lots of words data.')
@@ -88,6 +92,16 @@ def load_arts_all():
 
     return arts_all
 
+def load_response(status_code, headers=None, content=b''):
+    """Helper function to create a requests Response object for testing."""
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers if headers else {})
+    response._content = content
+
+    return response
+
 def repeat_data(terms, n_times):
     """Repeat a list of data, appending index number, a specified number of times.
 
@@ -39,6 +39,9 @@ def test_build_url():
     urls.build_url('fetch', settings=['db', 'retmode'])
     assert urls.utils['fetch']
 
+    urls.build_url('post', settings=['db'])
+    assert urls.utils['post']
+
 def test_get_url():
 
     urls = EUtils(db='pubmed', retmode='xml')
@@ -23,6 +23,8 @@ ESearch : Returns UIDs matching a text query, or posts to / gets from history se
     settings - db, field, term
 EFetch : Returns formatted data records for a list of UIDs.
     settings - db, id, rettype, retmode
+EPost : Uploads a list of UIDs to the history server, for use by other utilities.
+    settings - db, id
 
 Settings
 --------
@@ -126,7 +128,8 @@ class EUtils(URLs):
         utils = {'info' : 'einfo.fcgi',
                  'query' : 'egquery.fcgi',
                  'search' : 'esearch.fcgi',
-                 'fetch' : 'efetch.fcgi'}
+                 'fetch' : 'efetch.fcgi',
+                 'post' : 'epost.fcgi'}
 
         authenticated = bool(api_key)
         URLs.__init__(self, base, utils, authenticated=authenticated)
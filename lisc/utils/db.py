@@ -6,7 +6,7 @@ import os
 ###################################################################################################
 
 STRUCTURE = {1 : {'base' : ['terms', 'logs', 'data', 'figures']},
-             2 : {'data' : ['counts', 'words']},
+             2 : {'data' : ['counts', 'words', 'uids']},
              3 : {'words' : ['raw', 'summary']}}
 
 class SCDB():
@@ -38,6 +38,8 @@ class SCDB():
     +-----------+---------------+------------------+-----------------------------+
     |           |words          |Words data files. |                             |
     +-----------+---------------+------------------+-----------------------------+
+    |           |uids           |UID sets files.   |                             |
+    +-----------+---------------+------------------+-----------------------------+
     |           |               |**Level 3: Words**|                             |
     +-----------+---------------+------------------+-----------------------------+
     |           |               |raw               |Raw words data files.        |
@@ -95,6 +97,7 @@ class SCDB():
          'figures': 'lisc_db/figures',
          'counts': 'lisc_db/data/counts',
          'words': 'lisc_db/data/words',
+         'uids': 'lisc_db/data/uids',
          'raw': 'lisc_db/data/words/raw',
          'summary': 'lisc_db/data/words/summary'}
         """
@@ -271,6 +274,7 @@ def create_file_structure(base=None, name='lisc_db', structure=STRUCTURE):
     lisc_db/data/words
     lisc_db/data/words/summary
     lisc_db/data/words/raw
+    lisc_db/data/uids
     lisc_db/data/counts
     lisc_db/logs
     lisc_db/terms